@@ -1,3 +1,5 @@
+from game_log import LOG
+
 class CharacterStats:
     def __init__(self, level, base_health, base_attack):
         self.level = level
@@ -45,7 +47,7 @@ class CharacterStats:
 
     def level_up(self):
         self.level += 1
-        print(f"Ding! Reached Level {self.level}")
+        LOG.info("Ding! Reached Level %d", self.level)
         
         self.xp_to_next_level = 100 * self.level
         return True
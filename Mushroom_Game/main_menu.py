@@ -1,4 +1,8 @@
 import pygame, sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # repo root, for shared modules
+
+from text_cache import TEXT
 from maps.village import main_village
 
 pygame.init()
@@ -12,7 +16,7 @@ clock = pygame.time.Clock()
 
 def draw_text(text, y, selected=False):
     color = (255, 255, 0) if selected else (255, 255, 255)
-    text_surf = font.render(text, True, color)
+    text_surf = TEXT.render(font, text, True, color)
     rect = text_surf.get_rect(center=(WIDTH//2, y))
     screen.blit(text_surf, rect)
 
@@ -56,4 +60,6 @@ def main_menu():
         clock.tick(60)
 
 if __name__ == "__main__":
+    from asset_cache import ASSETS
+    ASSETS.use_pack()
     main_menu()
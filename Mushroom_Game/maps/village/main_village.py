@@ -1,11 +1,18 @@
 import pygame
 import sys
-import pytmx
 import os
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))  # add current dir to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))  # repo root, for shared modules
 
 from utils.ts_movement import handle_player_movement, update_animation, update_camera
 from utils import ts_debug  # !!! debug tool
+from asset_cache import ASSETS
+from tiled_collision import load_tiled_collision, CollisionIndex, object_collides  # Parsed once, cached next to the .tmx
+from animation_bank import AnimationBank
+from preloader import Preloader
+from triggers import TriggerSystem
+from text_cache import TEXT
+from game_log import LOG
 
 # Global Virable:Player Exit Point
 last_exit_position = None
@@ -15,87 +22,13 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 def get_path(*paths):
     return os.path.join(BASE_DIR, *paths)
 
-# Load tiled collision / trigger
-def load_tiled_collision(tmx_file, collision_layer_name='collision', trigger_layer_name='triggers'):
-    if pytmx is None:
-        return [], []
-
-    try:
-        tmx_data = pytmx.load_pygame(tmx_file)
-        collision_objects = []
-        trigger_objects = []
-
-        for layer in tmx_data.visible_layers:
-            if not isinstance(layer, pytmx.TiledObjectGroup):
-                continue
-
-            layer_name = layer.name.lower()
-            if layer_name not in [collision_layer_name.lower(), trigger_layer_name.lower()]:
-                continue
-
-            for obj in layer:
-                name = getattr(obj, "name", "") or "Unnamed"
-                if hasattr(obj, "points") and obj.points:
-                    points = [(px, py) for px, py in obj.points]
-                    obj_data = {"type": "polygon", "points": points, "name": name}
-                else:
-                    rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
-                    obj_data = {"type": "rect", "rect": rect, "name": name}
-
-                if layer_name == collision_layer_name.lower():
-                    collision_objects.append(obj_data)
-                elif layer_name == trigger_layer_name.lower():
-                    trigger_objects.append(obj_data)
-
-        return collision_objects, trigger_objects
-
-    except Exception as e:
-        print(f"Load Tiled file fail !!!: {e}")
-        return [], []
-
-# Polygon collision detection
-def point_in_polygon(point, polygon):
-    x, y = point
-    n = len(polygon)
-    inside = False
-    p1x, p1y = polygon[0]
-    for i in range(1, n + 1):
-        p2x, p2y = polygon[i % n]
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-        p1x, p1y = p2x, p2y
-    return inside
-
-def check_rect_polygon_collision(rect, polygon):
-    corners = [
-        (rect.left, rect.top),
-        (rect.right, rect.top),
-        (rect.left, rect.bottom),
-        (rect.right, rect.bottom)
-    ]
-    for corner in corners:
-        if point_in_polygon(corner, polygon):
-            return True
-    for point in polygon:
-        if rect.collidepoint(point):
+# Collision detection (exact rect/polygon test in geometry.py, via object_collides)
+def check_collision_with_objects(player_rect, collision_index):
+    for obj in collision_index.query_rect(player_rect):
+        if object_collides(player_rect, obj):
             return True
     return False
 
-def check_collision_with_objects(player_rect, collision_objects):
-    for obj in collision_objects:
-        if obj["type"] == "rect":
-            if player_rect.colliderect(obj["rect"]):
-                return True
-        elif obj["type"] == "polygon":
-            if check_rect_polygon_collision(player_rect, obj["points"]):
-                return True
-    return False
-
 # Shadow
 def draw_shadow(surface, player_rect, camera_x, camera_y):
     shadow_width = player_rect.width * 0.6
@@ -107,6 +40,21 @@ def draw_shadow(surface, player_rect, camera_x, camera_y):
     shadow_y = player_rect.bottom - rotated_shadow.get_height() // 0.75 - camera_y
     surface.blit(rotated_shadow, (shadow_x, shadow_y))
 
+# Player frames extraction
+def get_frames(sheet, frame_w, frame_h, SCALE):
+    frames = []
+    frame_count = sheet.get_width() // frame_w
+    for i in range(frame_count):
+        rect = pygame.Rect(i * frame_w, 0, frame_w, frame_h)
+        frame = sheet.subsurface(rect)
+        frame = pygame.transform.scale(frame, (frame_w * SCALE, frame_h * SCALE))
+        frames.append(frame)
+    return frames
+
+def load_player_frames(sheet_path, frame_w, frame_h, SCALE):
+    sheet = ASSETS.get_surface(sheet_path)
+    return get_frames(sheet, frame_w, frame_h, SCALE)
+
 def get_player_collision_box(player_rect):
     box_width = player_rect.width * 0.3
     box_height = 35
@@ -124,32 +72,46 @@ def run_village(screen, entry_position=None):
     # !!! initialization debug tool
     debug = ts_debug.DebugTool()
 
+    # Decode the scene's images behind a loading screen (instant once cached)
+    manifest = [
+        ("opaque", get_path("maps", "village", "assets", "bg_village.png")),
+        ("image", get_path("maps", "village", "assets", "village_buildings.png")),
+        ("image", r"Images\standing.png"),
+        ("image", r"Images\moving.png"),
+    ]
+    if not Preloader(manifest).run(screen):
+        pygame.quit()
+        sys.exit()
+
     # Background & buildings
-    bg = pygame.image.load(get_path("maps", "village", "assets", "bg_village.png")).convert()
+    bg = ASSETS.get_surface(get_path("maps", "village", "assets", "bg_village.png"), alpha=False)
     bg = pygame.transform.scale(bg, (MAP_W, MAP_H))
-    building_layer = pygame.image.load(get_path("maps", "village", "assets", "village_buildings.png")).convert_alpha()
+    building_layer = ASSETS.get_surface(get_path("maps", "village", "assets", "village_buildings.png"))
     building_layer = pygame.transform.scale(building_layer, (MAP_W, MAP_H))
 
     # Collision & trigger
     collision_objects, trigger_objects = load_tiled_collision(get_path("maps", "village", "assets", "village_map.tmx"))
+    collision_index = CollisionIndex(collision_objects)
 
-    # Player resources
-    standing = pygame.image.load("Images\standing.png").convert_alpha()
-    moving = pygame.image.load("Images\moving.png").convert_alpha()
-    FRAME_W, FRAME_H, SCALE = 32, 32, 4
+    # !!! Trigger zones: the door hint shows/hides on enter/exit, E only works inside
+    triggers = TriggerSystem(trigger_objects)
+    hint_font = ASSETS.get("font", pygame.font.SysFont, None, 24) # One font per process, so TEXT keeps the hint
+    hint_text = None
+
+    def show_door_hint(zone):
+        nonlocal hint_text
+        hint_text = TEXT.render(hint_font, "Press E to enter Mushroom House", True, (255,255,255))
 
-    def get_frames(sheet, frame_w, frame_h):
-        frames = []
-        frame_count = sheet.get_width() // frame_w
-        for i in range(frame_count):
-            rect = pygame.Rect(i * frame_w, 0, frame_w, frame_h)
-            frame = sheet.subsurface(rect)
-            frame = pygame.transform.scale(frame, (frame_w * SCALE, frame_h * SCALE))
-            frames.append(frame)
-        return frames
+    def hide_door_hint(zone):
+        nonlocal hint_text
+        hint_text = None
 
-    idle_frames = get_frames(standing, FRAME_W, FRAME_H)
-    move_frames = get_frames(moving, FRAME_W, FRAME_H)
+    triggers.on("mushroomhouse door", on_enter=show_door_hint, on_exit=hide_door_hint)
+
+    # Player resources (decoded once per process, reused on every scene entry)
+    FRAME_W, FRAME_H, SCALE = 32, 32, 4
+    idle_frames = AnimationBank(ASSETS.get("sheet", load_player_frames, r"Images\standing.png", FRAME_W, FRAME_H, SCALE))
+    move_frames = AnimationBank(ASSETS.get("sheet", load_player_frames, r"Images\moving.png", FRAME_W, FRAME_H, SCALE))
 
     # !!! Player initial position
     start_pos = entry_position or last_exit_position or (1200, 1000)
@@ -173,6 +135,12 @@ def run_village(screen, entry_position=None):
                     return
                 elif event.key == pygame.K_F1:
                     debug.toggle()
+                elif event.key == pygame.K_e and triggers.is_active("mushroomhouse door"):
+                    # !!! mushroom house entrance
+                    from mushroom_house.mushroom_house import run_mushroom_house
+                    current_pos = (player_rect.centerx, player_rect.centery)
+                    LOG.info("Entering Mushroom House，last position is: %s", current_pos)
+                    run_mushroom_house(screen, entry_position=(450, 535), last_exit_position=current_pos)
 
         keys = pygame.key.get_pressed()
 
@@ -181,7 +149,7 @@ def run_village(screen, entry_position=None):
             player_rect, keys, speed,
             check_collision_with_objects,
             get_player_collision_box,
-            collision_objects,
+            collision_index,
             facing_right
         )
 
@@ -217,27 +185,9 @@ def run_village(screen, entry_position=None):
             camera_y=camera_y
         )
 
-        # !!! player trigger detection
-        player_box = get_player_collision_box(player_rect)
-
-
-        # !!! mushroom house entrance
-        for obj in trigger_objects:
-            if obj.get("name","").lower() == "mushroomhouse door":
-                collision = False
-                if obj["type"] == "rect":
-                    collision = player_box.colliderect(obj["rect"])
-                elif obj["type"] == "polygon":
-                    collision = check_rect_polygon_collision(player_box, obj["points"])
-                
-                if collision:
-                    hint_text = pygame.font.SysFont(None,24).render("Press E to enter Mushroom House", True, (255,255,255))
-                    screen.blit(hint_text, (WIDTH//2 - 160, HEIGHT - 60))
-                    
-                    if keys[pygame.K_e]:
-                        from mushroom_house.mushroom_house import run_mushroom_house
-                        current_pos = (player_rect.centerx, player_rect.centery)
-                        print(f"Entering Mushroom House，last position is: {current_pos}")
-                        run_mushroom_house(screen, entry_position=(450, 535), last_exit_position=current_pos)
+        # !!! player trigger detection (fires the door hint handlers on enter / exit)
+        triggers.update(get_player_collision_box(player_rect))
+        if hint_text is not None:
+            screen.blit(hint_text, (WIDTH//2 - 160, HEIGHT - 60))
 
         pygame.display.flip()
@@ -1,49 +1,20 @@
 import pygame
 import sys
-import pytmx
 import os
 
 from utils.ts_movement import handle_player_movement, update_animation, update_camera
 from utils import ts_debug  # !!! debug tool
+from asset_cache import ASSETS
+from tiled_collision import load_tiled_collision, CollisionIndex, object_collides  # Parsed once, cached next to the .tmx
+from animation_bank import AnimationBank
+from preloader import Preloader
+from triggers import TriggerSystem
 
 # resouces path
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 def get_path(*paths):
     return os.path.join(BASE_DIR, *paths)
 
-# Loading Tiled collision / trigger
-def load_tiled_collision_local(tmx_file, collision_layer_name='collision', trigger_layer_name='triggers'):
-    try:
-        tmx_data = pytmx.load_pygame(tmx_file)
-    except Exception as e:
-        print("Failed to load tmx:", e)
-        return [], []
-
-    collision_objects, trigger_objects = [], []
-
-    for layer in tmx_data.visible_layers:
-        if not isinstance(layer, pytmx.TiledObjectGroup):
-            continue
-        layer_name = layer.name.lower()
-        if layer_name not in (collision_layer_name.lower(), trigger_layer_name.lower()):
-            continue
-
-        for obj in layer:
-            name = getattr(obj, "name", "") or "Unnamed"
-            if hasattr(obj, "points") and obj.points:
-                points = [(px, py) for px, py in obj.points]
-                obj_data = {"type": "polygon", "points": points, "name": name}
-            else:
-                rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
-                obj_data = {"type": "rect", "rect": rect, "name": name}
-
-            if layer_name == collision_layer_name.lower():
-                collision_objects.append(obj_data)
-            else:
-                trigger_objects.append(obj_data)
-
-    return collision_objects, trigger_objects
-
 # Drawing Shadow
 def draw_shadow_round(surface, player_rect, camera_x, camera_y):
     shadow_width = player_rect.width * 0.5
@@ -65,6 +36,10 @@ def get_frames(sheet, frame_w, frame_h, SCALE):
         frames.append(frame)
     return frames
 
+def load_player_frames(sheet_path, frame_w, frame_h, SCALE):
+    sheet = ASSETS.get_surface(sheet_path)
+    return get_frames(sheet, frame_w, frame_h, SCALE)
+
 # Player hitbox (foot area)
 def get_player_collision_box(player_rect):
     box_width = player_rect.width * 0.3
@@ -73,39 +48,6 @@ def get_player_collision_box(player_rect):
     box_y = player_rect.bottom - box_height - 30
     return pygame.Rect(box_x, box_y, box_width, box_height)
 
-# Polygon and rectangle collision
-def point_in_polygon(point, polygon):
-    x, y = point
-    n = len(polygon)
-    inside = False
-    p1x, p1y = polygon[0]
-    for i in range(1, n + 1):
-        p2x, p2y = polygon[i % n]
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-        p1x, p1y = p2x, p2y
-    return inside
-
-def check_rect_polygon_collision(rect, polygon):
-    corners = [
-        (rect.left, rect.top),
-        (rect.right, rect.top),
-        (rect.left, rect.bottom),
-        (rect.right, rect.bottom)
-    ]
-    for corner in corners:
-        if point_in_polygon(corner, polygon):
-            return True
-    for p in polygon:
-        if rect.collidepoint(p):
-            return True
-    return False
-
 # Inside room main cycle
 def run_mushroom_house(screen, entry_position, last_exit_position=None):
     "Mushroom house"
@@ -116,22 +58,40 @@ def run_mushroom_house(screen, entry_position, last_exit_position=None):
     # defaul debug tool
     debug = ts_debug.DebugTool()
 
+    # Decode the room's images behind a loading screen (instant once cached)
+    manifest = [
+        ("opaque", get_path("maps", "village", "mushroom_house", "assets", "mushroom_house.png")),
+        ("image", get_path("maps", "village", "mushroom_house", "assets", "mushroom_house_item.png")),
+    ]
+    if not Preloader(manifest).run(screen):
+        pygame.quit()
+        sys.exit()
+
     # background and items in room
-    bg = pygame.image.load(get_path("maps", "village", "mushroom_house", "assets", "mushroom_house.png")).convert()
+    bg = ASSETS.get_surface(get_path("maps", "village", "mushroom_house", "assets", "mushroom_house.png"), alpha=False)
     bg = pygame.transform.scale(bg, (MAP_W, MAP_H))
-    item_layer = pygame.image.load(get_path("maps", "village", "mushroom_house", "assets", "mushroom_house_item.png")).convert_alpha()
+    item_layer = ASSETS.get_surface(get_path("maps", "village", "mushroom_house", "assets", "mushroom_house_item.png"))
     item_layer = pygame.transform.scale(item_layer, (MAP_W, MAP_H))
 
     # Tiled collision & trigger
     tmx_path = get_path("maps", "village", "mushroom_house", "assets", "mushroom_house.tmx")
-    collision_objects, trigger_objects = load_tiled_collision_local(tmx_path)
+    collision_objects, trigger_objects = load_tiled_collision(tmx_path)
+    collision_index = CollisionIndex(collision_objects)
+
+    # Door trigger: walking into it takes the player back to the village
+    triggers = TriggerSystem(trigger_objects)
+    leaving = False
+
+    def leave(zone):
+        nonlocal leaving
+        leaving = True
+
+    triggers.on("door", on_enter=leave)
 
     # Player resources
     FRAME_W, FRAME_H, SCALE = 32, 32, 4
-    standing = pygame.image.load(get_path("assets", "standing.png")).convert_alpha()
-    moving = pygame.image.load(get_path("assets", "moving.png")).convert_alpha()
-    idle_frames = get_frames(standing, FRAME_W, FRAME_H, SCALE)
-    move_frames = get_frames(moving, FRAME_W, FRAME_H, SCALE)
+    idle_frames = AnimationBank(ASSETS.get("sheet", load_player_frames, get_path("assets", "standing.png"), FRAME_W, FRAME_H, SCALE))
+    move_frames = AnimationBank(ASSETS.get("sheet", load_player_frames, get_path("assets", "moving.png"), FRAME_W, FRAME_H, SCALE))
 
     # Player initial position
     player_rect = pygame.Rect(entry_position[0], entry_position[1], FRAME_W*SCALE, FRAME_H*SCALE)
@@ -159,12 +119,9 @@ def run_mushroom_house(screen, entry_position, last_exit_position=None):
         # Player movement
         player_rect, is_moving, facing_right = handle_player_movement(
             player_rect, keys, speed,
-            lambda rect, objs: any(
-                rect.colliderect(o["rect"]) if o["type"]=="rect" else check_rect_polygon_collision(rect, o["points"])
-                for o in objs
-            ),
+            lambda rect, index: any(object_collides(rect, o) for o in index.query_rect(rect)),
             get_player_collision_box,
-            collision_objects,
+            collision_index,
             facing_right
         )
 
@@ -186,19 +143,12 @@ def run_mushroom_house(screen, entry_position, last_exit_position=None):
         screen.blit(current_frame, (player_rect.x - camera_x, player_rect.y - camera_y))
         screen.blit(item_layer, (-camera_x, -camera_y))
 
-        # Door trigger (detect player box & door area)
-        player_box = get_player_collision_box(player_rect)
-        for obj in trigger_objects:
-            if obj.get("name", "").lower() == "door":
-                if obj["type"] == "rect":
-                    collision = player_box.colliderect(obj["rect"])
-                else:
-                    collision = check_rect_polygon_collision(player_box, obj["points"])
-
-                if collision:
-                    from maps.village.main_village import run_village
-                    run_village(screen, entry_position=last_exit_position)
-                    return
+        # Door trigger (fires leave() when the player box enters the door area)
+        triggers.update(get_player_collision_box(player_rect))
+        if leaving:
+            from maps.village.main_village import run_village
+            run_village(screen, entry_position=last_exit_position)
+            return
 
         # Debug drawing
         debug.draw(
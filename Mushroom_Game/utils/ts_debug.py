@@ -1,10 +1,13 @@
 # utils/ts_debug.py
 import pygame
+from asset_cache import ASSETS
+from text_cache import TextLine
 
 class DebugTool:
     def __init__(self):
         self.enabled = False
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = ASSETS.get("font", pygame.font.SysFont, None, 24)
+        self.position_text = TextLine(self.font, (255, 255, 0)) # Re-rendered only when the player moves
 
     def toggle(self):
         self.enabled = not self.enabled
@@ -14,8 +17,7 @@ class DebugTool:
             return
 
         # Player position
-        text = self.font.render(f"Player: ({int(player_rect.x)}, {int(player_rect.y)})", True, (255, 255, 0))
-        screen.blit(text, (10, 10))
+        self.position_text.draw(screen, f"Player: ({int(player_rect.x)}, {int(player_rect.y)})", topleft=(10, 10))
 
         # Player hitbox
         if player_hitbox:
@@ -38,6 +38,7 @@ def handle_player_movement(player_rect, keys, speed,
     return player_rect, is_moving, facing_right
 
 # Animation update function
+# idle_frames / move_frames are AnimationBanks, so facing is a lookup, not a flip
 def update_animation(idle_frames, move_frames, is_moving,
                      frame_index, frame_timer, dt, frame_speed, FRAME_W, FRAME_H, SCALE, facing_right):
     frame_timer += dt
@@ -49,14 +50,11 @@ def update_animation(idle_frames, move_frames, is_moving,
 
     if len(frames) > 0:
         frame_index %= len(frames)
-        current_frame = frames[frame_index]
+        # Already flipped according to orientation
+        current_frame = frames.get(frame_index, facing_right)
     else:
         current_frame = pygame.Surface((FRAME_W * SCALE, FRAME_H * SCALE), pygame.SRCALPHA)
 
-    # Flip according to orientation
-    if not facing_right:
-        current_frame = pygame.transform.flip(current_frame, True, False)
-
     return current_frame, frame_index, frame_timer
 
 # Camera update function and boundary restrictions
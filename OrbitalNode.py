@@ -1,5 +1,7 @@
 import pygame
 import math
+from animation_bank import AnimationBank
+from game_log import LOG
 
 class OrbitalNode(pygame.sprite.Sprite):
     def __init__(self, player, radius, rotation_speed, weapon_damage, hit_cooldown, image, start_angle,particle_manager, enemy_group):
@@ -15,14 +17,16 @@ class OrbitalNode(pygame.sprite.Sprite):
         self.particle_manager = particle_manager
         
         # --- Image / Rect ---
-        self.base_image = image  # The "clean" loaded image
-        self.image = self.base_image.copy()
+        # Clean and white-flash versions, baked once instead of every frame
+        self.animation = AnimationBank([image], flash_color=(150, 150, 150))
+        self.image = self.animation.get(0)
         self.rect = self.image.get_rect()
         
         # --- Combat ---
         self.weapon_damage = weapon_damage
         self.hit_cooldown = hit_cooldown
         self.hit_timer = 0.0 # Starts ready to hit
+        self.collide_ratio = pygame.sprite.collide_rect_ratio(0.8)
         
         # --- Hit Flash Effect (stolen from your Enemy) ---
         self.is_flashing = False
@@ -48,7 +52,7 @@ class OrbitalNode(pygame.sprite.Sprite):
 
         total_damage = self.player.stats.attack_power + self.weapon_damage
 
-        print(f"[COMBAT] OrbitalNode hit {enemy_target.stats.name} for {total_damage} damage!")
+        LOG.debug("[COMBAT] OrbitalNode hit %s for %d damage!", enemy_target.stats.name, total_damage)
         enemy_target.take_damage(total_damage)
 
     def update(self, dt):
@@ -69,21 +73,16 @@ class OrbitalNode(pygame.sprite.Sprite):
         
         self.rect.center = (int(self.pos_x), int(self.pos_y))
         if self.can_attack():
-            # Use collide_rect_ratio for a smaller hitbox
-            collided_list = pygame.sprite.spritecollide(
-                self, self.enemy_group, False, 
-                collided=pygame.sprite.collide_rect_ratio(0.8)
-            )
-            if collided_list:
-                # Hit the first enemy in the list
-                self.deal_damage(collided_list[0])
+            # Use collide_rect_ratio for a smaller hitbox; the enemy group
+            # tests it on the swarm's arrays and only syncs the one it returns
+            enemy = self.enemy_group.spritecollideany(self, collided=self.collide_ratio)
+            if enemy is not None:
+                self.deal_damage(enemy)
 
-        self.image = self.base_image.copy() 
-        
         if self.is_flashing:
             self.flash_timer += dt
             if self.flash_timer >= self.flash_duration:
                 self.is_flashing = False
-            else:
-                # Add a white flash
-                self.image.fill((150, 150, 150), special_flags=pygame.BLEND_RGB_ADD)
\ No newline at end of file
+
+        # White flash variant while flashing
+        self.image = self.animation.get(0, True, self.is_flashing)
\ No newline at end of file
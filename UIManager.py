@@ -1,8 +1,10 @@
 import pygame
 import random
+from text_cache import TEXT
+from game_log import LOG
 
 def draw_text(surface, text, font, color, rect, center=True):
-    text_surf = font.render(text, True, color)
+    text_surf = TEXT.render(font, text, True, color)
     text_rect = text_surf.get_rect()
     if center:
         text_rect.center = rect.center
@@ -12,11 +14,13 @@ def draw_text(surface, text, font, color, rect, center=True):
 
 
 class LevelUpUI:
-    def __init__(self, player, all_sprites_group, canvas_width, canvas_height):
+    def __init__(self, player, all_sprites_group, canvas_width, canvas_height, rng=None):
         self.player = player
         self.all_sprites = all_sprites_group # For the orbital upgrade
         
         self.current_upgrades = []
+        self.last_choice = None   # Index of the option picked last, for recording
+        self.rng = rng if rng is not None else random.Random() # The run's "ui" stream
         
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
@@ -49,9 +53,9 @@ class LevelUpUI:
             {"text": "+1 Orbital", "stat": "add_orbital", "value": 1},
             # {"text": "+2 Defense", "stat": "defense", "value": 2}, 
         ]
-        random.shuffle(all_options)
+        self.rng.shuffle(all_options)
         self.current_upgrades = all_options[:3]
-        print(f"[UI] Generated Upgrades: {self.current_upgrades}")
+        LOG.debug("[UI] Generated Upgrades: %s", self.current_upgrades)
 
     def _apply_upgrade(self, upgrade):
         """
@@ -60,7 +64,7 @@ class LevelUpUI:
         stat = upgrade['stat']
         value = upgrade['value']
         
-        print(f"[UPGRADE] Applying: {stat} + {value}")
+        LOG.info("[UPGRADE] Applying: %s + %s", stat, value)
         
         if stat == "base_health":
             self.player.stats.base_health += value
@@ -77,21 +81,23 @@ class LevelUpUI:
                 self.player.equip_weapon(self.player.active_weapon)
                 self.all_sprites.add(self.player.orbitals)
 
+    def choose(self, index):
+        self.last_choice = index
+        self._apply_upgrade(self.current_upgrades[index])
+
     def activate(self):
         self._get_upgrade_options()
 
-    def handle_event(self, event, zoom_level):
+    def handle_event(self, event, to_canvas):
+        """to_canvas maps a window position to canvas coordinates (Presenter.to_canvas)."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Convert SCREEN mouse pos to CANVAS mouse pos
-            mouse_pos = pygame.mouse.get_pos()
-            canvas_mouse_x = mouse_pos[0] / zoom_level
-            canvas_mouse_y = mouse_pos[1] / zoom_level
-            canvas_mouse_pos = (canvas_mouse_x, canvas_mouse_y)
+            canvas_mouse_pos = to_canvas(pygame.mouse.get_pos())
             
             # Check collision with each button
             for i, rect in enumerate(self.upgrade_btn_rects):
                 if rect.collidepoint(canvas_mouse_pos):
-                    self._apply_upgrade(self.current_upgrades[i])
+                    self.choose(i)
                     return 'running' # Signal to resume the game
                     
         return None # No state change
@@ -149,15 +155,13 @@ class GameOverUI:
         self.final_time = final_time
         self.kill_count = kill_count
 
-    def handle_event(self, event, zoom_level):
+    def handle_event(self, event, to_canvas):
+        """to_canvas maps a window position to canvas coordinates (Presenter.to_canvas)."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_pos = pygame.mouse.get_pos()
-            canvas_mouse_x = mouse_pos[0] / zoom_level
-            canvas_mouse_y = mouse_pos[1] / zoom_level
-            canvas_mouse_pos = (canvas_mouse_x, canvas_mouse_y)
+            canvas_mouse_pos = to_canvas(pygame.mouse.get_pos())
             
             if self.continue_btn_rect.collidepoint(canvas_mouse_pos):
-                print("[Game] Returning to Hub (Restarting)...")
+                LOG.info("[Game] Returning to Hub (Restarting)...")
                 return 'restart' # This triggers the 'hub' reset
                     
         return None # No state change
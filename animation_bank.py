@@ -0,0 +1,55 @@
+import pygame
+
+
+class AnimationBank:
+    """
+    Every image a sprite can show, baked once at load time:
+    frame index x facing (right / left) x flash (off / on).
+
+    Picking the image for a frame is then a list lookup instead of a
+    copy() + flip() + fill() every tick. The baked surfaces are shared, so
+    never draw onto what get() returns.
+    """
+    def __init__(self, frames, flash_color=None, flash_flags=pygame.BLEND_RGB_ADD):
+        flipped = [pygame.transform.flip(frame, True, False) for frame in frames]
+
+        if flash_color is not None:
+            flashed = self.run_length_encode([self.bake_flash(frame, flash_color, flash_flags) for frame in frames])
+            flashed_flipped = self.run_length_encode([self.bake_flash(frame, flash_color, flash_flags) for frame in flipped])
+
+        # The originals are shared (ASSETS, masks), so those get encoded copies
+        frames = self.run_length_encode([frame.copy() for frame in frames])
+        flipped = self.run_length_encode(flipped)
+        if flash_color is None:
+            flashed = frames
+            flashed_flipped = flipped
+
+        # Indexed as variants[flashing][facing_right][frame_index]
+        self.variants = [
+            [flipped, frames],
+            [flashed_flipped, flashed],
+        ]
+
+    @staticmethod
+    def run_length_encode(frames):
+        """
+        Marks per-pixel-alpha frames for SDL's RLE acceleration: blits then
+        skip the runs of clear pixels instead of blending them, several times
+        faster for sprites that are mostly background. Same pixels on screen.
+        """
+        for frame in frames:
+            if frame.get_flags() & pygame.SRCALPHA:
+                frame.set_alpha(255, pygame.RLEACCEL)
+        return frames
+
+    @staticmethod
+    def bake_flash(frame, color, flags):
+        surface = frame.copy()
+        surface.fill(color, special_flags=flags)
+        return surface
+
+    def __len__(self):
+        return len(self.variants[0][1])
+
+    def get(self, index, facing_right=True, flashing=False):
+        return self.variants[flashing][facing_right][index]
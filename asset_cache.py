@@ -0,0 +1,129 @@
+import os
+import pygame
+from asset_pack import AssetPack, DEFAULT_PACK_PATH
+from game_log import LOG
+
+
+class AssetCache:
+    """
+    Process-wide store of decoded assets. Each asset is loaded once by the
+    loader function it was first asked for, and every later request gets the
+    very same object back, so callers must treat what they get as read-only
+    (copy a surface before drawing on it).
+
+    Entries are keyed by (loader, args), e.g. (load_frames_from_folder, (path, scale)).
+    `kind` only groups the hit/miss statistics.
+
+    With a packed archive attached (use_pack), the loaders below build
+    surfaces and masks from its pre-decoded pixels and only fall back to the
+    loose files for anything it doesn't hold.
+    """
+    def __init__(self):
+        self.entries = {}
+        self.hits = {}
+        self.misses = {}
+        self.pack = None
+
+    def use_pack(self, path=DEFAULT_PACK_PATH):
+        """Attaches the archive at `path` if there is one (see asset_pack.py). Returns whether it did."""
+        if self.pack is not None:
+            return True
+        if not os.path.exists(path):
+            return False
+        try:
+            self.pack = AssetPack(path)
+        except (ValueError, OSError) as e:
+            LOG.warning("[ASSETS] Ignoring asset pack %s: %s", path, e)
+            return False
+
+        LOG.info("[ASSETS] Using asset pack %s (%d entries)", path, len(self.pack))
+        if self.pack.stale:
+            LOG.warning("[ASSETS] %d packed entries are older than their source files and will be loaded "
+                        "loose; rebuild with: python asset_pack.py build", len(self.pack.stale))
+        return True
+
+    def packed_image(self, path, scale=1):
+        return self.pack is not None and self.pack.find("image", path, scale) is not None
+
+    def get(self, kind, loader, *args):
+        key = (loader, args)
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+            value = self.entries[key] = loader(*args)
+            return value
+
+        self.hits[kind] = self.hits.get(kind, 0) + 1
+        return value
+
+    def put(self, kind, value, loader, *args):
+        """Stores an entry made elsewhere (e.g. by the Preloader) as if `loader` had made it."""
+        self.entries[(loader, args)] = value
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+
+    def contains(self, loader, *args):
+        return (loader, args) in self.entries
+
+    def get_surface(self, path, alpha=True):
+        """The decoded, display-converted file; every image load goes through here."""
+        return self.get("surface", load_surface, path, alpha)
+
+    def get_image(self, path, scale=1):
+        return self.get("image", load_image, path, scale)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        kinds = sorted(set(self.hits) | set(self.misses))
+        return {
+            kind: {"hits": self.hits.get(kind, 0), "misses": self.misses.get(kind, 0)}
+            for kind in kinds
+        }
+
+    def report(self):
+        lines = [f"[ASSETS] {len(self.entries)} cached entries"]
+        for kind, counts in self.stats().items():
+            total = counts["hits"] + counts["misses"]
+            lines.append(f"[ASSETS]   {kind}: {counts['hits']} hits / {counts['misses']} misses "
+                         f"({100 * counts['hits'] / total:.1f}% hit rate)")
+        return "\n".join(lines)
+
+
+def load_surface(path, alpha=True):
+    if ASSETS.pack is not None:
+        surface = ASSETS.pack.surface(path, alpha=alpha)
+        if surface is not None:
+            return surface
+    return convert_surface(pygame.image.load(path), alpha)
+
+
+def convert_surface(surface, alpha=True):
+    """Display-format conversion; main thread only, after set_mode()."""
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def load_image(path, scale=1):
+    if scale != 1 and ASSETS.pack is not None:
+        image = ASSETS.pack.surface(path, scale)  # Packed already scaled
+        if image is not None:
+            return image
+
+    image = ASSETS.get_surface(path)
+    if scale != 1:
+        w, h = image.get_size()
+        image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
+    return image
+
+
+def load_mask(path):
+    if ASSETS.pack is not None:
+        mask = ASSETS.pack.mask(path)
+        if mask is not None:
+            return mask
+    return pygame.mask.from_surface(ASSETS.get_surface(path))
+
+
+# The one cache everything in the process shares
+ASSETS = AssetCache()
@@ -0,0 +1,283 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import pygame
+
+# --- Archive Layout ---
+# [header][entry data, each 64-byte aligned]...[JSON index]
+#
+# The index maps an entry name ("image:Images/Slime/spr_Soratomo_0.png@1") to
+# its offset/size/dimensions in the file plus the source file's mtime, size
+# and SHA-1, so the packer can tell which entries went stale.
+#
+# Image entries are raw 32-bit pixels in PIXEL_FORMAT, already scaled: the
+# byte order SDL's convert_alpha() produces on this machine, so a surface
+# made straight over the mapped bytes blits as fast as a converted one.
+# Mask entries are one byte per pixel (0 = unset).
+
+PACK_MAGIC = b"GPAK"
+PACK_VERSION = 1
+HEADER = struct.Struct("<4sIQQ")   # magic, version, index offset, index size
+ALIGN = 64
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK_PATH = os.path.join(ROOT, "assets.pack")
+
+# Everything under these (relative to the repo root) is packed at scale 1
+SOURCE_DIRS = ["Images", os.path.join("Mushroom_Game", "maps")]
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# ARGB8888 in memory, the usual convert_alpha() result
+PIXEL_FORMAT = "BGRA" if sys.byteorder == "little" else "ARGB"
+
+
+def pack_key(path, root=ROOT):
+    """Same key for r"Images\\Slime\\a.png", "Images/Slime/a.png" or an absolute path."""
+    real = os.path.realpath(path.replace("\\", "/"))
+    return os.path.relpath(real, root).replace(os.sep, "/")
+
+
+def entry_name(kind, key, scale=1):
+    return f"{kind}:{key}@{scale:g}"
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+# --- Packing (offline) ---
+
+def default_specs(root=ROOT):
+    """(kind, source path, scale) for every entry the game can ask for."""
+    from simulation import MAP1_SPAWN_TABLE, MAP2_SPAWN_TABLE
+    from weapon import MUSHROOM_SONG, STORM_BLADE
+
+    specs = []
+    for source_dir in SOURCE_DIRS:
+        for folder, _, filenames in os.walk(os.path.join(root, source_dir)):
+            for filename in sorted(filenames):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    specs.append(("image", os.path.join(folder, filename), 1))
+
+    # Pre-scaled copies of what gets loaded scaled (enemy frames, weapon sprites)
+    for entry in MAP1_SPAWN_TABLE + MAP2_SPAWN_TABLE:
+        folder = os.path.join(root, entry["frames_folder_path"].replace("\\", "/"))
+        if entry["scale"] != 1 and os.path.isdir(folder):
+            for filename in sorted(os.listdir(folder)):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    specs.append(("image", os.path.join(folder, filename), entry["scale"]))
+        if entry.get("mask_path"):
+            specs.append(("mask", os.path.join(root, entry["mask_path"].replace("\\", "/")), 1))
+
+    for weapon in (MUSHROOM_SONG, STORM_BLADE):
+        if weapon.scale != 1:
+            specs.append(("image", os.path.join(root, weapon.image_path.replace("\\", "/")), weapon.scale))
+
+    return specs
+
+
+def encode_entry(kind, path, scale):
+    """Source file -> (width, height, raw bytes), the way the game's loaders would see it."""
+    image = pygame.image.load(path)
+    if scale != 1:
+        w, h = image.get_size()
+        image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
+
+    if kind == "mask":
+        mask = pygame.mask.from_surface(image)
+        drawn = mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
+        return image.get_width(), image.get_height(), pygame.image.tobytes(drawn, "RGBA")[3::4] # Alpha byte
+
+    return image.get_width(), image.get_height(), pygame.image.tobytes(image, PIXEL_FORMAT)
+
+
+def read_index(path):
+    with open(path, "rb") as f:
+        magic, version, index_offset, index_size = HEADER.unpack(f.read(HEADER.size))
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a version {PACK_VERSION} asset pack")
+        f.seek(index_offset)
+        return json.loads(f.read(index_size))
+
+
+def check_entry(entry, root=ROOT):
+    """'ok', 'touched' (mtime moved, same content), 'changed' or 'missing'."""
+    source = os.path.join(root, entry["source"])
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        return "missing"
+    if stat.st_mtime == entry["mtime"] and stat.st_size == entry["source_size"]:
+        return "ok"
+    return "touched" if file_digest(source) == entry["sha1"] else "changed"
+
+
+def build_pack(out_path=DEFAULT_PACK_PATH, specs=None, root=ROOT):
+    """
+    Writes the archive. Entries of an existing archive at out_path whose
+    source hasn't changed (same mtime, or same SHA-1) are copied over without
+    decoding anything. Returns {"reused": n, "encoded": n}.
+    """
+    specs = default_specs(root) if specs is None else specs
+
+    old_index, old_data = {}, None
+    if os.path.exists(out_path):
+        try:
+            old_index = read_index(out_path)["entries"]
+            with open(out_path, "rb") as f:
+                old_data = f.read()
+        except (ValueError, OSError, struct.error):
+            old_index = {}
+
+    entries = {}
+    counts = {"reused": 0, "encoded": 0}
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * HEADER.size)
+
+        for kind, path, scale in specs:
+            key = pack_key(path, root)
+            name = entry_name(kind, key, scale)
+            if name in entries:
+                continue
+
+            stat = os.stat(path)
+            old = old_index.get(name)
+            if old is not None and old_data is not None and check_entry(old, root) in ("ok", "touched"):
+                data = old_data[old["offset"]:old["offset"] + old["size"]]
+                width, height, digest = old["width"], old["height"], old["sha1"]
+                counts["reused"] += 1
+            else:
+                width, height, data = encode_entry(kind, path, scale)
+                digest = file_digest(path)
+                counts["encoded"] += 1
+
+            f.write(b"\0" * (-f.tell() % ALIGN))
+            entries[name] = {
+                "kind": kind, "source": key, "scale": scale,
+                "offset": f.tell(), "size": len(data), "width": width, "height": height,
+                "mtime": stat.st_mtime, "source_size": stat.st_size, "sha1": digest,
+            }
+            f.write(data)
+
+        index = json.dumps({"format": PIXEL_FORMAT, "entries": entries}).encode()
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, index_offset, len(index)))
+
+    os.replace(tmp_path, out_path)
+    return counts
+
+
+# --- Reading (runtime) ---
+
+class AssetPack:
+    """
+    A packed archive, memory-mapped. surface() and mask() build their result
+    straight over the mapped bytes (pygame.image.frombuffer), so nothing is
+    decoded or copied; pages are read in by the OS on first touch.
+
+    The mapping is copy-on-write: a surface that does get drawn on changes
+    only this process's copy of those pages, never the file.
+
+    Entries whose source file has a different mtime than when it was packed
+    are treated as absent (the caller falls back to the loose file) until the
+    pack is rebuilt.
+    """
+    def __init__(self, path=DEFAULT_PACK_PATH, root=ROOT):
+        self.path = path
+        self.root = root
+
+        index = read_index(path)
+        self.format = index["format"]
+        self.entries = index["entries"]
+
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.view = memoryview(self.data)
+
+        self.stale = set()
+        for name, entry in self.entries.items():
+            try:
+                stat = os.stat(os.path.join(root, entry["source"]))
+            except FileNotFoundError:
+                self.stale.add(name)
+                continue
+            if stat.st_mtime != entry["mtime"] or stat.st_size != entry["source_size"]:
+                self.stale.add(name)
+
+        self.native_masks = None   # Channel masks convert_alpha() gives on this display
+
+    def __len__(self):
+        return len(self.entries)
+
+    def find(self, kind, path, scale=1):
+        name = entry_name(kind, pack_key(path, self.root), scale)
+        if name in self.stale:
+            return None
+        return self.entries.get(name)
+
+    def entry_bytes(self, entry):
+        return self.view[entry["offset"]:entry["offset"] + entry["size"]]
+
+    def surface(self, path, scale=1, alpha=True):
+        """The packed image as a Surface, or None if it isn't packed (or is stale)."""
+        entry = self.find("image", path, scale)
+        if entry is None:
+            return None
+        surface = pygame.image.frombuffer(self.entry_bytes(entry), (entry["width"], entry["height"]), self.format)
+
+        if not alpha:
+            return surface.convert() # Opaque backgrounds: one copy, at load
+        if self.native_masks is None:
+            self.native_masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+        if surface.get_masks() != self.native_masks:
+            return surface.convert_alpha() # Packed on a machine with another pixel layout
+        return surface
+
+    def mask(self, path):
+        entry = self.find("mask", path)
+        if entry is None:
+            return None
+        bits = pygame.image.frombuffer(self.entry_bytes(entry), (entry["width"], entry["height"]), "P")
+        bits.set_colorkey(0) # from_surface then sets exactly the non-zero bytes
+        return pygame.mask.from_surface(bits)
+
+    def close(self):
+        self.view.release()
+        self.data.close()
+        self.file.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or check the packed asset archive")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--out", default=DEFAULT_PACK_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        counts = build_pack(args.out)
+        size = os.path.getsize(args.out)
+        print(f"[PACK] Wrote {args.out}: {counts['encoded']} encoded, {counts['reused']} reused "
+              f"unchanged ({size / 1024:.0f} KiB)")
+        return 0
+
+    entries = read_index(args.out)["entries"]
+    problems = 0
+    for name, entry in entries.items():
+        status = check_entry(entry)
+        if status != "ok":
+            print(f"[PACK] {status:<8} {name}")
+            problems += status in ("changed", "missing")
+    print(f"[PACK] {len(entries)} entries, {problems} stale")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import time
+import pygame
+from asset_cache import ASSETS
+from game_log import LOG
+
+# --- Channel Pools ---
+# Each category gets its own reserved mixer channels, so a crowd of hits can
+# never take the channel a level-up jingle needs.
+SOUND_CATEGORIES = {
+    "combat": 4,
+    "ui": 2,
+}
+
+# --- Sounds ---
+# min_interval: a sound won't restart sooner than this (seconds); triggers in
+# between are dropped. volume leaves headroom for coalesced triggers.
+SOUNDS = {
+    "hit": {"path": r"Images\atk.mp3", "category": "combat", "volume": 0.5, "min_interval": 0.06},
+    "level_up": {"path": r"Images\chest2.mp3", "category": "ui", "volume": 1.0, "min_interval": 0.25},
+}
+
+
+def init_mixer():
+    """Small buffer for snappy hit sounds; call before pygame.init()."""
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+
+
+def load_sound(path):
+    return pygame.mixer.Sound(path)
+
+
+class AudioManager:
+    """
+    Game code calls play("hit") as often as it likes; nothing reaches the
+    mixer until update(), once per frame. There every sound that was
+    triggered is played at most once:
+
+      - several triggers of the same sound in one frame are coalesced into a
+        single, louder play (volume * sqrt(triggers), capped at 1.0);
+      - a sound that last started less than its min_interval ago is skipped;
+      - it plays on a free channel of its category's pool, or, when they are
+        all busy, cuts off the one that started longest ago.
+
+    Sounds are decoded once through ASSETS, so restarting a map is free.
+    Music streams from disk through pygame.mixer.music.
+
+    If the mixer couldn't start (no audio device), everything is a no-op.
+    """
+    def __init__(self, sounds=SOUNDS, categories=SOUND_CATEGORIES, clock=time.perf_counter):
+        self.clock = clock
+        self.enabled = pygame.mixer.get_init() is not None
+        if not self.enabled:
+            LOG.warning("[AUDIO] Mixer not initialised; sound is off")
+
+        self.sounds = {}
+        self.pending = {}     # name -> triggers since the last update()
+        self.last_played = {name: float("-inf") for name in sounds}
+
+        # Stats
+        self.plays = 0
+        self.coalesced = 0    # Triggers folded into another play
+        self.suppressed = 0   # Triggers dropped by min_interval
+
+        self.pools = {}
+        self.pool_started = {}
+        if not self.enabled:
+            return
+
+        # Reserve every pooled channel so Sound.play() elsewhere can't grab them
+        reserved = sum(categories.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved))
+        pygame.mixer.set_reserved(reserved)
+
+        first = 0
+        for category, size in categories.items():
+            self.pools[category] = [pygame.mixer.Channel(i) for i in range(first, first + size)]
+            self.pool_started[category] = [float("-inf")] * size
+            first += size
+
+        for name, spec in sounds.items():
+            sound = ASSETS.get("sound", load_sound, spec["path"])
+            self.sounds[name] = (sound, spec["category"], spec["volume"], spec["min_interval"])
+
+    def play(self, name):
+        if self.enabled:
+            self.pending[name] = self.pending.get(name, 0) + 1
+
+    def update(self):
+        if not self.pending:
+            return
+        now = self.clock()
+
+        for name, triggers in self.pending.items():
+            sound, category, volume, min_interval = self.sounds[name]
+
+            if now - self.last_played[name] < min_interval:
+                self.suppressed += triggers
+                continue
+
+            self.last_played[name] = now
+            self.plays += 1
+            self.coalesced += triggers - 1
+
+            channel = self.get_channel(category, now)
+            channel.set_volume(min(1.0, volume * triggers ** 0.5))
+            channel.play(sound)
+
+        self.pending.clear()
+
+    def get_channel(self, category, now):
+        pool = self.pools[category]
+        started = self.pool_started[category]
+
+        index = None
+        for i, channel in enumerate(pool):
+            if not channel.get_busy():
+                index = i
+                break
+        if index is None:
+            # All busy: steal the oldest
+            index = started.index(min(started))
+
+        started[index] = now
+        return pool[index]
+
+    # --- Music ---
+    def play_music(self, path, volume=0.5, loops=-1):
+        """Streams `path` (decoded a chunk at a time, never held in memory whole)."""
+        if not self.enabled:
+            return
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+
+    def stop_music(self, fadeout_ms=0):
+        if not self.enabled:
+            return
+        if fadeout_ms:
+            pygame.mixer.music.fadeout(fadeout_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def report(self):
+        return (f"[AUDIO] {self.plays} plays, {self.coalesced} triggers coalesced, "
+                f"{self.suppressed} suppressed by re-trigger interval")
@@ -0,0 +1,103 @@
+import os
+import json
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loose image files versus the memory-mapped assets.pack, through the game's
+# own loaders (ASSETS.get_surface / get_image / load_enemy_animation):
+#
+#   cold start  a fresh process loading everything map1 and map2 show
+#               (player sheets, weapons, every mob's frames and mask, the
+#               village backdrops); includes opening the pack
+#   spawn       one mob type going from nothing cached to a ready
+#               AnimationBank + mask, as the first spawn of that type does
+#
+# Build the pack first:  python asset_pack.py build
+
+LAUNCHES = 5
+SPAWN_REPEATS = 50
+
+CHILD = """
+import os, sys, time, json
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+sys.path.insert(0, {root!r})
+os.chdir({root!r})
+import pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from asset_cache import ASSETS, load_mask
+from character import IDLE_SHEET_PATH, MOVING_SHEET_PATH, load_sprite_sheet
+from mob import load_enemy_animation
+from simulation import MAP1_SPAWN_TABLE, MAP2_SPAWN_TABLE
+from weapon import MUSHROOM_SONG, STORM_BLADE
+
+def path(p):
+    return p.replace("\\\\", "/")
+
+def load_everything():
+    for sheet in (IDLE_SHEET_PATH, MOVING_SHEET_PATH):
+        ASSETS.get("sheet", load_sprite_sheet, path(sheet), 32, 32, 1.5)
+    for weapon in (MUSHROOM_SONG, STORM_BLADE):
+        ASSETS.get_image(path(weapon.image_path), weapon.scale)
+    for entry in MAP1_SPAWN_TABLE + MAP2_SPAWN_TABLE:
+        spawn(entry)
+    for name in ("bg_village.png", "village_buildings.png"):
+        ASSETS.get_surface(os.path.join("Mushroom_Game", "maps", "village", "assets", name))
+
+def spawn(entry):
+    ASSETS.get("animation", load_enemy_animation, path(entry["frames_folder_path"]), entry["scale"])
+    if entry.get("mask_path"):
+        ASSETS.get("mask", load_mask, path(entry["mask_path"]))
+
+start = time.perf_counter()
+if {use_pack}:
+    ASSETS.use_pack()
+load_everything()
+cold_ms = 1000 * (time.perf_counter() - start)
+
+entry = MAP1_SPAWN_TABLE[0]
+spawn_times = []
+for _ in range({repeats}):
+    ASSETS.clear()
+    start = time.perf_counter()
+    spawn(entry)
+    spawn_times.append(1000 * (time.perf_counter() - start))
+spawn_times.sort()
+
+print(json.dumps({{"cold_ms": cold_ms, "spawn_ms": spawn_times[len(spawn_times) // 2]}}))
+"""
+
+
+def launch(use_pack):
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(root=ROOT, use_pack=use_pack, repeats=SPAWN_REPEATS)],
+        capture_output=True, text=True, timeout=300,
+    )
+    if output.returncode != 0:
+        raise RuntimeError(output.stderr)
+    result = [line for line in output.stdout.splitlines() if line.startswith("{")]
+    return json.loads(result[-1])
+
+
+def main():
+    if not os.path.exists(os.path.join(ROOT, "assets.pack")):
+        sys.exit("No assets.pack; run: python asset_pack.py build")
+
+    launch(False)  # Warm the OS file cache for both the loose files and the pack
+    launch(True)
+
+    print(f"{'source':<12} | {'cold start ms':>13} | {'first spawn ms':>14}")
+    print("-" * 46)
+    for label, use_pack in (("loose files", False), ("assets.pack", True)):
+        runs = [launch(use_pack) for _ in range(LAUNCHES)]
+        cold = statistics.median(run["cold_ms"] for run in runs)
+        spawn = statistics.median(run["spawn_ms"] for run in runs)
+        print(f"{label:<12} | {cold:>13.1f} | {spawn:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
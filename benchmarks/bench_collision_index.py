@@ -0,0 +1,80 @@
+import os
+import sys
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)  # repo root
+sys.path.append(os.path.join(ROOT, "Mushroom_Game"))  # utils, for main_village
+sys.path.append(os.path.join(ROOT, "Mushroom_Game", "maps", "village"))
+
+import pygame
+import random
+import time
+import main_village
+from tiled_collision import CollisionIndex, build_object, object_collides
+
+# The village's player-vs-map check (check_collision_with_objects, twice per
+# frame) over every object versus over CollisionIndex candidates. Bigger maps
+# are the village's collision layer tiled side by side, so the object mix
+# stays the same and only the count grows. Both paths must agree on every probe.
+
+QUERIES = 1000
+TILES = [1, 2, 4, 8]    # Village copies per side
+VILLAGE_SIZE = (2048, 1536)
+
+
+def tiled_map(objects, tiles):
+    out = []
+    for tx in range(tiles):
+        for ty in range(tiles):
+            dx, dy = tx * VILLAGE_SIZE[0], ty * VILLAGE_SIZE[1]
+            for obj in objects:
+                if obj["type"] == "rect":
+                    plain = {"type": "rect", "rect": list(obj["rect"].move(dx, dy)), "name": obj["name"]}
+                else:
+                    plain = {"type": "polygon", "points": [[x + dx, y + dy] for x, y in obj["points"]], "name": obj["name"]}
+                out.append(build_object(plain))
+    return out
+
+
+def scan(player_rect, collision_objects):
+    """The pre-index check: every object, every time."""
+    for obj in collision_objects:
+        if object_collides(player_rect, obj):
+            return True
+    return False
+
+
+def time_queries(fn, target, probes):
+    start = time.perf_counter()
+    hits = [fn(probe, target) for probe in probes]
+    return (time.perf_counter() - start) / len(probes) * 1e6, hits
+
+
+def main():
+    village, _ = main_village.load_tiled_collision(
+        main_village.get_path("maps", "village", "assets", "village_map.tmx"))
+    if not village:
+        sys.exit("village_map.tmx gave no collision objects")
+
+    rng = random.Random(0)
+    print(f"{'objects':>8} | {'scan us/check':>13} | {'index us/check':>14} | {'speedup':>7} | {'build ms':>8}")
+    print("-" * 63)
+
+    for tiles in TILES:
+        objects = tiled_map(village, tiles)
+        start = time.perf_counter()
+        index = CollisionIndex(objects)
+        build_ms = 1000 * (time.perf_counter() - start)
+
+        # A foot-box-sized probe (get_player_collision_box on the 128px player)
+        probes = [pygame.Rect(rng.uniform(0, VILLAGE_SIZE[0] * tiles), rng.uniform(0, VILLAGE_SIZE[1] * tiles), 38, 35)
+                  for _ in range(QUERIES)]
+
+        scan_us, scan_hits = time_queries(scan, objects, probes)
+        index_us, index_hits = time_queries(main_village.check_collision_with_objects, index, probes)
+        assert scan_hits == index_hits
+
+        print(f"{len(objects):>8} | {scan_us:>13.2f} | {index_us:>14.2f} | {scan_us / index_us:>6.1f}x | {build_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
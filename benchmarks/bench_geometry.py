@@ -0,0 +1,156 @@
+import os
+import sys
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)  # repo root
+
+import pygame
+import random
+import time
+from geometry import PolygonBatch, rect_array
+from tiled_collision import load_tiled_collision
+
+# geometry.py's NumPy rect-vs-polygon test against the corner/vertex check
+# main_village.py and mushroom_house.py used to carry, on the polygons of
+# the village and house maps:
+#
+#   single   one foot-box near one polygon (so past the bounds reject)
+#   boxes    BOXES boxes against one polygon: a loop vs Polygon.collide_rects
+#   polygons one box against every polygon: a loop vs PolygonBatch.collide_rect
+#
+# Both are also checked against an exact reference (segment intersection
+# plus containment, in plain Python) on boxes at fractional positions, so
+# nothing lands exactly on an outline.
+
+PROBES = 3000
+BOXES = 1000
+BOX_SIZE = (38, 35)     # get_player_collision_box on the 128px player
+MAPS = [
+    os.path.join(ROOT, "Mushroom_Game", "maps", "village", "assets", "village_map.tmx"),
+    os.path.join(ROOT, "Mushroom_Game", "maps", "village", "mushroom_house", "assets", "mushroom_house.tmx"),
+]
+
+
+# --- The old test (corners in polygon, or vertices in rect) ---
+
+def legacy_point_in_polygon(point, polygon):
+    x, y = point
+    n = len(polygon)
+    inside = False
+    p1x, p1y = polygon[0]
+    for i in range(1, n + 1):
+        p2x, p2y = polygon[i % n]
+        if y > min(p1y, p2y):
+            if y <= max(p1y, p2y):
+                if x <= max(p1x, p2x):
+                    if p1y != p2y:
+                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    if p1x == p2x or x <= xinters:
+                        inside = not inside
+        p1x, p1y = p2x, p2y
+    return inside
+
+
+def legacy_collision(rect, polygon):
+    corners = [(rect.left, rect.top), (rect.right, rect.top), (rect.left, rect.bottom), (rect.right, rect.bottom)]
+    for corner in corners:
+        if legacy_point_in_polygon(corner, polygon):
+            return True
+    for point in polygon:
+        if rect.collidepoint(point):
+            return True
+    return False
+
+
+# --- Reference ---
+
+def segments_cross(a, b, c, d):
+    def side(p, q, r):
+        return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+    return side(a, b, c) * side(a, b, d) < 0 and side(c, d, a) * side(c, d, b) < 0
+
+
+def reference_collision(box, polygon):
+    left, top, width, height = box
+    right, bottom = left + width, top + height
+    corners = [(left, top), (right, top), (right, bottom), (left, bottom)]
+    for i in range(len(polygon)):
+        a, b = polygon[i], polygon[(i + 1) % len(polygon)]
+        if any(segments_cross(a, b, corners[j], corners[(j + 1) % 4]) for j in range(4)):
+            return True
+    if any(left < x < right and top < y < bottom for x, y in polygon):
+        return True
+    return legacy_point_in_polygon(((left + right) / 2, (top + bottom) / 2), polygon)
+
+
+def near(polygon, rng, fractional):
+    min_x, min_y, max_x, max_y = polygon.bounds
+    x = rng.uniform(min_x - BOX_SIZE[0], max_x)
+    y = rng.uniform(min_y - BOX_SIZE[1], max_y)
+    if fractional:
+        return (x, y) + BOX_SIZE
+    return pygame.Rect(int(x), int(y), *BOX_SIZE)
+
+
+def time_it(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - start) / repeats * 1e6, result
+
+
+def main():
+    polygons = []
+    for path in MAPS:
+        collision_objects, trigger_objects = load_tiled_collision(path)
+        polygons += [obj["shape"] for obj in collision_objects + trigger_objects if obj["type"] == "polygon"]
+    if not polygons:
+        sys.exit("No polygons in the village maps")
+    rng = random.Random(0)
+    print(f"{len(polygons)} polygons, {sum(len(p) for p in polygons)} edges")
+
+    # Exactness
+    mismatches = legacy_wrong = 0
+    for _ in range(PROBES):
+        polygon = rng.choice(polygons)
+        box = near(polygon, rng, fractional=True)
+        expected = reference_collision(box, polygon.points)
+        mismatches += polygon.collide_rect(box) != expected
+        legacy_wrong += legacy_collision(pygame.Rect(box), polygon.points) != expected
+    print(f"exact vs reference: {mismatches}/{PROBES} differ (old test: {legacy_wrong}/{PROBES})")
+    assert mismatches == 0
+
+    print(f"\n{'query':<24} | {'old us':>9} | {'geometry us':>11} | {'speedup':>7}")
+    print("-" * 60)
+
+    # One box, one polygon
+    probes = [(polygon, near(polygon, rng, fractional=False)) for polygon in rng.choices(polygons, k=PROBES)]
+    old_us, _ = time_it(lambda: [legacy_collision(rect, polygon.points) for polygon, rect in probes], 1)
+    new_us, _ = time_it(lambda: [polygon.collide_rect(rect) for polygon, rect in probes], 1)
+    old_us, new_us = old_us / PROBES, new_us / PROBES
+    print(f"{'1 box x 1 polygon':<24} | {old_us:>9.2f} | {new_us:>11.2f} | {old_us / new_us:>6.1f}x")
+
+    # Many boxes, one polygon (the most detailed one)
+    polygon = max(polygons, key=len)
+    box_rects = [near(polygon, rng, fractional=False) for _ in range(BOXES)]
+    boxes = rect_array(box_rects)
+    old_us, _ = time_it(lambda: [legacy_collision(rect, polygon.points) for rect in box_rects], 3)
+    new_us, new_hits = time_it(lambda: polygon.collide_rects(boxes), 20)
+    print(f"{f'{BOXES} boxes x 1 polygon':<24} | {old_us:>9.0f} | {new_us:>11.0f} | {old_us / new_us:>6.1f}x")
+
+    # One box, every polygon
+    batch = PolygonBatch(polygons)
+    rects = [near(rng.choice(polygons), rng, fractional=False) for _ in range(200)]
+    old_us, _ = time_it(lambda: [[legacy_collision(rect, p.points) for p in polygons] for rect in rects], 1)
+    new_us, _ = time_it(lambda: [batch.collide_rect(rect) for rect in rects], 1)
+    old_us, new_us = old_us / len(rects), new_us / len(rects)
+    label = f"1 box x {len(polygons)} polygons"
+    print(f"{label:<24} | {old_us:>9.1f} | {new_us:>11.1f} | {old_us / new_us:>6.1f}x")
+
+    # Batch answers are the one-at-a-time answers
+    assert list(new_hits) == [polygon.collide_rect(rect) for rect in box_rects]
+    for rect in rects:
+        assert list(batch.collide_rect(rect)) == [p.collide_rect(rect) for p in polygons]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import time
+import numpy as np
+from particle import ParticleManager, CIRCLE
+
+# ParticleManager.draw (culled stamps, one Surface.blits call) versus the old
+# pygame.draw.circle / pygame.draw.rect call per particle, on a 640x360 canvas
+# with particles spread over an area 3x the view so culling has work to do.
+
+CANVAS_SIZE = (640, 360)
+FRAMES = 100
+COUNTS = [500, 2000, 10000]
+
+
+def draw_per_particle(manager, surface, camera_x, camera_y):
+    """The pre-atlas draw loop: one draw call per particle, no culling."""
+    n = manager.count
+    for i in range(n):
+        screen_x = int(manager.pos[i, 0] - camera_x)
+        screen_y = int(manager.pos[i, 1] - camera_y)
+        size = manager.size[i]
+        color = manager.palette[manager.color[i]]
+        if manager.shape[i] == CIRCLE:
+            pygame.draw.circle(surface, color, (screen_x, screen_y), int(size))
+        else:
+            rect = pygame.Rect(screen_x - size // 2, screen_y - size // 2, size, size)
+            pygame.draw.rect(surface, color, rect)
+
+
+def fill(manager, count, seed):
+    rng = np.random.default_rng(seed)
+    w, h = CANVAS_SIZE
+    while len(manager) < count:
+        x = rng.uniform(-w, 2 * w)
+        y = rng.uniform(-h, 2 * h)
+        if rng.random() < 0.2:
+            manager.create_hit_effect(x, y)
+        else:
+            manager.create_death_explosion(x, y)
+    # Spread each burst out a bit
+    for _ in range(10):
+        manager.update(1 / 60)
+
+
+def time_frames(fn, surface):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        surface.fill((0, 0, 0))
+        fn(surface)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(CANVAS_SIZE)
+    canvas = pygame.Surface(CANVAS_SIZE, 0, screen)
+
+    print(f"{'particles':>9} | {'per-particle ms':>15} | {'blits ms':>9} | {'speedup':>7} | {'pixels differing':>16}")
+    print("-" * 70)
+
+    for count in COUNTS:
+        manager = ParticleManager(capacity=count, seed=1)
+        fill(manager, count, 1)
+
+        old_ms = time_frames(lambda surface: draw_per_particle(manager, surface, 0, 0), canvas)
+        old_frame = pygame.surfarray.array3d(canvas)
+        new_ms = time_frames(lambda surface: manager.draw(surface, 0, 0), canvas)
+        new_frame = pygame.surfarray.array3d(canvas)
+
+        # Stamps should paint the same pixels the draw calls did
+        differing = np.count_nonzero((old_frame != new_frame).any(axis=2)) / (CANVAS_SIZE[0] * CANVAS_SIZE[1])
+
+        print(f"{count:>9} | {old_ms:>15.2f} | {new_ms:>9.2f} | {old_ms / new_ms:>6.1f}x | {100 * differing:>15.2f}%")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root
+
+import time
+from particle import ParticleManager
+
+# Cost of one ParticleManager.update() tick as the particle count grows.
+# Target: under 1 ms at 10k particles.
+
+DT = 1 / 60
+TICKS = 200
+COUNTS = [1000, 10000, 16000]
+
+
+def fill(manager, count):
+    # Long-lived particles so nothing is culled mid-measurement unless it should be
+    while len(manager) < count:
+        manager.create_death_explosion(manager.rng.uniform(0, 3500), manager.rng.uniform(0, 3500))
+    manager.life[:manager.count] = 1000.0
+    manager.size_decay[:manager.count] = 0.0
+
+
+def main():
+    print(f"{'particles':>9} | {'update ms/tick':>14} | {'with culling ms/tick':>20}")
+    print("-" * 51)
+
+    for count in COUNTS:
+        manager = ParticleManager(capacity=count, seed=1)
+        fill(manager, count)
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            manager.update(DT)
+        steady_ms = (time.perf_counter() - start) / TICKS * 1000
+
+        # Normal lifetimes: every tick some die and the rest are compacted
+        manager = ParticleManager(capacity=count, seed=1)
+        fill(manager, count)
+        manager.life[:manager.count] = manager.rng.uniform(0.8, 1.5, manager.count)
+        ticks = 0
+        start = time.perf_counter()
+        while ticks < TICKS and len(manager):
+            manager.update(DT)
+            ticks += 1
+        culling_ms = (time.perf_counter() - start) / max(1, ticks) * 1000
+
+        print(f"{count:>9} | {steady_ms:>14.3f} | {culling_ms:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
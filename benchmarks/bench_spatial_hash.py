@@ -0,0 +1,65 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root
+
+import pygame
+import random
+import time
+from spatial_hash import SpatialGroup
+
+# Compares a full-group spritecollide scan with a SpatialGroup query as the
+# crowd grows. The grid column should stay roughly flat; the scan grows linearly.
+
+WORLD_SIZE = 3500
+ENEMY_SIZE = 64
+QUERY_SIZE = 35      # About an orbital node
+QUERIES = 2000
+COUNTS = [100, 500, 1000, 2000, 5000]
+
+
+class Dummy(pygame.sprite.Sprite):
+    def __init__(self, x, y, size):
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (x, y)
+
+
+def time_queries(fn, probes):
+    start = time.perf_counter()
+    hits = 0
+    for probe in probes:
+        hits += len(fn(probe))
+    elapsed = time.perf_counter() - start
+    return elapsed / len(probes) * 1e6, hits
+
+
+def main():
+    rng = random.Random(1)
+    collided = pygame.sprite.collide_rect_ratio(0.8)
+
+    print(f"{'enemies':>8} | {'full scan us/query':>19} | {'grid us/query':>14} | {'speedup':>7}")
+    print("-" * 58)
+
+    for count in COUNTS:
+        plain_group = pygame.sprite.Group()
+        grid_group = SpatialGroup(cell_size=128)
+        for _ in range(count):
+            enemy = Dummy(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE), ENEMY_SIZE)
+            plain_group.add(enemy)
+            grid_group.add(enemy)
+
+        probes = [Dummy(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE), QUERY_SIZE) for _ in range(QUERIES)]
+
+        scan_us, scan_hits = time_queries(
+            lambda probe: pygame.sprite.spritecollide(probe, plain_group, False, collided=collided), probes)
+        grid_us, grid_hits = time_queries(
+            lambda probe: grid_group.spritecollide(probe, collided=collided), probes)
+
+        # Both paths must agree on what was hit
+        assert scan_hits == grid_hits, (scan_hits, grid_hits)
+
+        print(f"{count:>8} | {scan_us:>19.2f} | {grid_us:>14.2f} | {scan_us / grid_us:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Time to first frame of map1, decoding every asset on first use (the default)
+# versus the threaded preloader + loading screen (--preload). Each launch is a fresh process so
+# nothing is cached in ASSETS; the OS file cache is warm after the first one.
+#
+# Run it from the repo root, like the game itself (asset paths are relative):
+#     python benchmarks/bench_startup.py
+
+LAUNCHES = 5
+
+# Opens map1 headless, quits right after its first game frame and prints the
+# [STARTUP] log line
+CHILD = """
+import os, sys
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, {root!r})
+import pygame
+import presenter
+
+def flip(self):
+    pygame.display.flip()
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+presenter.Presenter.flip = flip
+import map1
+map1.main(seed=0, preload={preload})
+"""
+
+STARTUP_LINE = re.compile(r"\[STARTUP\] First frame (\d+) ms")
+PRELOAD_LINE = re.compile(r"\[PRELOAD\] (\d+) files in (\d+) ms")
+
+
+def launch(preload):
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(root=ROOT, preload=preload)],
+        capture_output=True, text=True, timeout=120,
+    ).stdout
+    first_frame = STARTUP_LINE.search(output)
+    if first_frame is None:
+        raise RuntimeError(f"map1 didn't report a first frame:\n{output}")
+    decode = PRELOAD_LINE.search(output)
+    return int(first_frame.group(1)), (int(decode.group(2)) if decode else None)
+
+
+def main():
+    launch(True)  # Warm the OS file cache so both modes read from memory
+
+    print(f"{'mode':<18} | {'first frame ms (median)':>23} | {'min':>5} | {'max':>5} | {'preload ms':>10}")
+    print("-" * 72)
+    for label, preload in (("loaded on demand", False), ("preloaded", True)):
+        runs = [launch(preload) for _ in range(LAUNCHES)]
+        frames = [first_frame for first_frame, _ in runs]
+        decodes = [decode for _, decode in runs if decode is not None]
+        decode_ms = f"{statistics.median(decodes):.0f}" if decodes else "-"
+        print(f"{label:<18} | {statistics.median(frames):>23.0f} | {min(frames):>5} | {max(frames):>5} | {decode_ms:>10}")
+
+
+if __name__ == "__main__":
+    main()
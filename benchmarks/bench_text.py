@@ -0,0 +1,94 @@
+import os
+import sys
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root
+
+import pygame
+import time
+from text_cache import TEXT, GlyphAtlas, TextLine
+
+# Per-frame text cost before and after text_cache, for what the game draws
+# every frame:
+#
+#   timer        map1/map2's MM:SS clock (changes once a second at 60 fps)
+#   walking      ts_debug's "Player: (x, y)" while walking (changes every frame)
+#   standing     the same while mostly standing (moves one frame in 60)
+#   level-up     LevelUpUI.draw's title + three upgrade labels (never change)
+#
+# "before" is font.render + blit every frame; "after" is what the game now
+# calls (GlyphAtlas.draw, TextLine.draw, or TEXT.render + blit).
+
+FRAMES = 3600   # A minute at 60 fps
+
+
+def per_frame_us(draw):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        draw(frame)
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+
+def timer_string(frame):
+    seconds = frame // 60
+    return f"{seconds // 60:02}:{seconds % 60:02}"
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1080, 720))
+    timer_font = pygame.font.SysFont("Arial", 24)
+    debug_font = pygame.font.SysFont(None, 24)
+    title_font = pygame.font.SysFont("Arial", 48, bold=True)
+    desc_font = pygame.font.SysFont("Arial", 22)
+    upgrades = ["+20 Max Health", "+5 Base Attack", "Heal 30% HP"]
+
+    timer_digits = GlyphAtlas(timer_font, (255, 255, 255))
+    position_text = TextLine(debug_font, (255, 255, 0))
+
+    def debug_string(frame):
+        return f"Player: ({1200 - 4 * (frame % 300)}, {1000 - 4 * (frame % 200)})"
+
+    def standing_string(frame):
+        return debug_string(frame // 60)
+
+    def timer_before(frame):
+        text = timer_font.render(timer_string(frame), True, (255, 255, 255))
+        screen.blit(text, text.get_rect(topright=(1070, 10)))
+
+    def timer_after(frame):
+        timer_digits.draw(screen, timer_string(frame), topright=(1070, 10))
+
+    def debug(string, before):
+        def draw(frame):
+            if before:
+                screen.blit(debug_font.render(string(frame), True, (255, 255, 0)), (10, 10))
+            else:
+                position_text.draw(screen, string(frame), topleft=(10, 10))
+        return draw
+
+    def level_up(render):
+        def draw(frame):
+            screen.blit(render(title_font, "LEVEL UP!", (255, 255, 0)), (300, 100))
+            for i, upgrade in enumerate(upgrades):
+                screen.blit(render(desc_font, upgrade, (255, 255, 255)), (340, 260 + 90 * i))
+        return draw
+
+    cases = [
+        ("timer", timer_before, timer_after),
+        ("walking", debug(debug_string, True), debug(debug_string, False)),
+        ("standing", debug(standing_string, True), debug(standing_string, False)),
+        ("level-up", level_up(lambda font, text, color: font.render(text, True, color)),
+                     level_up(lambda font, text, color: TEXT.render(font, text, True, color))),
+    ]
+
+    print(f"{'text':<9} | {'before us/frame':>15} | {'after us/frame':>14} | {'speedup':>7}")
+    print("-" * 55)
+    for label, before, after in cases:
+        before_us = per_frame_us(before)
+        after_us = per_frame_us(after)
+        print(f"{label:<9} | {before_us:>15.2f} | {after_us:>14.2f} | {before_us / after_us:>6.1f}x")
+    print(TEXT.report())
+
+
+if __name__ == "__main__":
+    main()
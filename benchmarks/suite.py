@@ -0,0 +1,339 @@
+import os
+import sys
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)  # repo root
+sys.path.append(os.path.join(ROOT, "Mushroom_Game"))  # utils, as main_menu.py sees it
+sys.path.append(os.path.join(ROOT, "Mushroom_Game", "maps", "village"))  # main_village
+
+# No window, no audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import copy
+import json
+import math
+import platform
+import random
+import time
+import tracemalloc
+import numpy as np
+import pygame
+
+from game_log import LOG, WARNING
+from weapon import MUSHROOM_SONG
+from particle import ParticleManager
+from environment import Environment
+from replay import KeyState
+from rng_service import RngService
+from simulation import Simulation, render_world, MAP1_SPAWN_TABLE
+import main_village
+import tiled_collision
+
+# Headless stress scenarios built from the real game classes. Each one reports
+# per-tick update and draw time (mean + p99, ms) and peak traced memory (KiB)
+# to JSON. With --compare, metrics that got worse than the baseline by more
+# than --threshold are flagged and the exit code is 1.
+#
+# Run it from the repo root, like the game itself (asset paths are relative):
+#     python benchmarks/suite.py --out results.json --compare benchmarks/baseline.json
+#
+# baseline.json was recorded on one machine; re-record it with --save-baseline
+# on yours before comparing. Timings on a busy or single-core machine swing
+# by more than --threshold from run to run: record and compare with
+# --repeat 3 (each metric is the median of the repeats).
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+WORLD_SIZE = 3500
+CANVAS_SIZE = (540, 360)   # map1's canvas at the default 2x zoom
+BACKGROUND_PATH = os.path.join("Images", "unnamed.jpg")
+DT = 1 / 60
+
+# Below this many ms a time difference is noise, whatever the ratio says.
+# Past it, means and p99s alike are judged by --threshold relative to the
+# baseline, so a small scenario's p99 can't hide behind a fixed allowance;
+# --repeat medians are what keep p99 noise under the threshold
+MIN_TIME_DELTA_MS = 0.05
+
+
+# --- Scenario Setup ---
+
+def make_simulation(weapon=MUSHROOM_SONG):
+    sim = Simulation(
+        WORLD_SIZE, WORLD_SIZE,
+        CANVAS_SIZE[0], CANVAS_SIZE[1],
+        weapon=copy.copy(weapon),
+        spawn_table=MAP1_SPAWN_TABLE,
+        particle_manager=ParticleManager(seed=0),
+        rngs=RngService(0),
+        base_spawn_interval=1e9,   # The scenario decides the population
+        min_spawn_interval=1e9,
+        enemy_pool_size=0,
+    )
+    # Nobody dies, so the population stays what the scenario asked for
+    sim.player.stats.base_health = sim.player.stats.current_health = 10 ** 9
+    return sim
+
+
+def populate(sim, count, radius, seed=0):
+    rng = random.Random(seed)
+    cx, cy = sim.player.pos
+    for i in range(count):
+        angle = rng.uniform(0, 2 * math.pi)
+        distance = radius * math.sqrt(rng.random())
+        enemy = sim.spawn_enemy(MAP1_SPAWN_TABLE[i % len(MAP1_SPAWN_TABLE)],
+                                cx + math.cos(angle) * distance, cy + math.sin(angle) * distance)
+        enemy.stats.max_health = enemy.stats.current_health = 10 ** 9
+
+
+def tick_forever(sim):
+    def update():
+        sim.tick(NO_KEYS)
+        if sim.state == 'level_up':
+            sim.state = 'running'
+    return update
+
+
+NO_KEYS = KeyState()
+
+
+def draw_world(sim, canvas, environment):
+    return lambda: render_world(sim, canvas, environment)
+
+
+# --- Scenarios ---
+# Each returns (update, draw); either may be None.
+
+def scenario_chase(count):
+    def setup(canvas):
+        sim = make_simulation()
+        populate(sim, count, radius=300)
+        environment = Environment(WORLD_SIZE, WORLD_SIZE, BACKGROUND_PATH)
+        return tick_forever(sim), draw_world(sim, canvas, environment)
+    return setup
+
+
+def scenario_orbitals(canvas):
+    # 20 orbitals cutting through a crowd packed inside their orbit
+    weapon = copy.copy(MUSHROOM_SONG)
+    weapon.count = 20
+    sim = make_simulation(weapon)
+    populate(sim, 2000, radius=90)
+    return tick_forever(sim), None
+
+
+def scenario_death_bursts(canvas):
+    manager = ParticleManager(seed=0)
+    rng = random.Random(0)
+    w, h = CANVAS_SIZE
+
+    def update():
+        # A wave of kills every tick
+        for _ in range(10):
+            manager.create_death_explosion(rng.uniform(0, w), rng.uniform(0, h))
+        manager.update(DT)
+
+    def draw():
+        canvas.fill((0, 0, 0))
+        manager.draw(canvas, 0, 0)
+
+    return update, draw
+
+
+def scenario_camera_draw(radius):
+    # 400: a crowd around the player, about half of it on screen
+    # 1700: the same count spread over the map, a few percent on screen
+    def setup(canvas):
+        sim = make_simulation()
+        populate(sim, 5000, radius=radius)
+        camera_x = sim.player.pos.x - CANVAS_SIZE[0] / 2
+        camera_y = sim.player.pos.y - CANVAS_SIZE[1] / 2
+
+        def draw():
+            canvas.fill((0, 0, 0))
+            sim.all_sprites.draw(canvas, camera_x, camera_y)
+
+        return None, draw
+    return setup
+
+
+def scenario_village_collision(canvas):
+    # Parsed straight from the .tmx, past load_tiled_collision's in-process and
+    # sidecar caches, so peak memory is the same whether or not the sidecar
+    # has been written yet
+    data = tiled_collision.parse_tmx(
+        os.path.abspath(main_village.get_path("maps", "village", "assets", "village_map.tmx")), ("collision", "triggers"))
+    if not data or not data["collision"]:
+        raise RuntimeError("village_map.tmx gave no collision objects")
+    collision_objects = [tiled_collision.build_object(obj) for obj in data["collision"]]
+    collision_index = main_village.CollisionIndex(collision_objects)
+
+    # A player-sized box wandering the map; one tick = the two movement checks
+    # handle_player_movement makes per frame
+    rng = random.Random(0)
+    probe = pygame.Rect(0, 0, 20, 12)
+    corners = []
+    for obj in collision_objects:
+        if obj["type"] == "rect":
+            corners += [obj["rect"].topleft, obj["rect"].bottomright]
+        else:
+            corners += obj["points"]
+    span_x = max(x for x, _ in corners)
+    span_y = max(y for _, y in corners)
+
+    def update():
+        probe.topleft = (rng.uniform(0, span_x), rng.uniform(0, span_y))
+        main_village.check_collision_with_objects(probe, collision_index)
+        probe.x += 2
+        main_village.check_collision_with_objects(probe, collision_index)
+
+    return update, None
+
+
+SCENARIOS = {
+    "chase_500": scenario_chase(500),
+    "chase_2000": scenario_chase(2000),
+    "chase_5000": scenario_chase(5000),
+    "orbitals_20": scenario_orbitals,
+    "death_bursts": scenario_death_bursts,
+    "camera_draw_5000": scenario_camera_draw(400),
+    "camera_draw_spread_5000": scenario_camera_draw(1700),
+    "village_collision": scenario_village_collision,
+}
+
+
+# --- Measuring ---
+
+def time_calls(fn, ticks):
+    times = np.empty(ticks)
+    for i in range(ticks):
+        start = time.perf_counter()
+        fn()
+        times[i] = time.perf_counter() - start
+    times *= 1000
+    return round(float(times.mean()), 4), round(float(np.percentile(times, 99)), 4)
+
+
+def run_scenario(name, setup, canvas, ticks, warmup):
+    # Memory pass: setup plus the warm-up ticks, traced
+    tracemalloc.start()
+    update, draw = setup(canvas)
+    for _ in range(warmup):
+        if update:
+            update()
+        if draw:
+            draw()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Timing pass, untraced
+    result = {"peak_mem_kib": round(peak / 1024, 1)}
+    if update:
+        result["update_ms"], result["update_p99_ms"] = time_calls(update, ticks)
+    if draw:
+        result["draw_ms"], result["draw_p99_ms"] = time_calls(draw, ticks)
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Prints a metric-by-metric comparison and returns the list of regressions."""
+    regressions = []
+    print(f"\n{'scenario':<20} {'metric':<14} {'baseline':>10} {'now':>10} {'change':>8}")
+    print("-" * 66)
+    for name, metrics in results["scenarios"].items():
+        base_metrics = baseline.get("scenarios", {}).get(name)
+        if base_metrics is None:
+            print(f"{name:<20} (not in baseline)")
+            continue
+        for metric, value in metrics.items():
+            base = base_metrics.get(metric)
+            if not base:
+                continue
+            change = (value - base) / base
+            worse = change > threshold
+            if worse and metric.endswith("_ms") and value - base < MIN_TIME_DELTA_MS:
+                worse = False
+            flag = "  REGRESSION" if worse else ""
+            print(f"{name:<20} {metric:<14} {base:>10.3f} {value:>10.3f} {100 * change:>+7.1f}%{flag}")
+            if worse:
+                regressions.append((name, metric, base, value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless performance suite")
+    parser.add_argument("--out", default="bench_results.json", help="Where to write this run's JSON")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to flag regressions against")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Also write the results to {BASELINE_PATH}")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown / growth before flagging (0.25 = 25%%)")
+    parser.add_argument("--ticks", type=int, default=300, help="Timed ticks per scenario")
+    parser.add_argument("--warmup", type=int, default=30, help="Untimed (memory-traced) ticks per scenario")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per scenario; each metric is their median")
+    parser.add_argument("--only", nargs="*", default=None, choices=sorted(SCENARIOS), help="Run just these scenarios")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    canvas = pygame.Surface(CANVAS_SIZE, 0, pygame.display.get_surface())
+    LOG.set_level(WARNING)
+    # numpy.random is imported lazily, on first use; do it now so its one-off
+    # cost isn't counted in whichever scenario happens to run first
+    np.random.default_rng(0)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "ticks": args.ticks,
+            "repeat": args.repeat,
+        },
+        "scenarios": {},
+    }
+
+    names = args.only or list(SCENARIOS)
+    runs = {name: [] for name in names}
+    elapsed = dict.fromkeys(names, 0.0)
+    # Repeats go round-robin, not back to back: a slow spell on a busy machine
+    # then lands on one repeat of several scenarios, which the median drops,
+    # instead of on every repeat of one scenario
+    for _ in range(args.repeat):
+        for name in names:
+            start = time.perf_counter()
+            runs[name].append(run_scenario(name, SCENARIOS[name], canvas, args.ticks, args.warmup))
+            elapsed[name] += time.perf_counter() - start
+
+    for name in names:
+        result = {metric: round(float(np.median([run[metric] for run in runs[name]])), 4) for metric in runs[name][0]}
+        results["scenarios"][name] = result
+        summary = ", ".join(f"{metric} {value}" for metric, value in result.items())
+        print(f"[BENCH] {name}: {summary} ({elapsed[name]:.1f}s)")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"[BENCH] Wrote {args.out}")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[BENCH] Wrote {BASELINE_PATH}")
+
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n[BENCH] {len(regressions)} regression(s) over {100 * args.threshold:.0f}%")
+            status = 1
+        else:
+            print("\n[BENCH] No regressions")
+
+    pygame.quit()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+import pygame
+
+
+class CameraGroup(pygame.sprite.Group):
+    """
+    The world's sprites, drawn relative to the camera.
+
+    With an `index` (the enemies' SwarmGroup), its members are placed,
+    interpolated and culled by the index in one pass (index.visible()), and
+    it remembers their previous positions itself (index.snapshot());
+    everything else (player, orbitals, melee) is checked one by one. Members
+    of the index must leave this group when they leave the index (kill()).
+    """
+    def __init__(self, index=None):
+        # Sprites that draw a shadow, registered once on add instead of
+        # probed with hasattr() every frame.
+        self.shadow_casters = {}
+        # Where every sprite was at the start of the last simulation tick.
+        # The renderer blends from here to the current rect.
+        self.previous_positions = {}
+        self.index = index
+        self.loose = {}       # Members not (yet) in the index; a dict keeps draw order stable
+        self.order = {}       # sprite -> when it was added, i.e. its draw order
+        self.added = 0
+        super().__init__()
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.order[sprite] = self.added
+        self.added += 1
+        if self.index is None or sprite not in self.index:
+            self.loose[sprite] = None
+        if hasattr(sprite, 'draw_shadow'):
+            self.shadow_casters[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.order.pop(sprite, None)
+        self.loose.pop(sprite, None)
+        self.shadow_casters.pop(sprite, None)
+
+    def snapshot(self):
+        if self.index is None:
+            self.previous_positions = {sprite: sprite.rect.topleft for sprite in self.sprites()}
+            return
+        self.index.snapshot()
+        self._prune_loose()
+        self.previous_positions = {sprite: sprite.rect.topleft for sprite in self.loose}
+
+    def _prune_loose(self):
+        # Sprites that joined the index after this group (spawn adds here first)
+        index = self.index
+        loose = self.loose
+        for sprite in [sprite for sprite in loose if sprite in index]:
+            del loose[sprite]
+
+    def _screen_pos(self, sprite, camera_x, camera_y, alpha):
+        world_x, world_y = sprite.rect.topleft
+
+        # Interpolate between the last two simulation states
+        if alpha < 1.0:
+            prev = self.previous_positions.get(sprite)
+            if prev is not None:
+                world_x = prev[0] + (world_x - prev[0]) * alpha
+                world_y = prev[1] + (world_y - prev[1]) * alpha
+
+        return world_x - camera_x, world_y - camera_y
+
+    def visible(self, camera_x, camera_y, view_w, view_h, alpha=1.0):
+        """
+        The members on screen, in draw order, and their (screen_x, screen_y)
+        as two parallel lists. Per-sprite tuples would hold a sprite each, and
+        a couple of thousand of those a frame keeps the cyclic GC busy.
+        """
+        if self.index is None:
+            candidates = self.sprites()
+        else:
+            self._prune_loose()
+            candidates = self.loose
+
+        sprites = []
+        positions = []
+        for sprite in candidates:
+            screen_x, screen_y = self._screen_pos(sprite, camera_x, camera_y, alpha)
+            if screen_x >= view_w or screen_y >= view_h:
+                continue
+            if screen_x + sprite.rect.width <= 0 or screen_y + sprite.rect.height <= 0:
+                continue
+            sprites.append(sprite)
+            positions.append((screen_x, screen_y))
+
+        if self.index is not None:
+            members = self.spritedict
+            indexed, indexed_positions = self.index.visible(camera_x, camera_y, view_w, view_h, alpha)
+            for sprite, position in zip(indexed, indexed_positions):
+                if sprite in members:
+                    sprites.append(sprite)
+                    positions.append(position)
+            order = self.order
+            keys = [order[sprite] for sprite in sprites]
+            by_order = sorted(range(len(keys)), key=keys.__getitem__)
+            sprites = [sprites[i] for i in by_order]
+            positions = [positions[i] for i in by_order]
+        return sprites, positions
+
+    def draw(self, surface, camera_x, camera_y, alpha=1.0):
+        view_w, view_h = surface.get_size()
+        shadow_casters = self.shadow_casters
+
+        # Send what's on screen to blits(), flushed before each shadow so it
+        # lands right under its own sprite
+        blit_sequence = []
+        sprites, positions = self.visible(camera_x, camera_y, view_w, view_h, alpha)
+        for sprite, position in zip(sprites, positions):
+            if sprite in shadow_casters:
+                surface.blits(blit_sequence, doreturn=False)
+                blit_sequence = []
+                sprite.draw_shadow(surface, *position)
+            blit_sequence.append((sprite.image, position))
+
+        surface.blits(blit_sequence, doreturn=False)
+
+def update_camera(player_rect, camera_x, camera_y, SCREEN_W, SCREEN_H, MAP_W, MAP_H, camera_smoothness):
+
+    camera_target_x = player_rect.centerx - SCREEN_W // 2
+    camera_target_y = player_rect.centery - SCREEN_H // 2
+
+    camera_target_x = max(0, min(camera_target_x, MAP_W - SCREEN_W))
+    camera_target_y = max(0, min(camera_target_y, MAP_H - SCREEN_H))
+
+    new_camera_x = camera_x + (camera_target_x - camera_x) * camera_smoothness
+    new_camera_y = camera_y + (camera_target_y - camera_y) * camera_smoothness
+
+    return new_camera_x, new_camera_y
@@ -5,14 +5,19 @@ from particle import ParticleManager
 from meeleehitbox import MeleeHitbox 
 from meleesprite import MeleeWeaponSprite
 import math
+from asset_cache import ASSETS
+from animation_bank import AnimationBank
+from game_log import LOG
+
+IDLE_SHEET_PATH = r"Images\standing.png"
+MOVING_SHEET_PATH = r"Images\moving.png"
+
 
 def load_sprite_sheet(sheet_path, frame_width, frame_height, scale):
     try:
-        sheet = pygame.image.load(sheet_path).convert_alpha()
+        sheet = ASSETS.get_surface(sheet_path)
     except pygame.error as e:
-        print(f"--- FATAL ERROR (Sprite Sheet) ---")
-        print(f"Unable to load sprite sheet image: {sheet_path}")
-        print(f"Pygame error: {e}")
+        LOG.error("--- FATAL ERROR (Sprite Sheet) --- Unable to load sprite sheet image: %s (%s)", sheet_path, e)
         return []
 
     sheet_width, sheet_height = sheet.get_size()
@@ -69,19 +74,22 @@ class Character(pygame.sprite.Sprite):
         self.flash_toggle = True
 
 
-        self.idle_frames = load_sprite_sheet("Images\standing.png", SPRITE_FRAME_W, SPRITE_FRAME_H, SPRITE_SCALE)
-        self.moving_frames = load_sprite_sheet("Images\moving.png", SPRITE_FRAME_W, SPRITE_FRAME_H, SPRITE_SCALE)
+        self.idle_frames = ASSETS.get("sheet", load_sprite_sheet, IDLE_SHEET_PATH, SPRITE_FRAME_W, SPRITE_FRAME_H, SPRITE_SCALE)
+        self.moving_frames = ASSETS.get("sheet", load_sprite_sheet, MOVING_SHEET_PATH, SPRITE_FRAME_W, SPRITE_FRAME_H, SPRITE_SCALE)
 
 
         if not self.idle_frames:
-            print("--- CHARACTER ERROR ---")
-            print("Idle frames failed to load. Using fallback red block.")
+            LOG.error("--- CHARACTER ERROR --- Idle frames failed to load. Using fallback red block.")
             self.idle_frames = [pygame.Surface((self.FRAME_WIDTH, self.FRAME_HEIGHT))]
             self.idle_frames[0].fill((255, 0, 0))
         
         if not self.moving_frames:
             self.moving_frames = self.idle_frames
 
+        # Every facing / i-frame flash combination, baked once
+        self.idle_animation = AnimationBank(self.idle_frames, flash_color=(170, 170, 170))
+        self.moving_animation = AnimationBank(self.moving_frames, flash_color=(170, 170, 170))
+
         self.image = self.idle_frames[self.frame_index]
         self.rect = self.image.get_rect(center=(int(self.pos.x), int(self.pos.y)))
 
@@ -130,7 +138,7 @@ class Character(pygame.sprite.Sprite):
 
     def equip_weapon(self, weapon_blueprint):
 
-        print(f"[EQUIP] Equipping {weapon_blueprint.name}")
+        LOG.info("[EQUIP] Equipping %s", weapon_blueprint.name)
         
         for node in self.orbitals:
             node.kill()
@@ -147,22 +155,18 @@ class Character(pygame.sprite.Sprite):
         
         elif self.active_weapon.weapon_type == "melee":
             self.attack_timer = self.active_weapon.hit_cooldown
-            print(f"Equipped melee: {self.active_weapon.name}")
+            LOG.info("Equipped melee: %s", self.active_weapon.name)
 
     def setup_orbital_weapon(self):
         if self.enemy_group is None or self.all_sprites_group is None:
-            print("--- FATAL (Character): Cannot setup orbitals, groups not set!")
+            LOG.error("--- FATAL (Character): Cannot setup orbitals, groups not set!")
             return
             
         # Load the graphic
         try:
-            image = pygame.image.load(self.active_weapon.image_path).convert_alpha()
-            w, h = image.get_size()
-            scale = self.active_weapon.scale
-            image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
+            image = ASSETS.get_image(self.active_weapon.image_path, self.active_weapon.scale)
         except Exception as e:
-            print(f"--- WEAPON ERROR: Failed to load image {self.active_weapon.image_path} ---")
-            print(e)
+            LOG.error("--- WEAPON ERROR: Failed to load image %s --- %s", self.active_weapon.image_path, e)
             image = pygame.Surface((10, 10))
             image.fill((255, 0, 255))
 
@@ -185,7 +189,7 @@ class Character(pygame.sprite.Sprite):
             self.orbitals.add(node)
             self.all_sprites_group.add(node) 
             
-        print(f"Equipped {self.active_weapon.name} with {count} nodes.")
+        LOG.info("Equipped %s with %d nodes.", self.active_weapon.name, count)
 
     def attack(self):
         if self.active_weapon is None or self.enemy_group is None:
@@ -274,23 +278,16 @@ class Character(pygame.sprite.Sprite):
             self.frame_timer = 0
             self.frame_index += 1
 
-        frames = self.moving_frames if self.is_moving else self.idle_frames
+        animation = self.moving_animation if self.is_moving else self.idle_animation
 
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
         self.collision_box.center = self.rect.center
 
-        # Make sure we don't crash if an animation list is empty
-        if not frames:
-            self.image = pygame.Surface((32, 32)) # Placeholder
-            self.image.fill((255, 0, 255)) # Bright pink error color
-        else:
-            self.frame_index %= len(frames)
-            self.image = frames[self.frame_index].copy() # .copy() is vital
-
-        if not self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
+        # Never empty: __init__ falls back to a red block
+        self.frame_index %= len(animation)
 
+        flashing = False
         if self.is_iframes:
             # Increment timers
             self.iframe_timer += dt
@@ -302,7 +299,6 @@ class Character(pygame.sprite.Sprite):
                 self.iframe_timer = 0
                 self.flash_timer = 0
                 self.flash_toggle = True  # Reset toggle
-                self.image.set_alpha(255) # Ensure visibility is reset
             
             # Handle flashing *only if* duration is not over
             else:
@@ -311,13 +307,9 @@ class Character(pygame.sprite.Sprite):
                     # Flip the flash state
                     self.flash_toggle = not self.flash_toggle
                 
-                if not self.flash_toggle:
-                    self.image.fill((170, 170, 170), special_flags=pygame.BLEND_RGB_ADD)
-                
+                flashing = not self.flash_toggle
 
-        else:
-            if self.image.get_alpha() != 255:
-                self.image.set_alpha(255)
+        self.image = animation.get(self.frame_index, self.facing_right, flashing)
         
         if self.active_weapon:
             self.attack_timer -= dt
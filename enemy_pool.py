@@ -0,0 +1,89 @@
+from mob import Enemy
+
+
+class EnemyPool:
+    """
+    Free lists of dead Enemy instances, one per mob_type. acquire() hands out
+    a pooled enemy re-spawned at a new position and level, and only builds a
+    new Enemy when that type's list is empty. Enemy.kill() puts the instance
+    back via release().
+
+    Stats per mob_type, for tuning prewarm sizes:
+    - created:    Enemies built (prewarm + misses)
+    - hits:       acquire() calls served from the free list
+    - misses:     acquire() calls that had to build a new Enemy
+    - in_use:     currently alive
+    - high_water: most alive at once (a good prewarm size)
+    """
+    def __init__(self, particle_manager):
+        self.particle_manager = particle_manager
+        self.free = {}
+        self.counters = {}
+
+    def _counters(self, mob_type):
+        counters = self.counters.get(mob_type)
+        if counters is None:
+            counters = self.counters[mob_type] = {
+                "created": 0, "hits": 0, "misses": 0, "in_use": 0, "high_water": 0,
+            }
+            self.free[mob_type] = []
+        return counters
+
+    def _build(self, spawn_entry, x, y, player_level):
+        enemy = Enemy(
+            x=x,
+            y=y,
+            player_level=player_level,
+            particle_manager=self.particle_manager,
+            **spawn_entry
+        )
+        enemy.pool = self
+        self._counters(enemy.mob_type)["created"] += 1
+        return enemy
+
+    def prewarm(self, spawn_table, count):
+        """Builds `count` dead enemies of every entry in the spawn table up front."""
+        for spawn_entry in spawn_table:
+            free = self.free.get(spawn_entry["mob_type"], [])
+            for _ in range(count - len(free)):
+                enemy = self._build(spawn_entry, 0, 0, 1)
+                self.free[enemy.mob_type].append(enemy)
+
+    def acquire(self, spawn_entry, x, y, player_level):
+        counters = self._counters(spawn_entry["mob_type"])
+        free = self.free[spawn_entry["mob_type"]]
+
+        if free:
+            enemy = free.pop()
+            enemy.respawn(x, y, player_level)
+            counters["hits"] += 1
+        else:
+            enemy = self._build(spawn_entry, x, y, player_level)
+            counters["misses"] += 1
+
+        counters["in_use"] += 1
+        counters["high_water"] = max(counters["high_water"], counters["in_use"])
+        return enemy
+
+    def release(self, enemy):
+        self.counters[enemy.mob_type]["in_use"] -= 1
+        self.free[enemy.mob_type].append(enemy)
+
+    def stats(self):
+        stats = {}
+        for mob_type, counters in self.counters.items():
+            requests = counters["hits"] + counters["misses"]
+            stats[mob_type] = {
+                **counters,
+                "pool_size": len(self.free[mob_type]),
+                "hit_rate": counters["hits"] / requests if requests else 1.0,
+            }
+        return stats
+
+    def report(self):
+        lines = ["[POOL] Enemy pool"]
+        for mob_type, stats in self.stats().items():
+            lines.append(f"[POOL]   {mob_type}: {stats['pool_size']} free, {stats['in_use']} alive, "
+                         f"high-water {stats['high_water']}, {stats['created']} created, "
+                         f"{100 * stats['hit_rate']:.1f}% hit rate")
+        return "\n".join(lines)
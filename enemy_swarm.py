@@ -0,0 +1,323 @@
+import numpy as np
+import pygame
+
+
+class EnemySwarm:
+    """
+    Structure-of-arrays mirror of every live Enemy in a map. Aggro, steering,
+    integration, animation and the player-contact test run as one vectorised
+    step per tick; the Enemy sprites are only told where they ended up when
+    something looks at them (sync(), e.g. through a SwarmGroup query).
+
+    Rows are kept packed: removing an enemy moves the last row into its slot,
+    so rows [0, count) are always the live enemies and `enemies[i]` is the
+    sprite for row i.
+
+    While an enemy is in a swarm, the swarm owns its position, velocity,
+    rect, animation and touch-damage cooldown. Its sprite's own state, vel,
+    frame_index, facing_right and last_anim_update are left stale meanwhile.
+    """
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.enemies = []
+        # Enemies damaged since their hit flash last ended: the only ones that
+        # can have died or need per-tick flash timers (Enemy.take_damage adds them)
+        self.struck = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        def grow(old, shape, dtype):
+            new = np.zeros(shape, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        self.capacity = capacity
+        self.pos = grow(getattr(self, "pos", None), (capacity, 2), np.float64)
+        self.vel = grow(getattr(self, "vel", None), (capacity, 2), np.float64)
+        self.speed = grow(getattr(self, "speed", None), capacity, np.float64)
+        self.aggro_range = grow(getattr(self, "aggro_range", None), capacity, np.float64)
+        self.touch_timer = grow(getattr(self, "touch_timer", None), capacity, np.float64)
+        self.touch_cooldown = grow(getattr(self, "touch_cooldown", None), capacity, np.float64)
+        # Integer sizes of each enemy's collision box
+        self.box_size = grow(getattr(self, "box_size", None), (capacity, 2), np.int64)
+        # Integer rect centre (rounded like pygame's), rect corners now and at the last snapshot()
+        self.center = grow(getattr(self, "center", None), (capacity, 2), np.int64)
+        self.rect_size = grow(getattr(self, "rect_size", None), (capacity, 2), np.int64)
+        self.topleft = grow(getattr(self, "topleft", None), (capacity, 2), np.int64)
+        self.prev_topleft = grow(getattr(self, "prev_topleft", None), (capacity, 2), np.int64)
+        # Enemy.animate()'s state
+        self.chasing = grow(getattr(self, "chasing", None), capacity, bool)
+        self.frame = grow(getattr(self, "frame", None), capacity, np.int64)
+        self.frame_count = grow(getattr(self, "frame_count", None), capacity, np.int64)
+        self.facing_right = grow(getattr(self, "facing_right", None), capacity, bool)
+        self.anim_last = grow(getattr(self, "anim_last", None), capacity, np.float64)
+        self.anim_speed = grow(getattr(self, "anim_speed", None), capacity, np.float64)
+        # Whether the sprite already shows the row's current state
+        self.synced = grow(getattr(self, "synced", None), capacity, bool)
+        # Added since the last snapshot(): no previous rect to draw from yet
+        self.fresh = grow(getattr(self, "fresh", None), capacity, bool)
+
+        self.rows = (self.pos, self.vel, self.speed, self.aggro_range, self.touch_timer, self.touch_cooldown,
+                     self.box_size, self.center, self.rect_size, self.topleft, self.prev_topleft,
+                     self.chasing, self.frame, self.frame_count, self.facing_right, self.anim_last,
+                     self.anim_speed, self.synced, self.fresh)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, enemy):
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        i = self.count
+        self.pos[i] = (enemy.pos.x, enemy.pos.y)
+        self.vel[i] = (enemy.vel.x, enemy.vel.y)
+        self.speed[i] = enemy.stats.speed
+        self.aggro_range[i] = enemy.stats.aggro_range
+        self.touch_timer[i] = enemy.touch_damage_timer
+        self.touch_cooldown[i] = enemy.touch_damage_cooldown
+        self.box_size[i] = enemy.collision_box.size
+        self.center[i] = enemy.rect.center
+        self.rect_size[i] = enemy.rect.size
+        self.topleft[i] = self.prev_topleft[i] = enemy.rect.topleft
+        self.chasing[i] = enemy.state == 'chasing'
+        self.frame[i] = enemy.frame_index
+        self.frame_count[i] = len(enemy.animation)
+        self.facing_right[i] = enemy.facing_right
+        self.anim_last[i] = enemy.last_anim_update
+        self.anim_speed[i] = enemy.anim_speed
+        self.synced[i] = True
+        self.fresh[i] = True
+
+        self.enemies.append(enemy)
+        enemy.swarm = self
+        enemy.swarm_index = i
+        self.count += 1
+
+    def remove(self, enemy):
+        i = enemy.swarm_index
+        last = self.count - 1
+
+        if i != last:
+            # Move the last row into the hole
+            for array in self.rows:
+                array[i] = array[last]
+            moved = self.enemies[last]
+            self.enemies[i] = moved
+            moved.swarm_index = i
+
+        self.enemies.pop()
+        self.struck.pop(enemy, None)
+        self.count -= 1
+        enemy.swarm = None
+        enemy.swarm_index = -1
+
+    def snapshot(self):
+        """Remembers every row's rect, for drawing between this tick and the next."""
+        n = self.count
+        self.prev_topleft[:n] = self.topleft[:n]
+        self.fresh[:n] = False
+
+    def animate(self, now):
+        """
+        Enemy.animate() for every row, at simulation time `now` (ms). Like
+        the per-sprite version it reads last tick's state and velocity, so
+        call it before step().
+        """
+        n = self.count
+        chasing = self.chasing[:n]
+        frame = self.frame[:n]
+        facing_right = self.facing_right[:n]
+
+        due = np.flatnonzero(chasing & (now - self.anim_last[:n] > self.anim_speed[:n]))
+        self.anim_last[due] = now
+        frame[due] = (frame[due] + 1) % self.frame_count[due]
+        facing_right[due] = self.vel[due, 0] >= 0
+
+        idle = ~chasing
+        frame[idle] = 0
+        facing_right[idle] = True
+
+    def step(self, dt, target):
+        """
+        Advances every row by dt toward `target` (the player's rect centre).
+        Returns a bool per row for whether it is chasing.
+        """
+        n = self.count
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        timer = self.touch_timer[:n]
+        self.synced[:n] = False
+
+        np.subtract(timer, dt, out=timer, where=timer > 0)
+
+        # --- Aggro + steering ---
+        offset = np.asarray(target, dtype=np.float64) - pos
+        dist = np.hypot(offset[:, 0], offset[:, 1])
+        chasing = dist <= self.aggro_range[:n]
+
+        # Enemies sitting exactly on the player stop, like normalize()'s ValueError did
+        moving = chasing & (dist > 0)
+        scale = np.zeros(n)
+        np.divide(self.speed[:n], dist, out=scale, where=moving)
+        np.multiply(offset, scale[:, None], out=vel)
+
+        # --- Integration ---
+        pos += vel * dt
+
+        # Same integer centres pygame would build: rect.center rounds half away from zero.
+        # Kept for contacts(), queries and the sprite sync, so rects don't have to round again
+        center = self.center[:n]
+        center[:] = np.trunc(pos + np.copysign(0.5, pos))
+        size = self.rect_size[:n]
+        np.subtract(center, size // 2, out=self.topleft[:n])
+
+        self.chasing[:n] = chasing
+        return chasing
+
+    def contacts(self, player_hitbox):
+        """
+        Row indices whose collision box touches player_hitbox and whose touch
+        damage is off cooldown; their cooldown restarts. Call after step().
+        """
+        n = self.count
+        timer = self.touch_timer[:n]
+        box = self.box_size[:n]
+        left = self.center[:n] - box // 2
+        right = left + box
+
+        touching = (
+            (left[:, 0] < player_hitbox.right) & (right[:, 0] > player_hitbox.left) &
+            (left[:, 1] < player_hitbox.bottom) & (right[:, 1] > player_hitbox.top) &
+            (timer <= 0)
+        )
+        touching_rows = np.flatnonzero(touching)
+        timer[touching_rows] = self.touch_cooldown[:n][touching_rows]
+
+        return touching_rows
+
+    def overlapping(self, rect, ratio=1.0):
+        """
+        Row indices whose rect overlaps `rect` (pygame's colliderect), in row
+        order. With a ratio, the rows' rects are first scaled about their
+        centres to the same integers pygame.sprite.collide_rect_ratio gets.
+        """
+        n = self.count
+        topleft = self.topleft[:n]
+        size = self.rect_size[:n]
+        if ratio != 1.0:
+            # Rect.inflate() truncates its arguments and moves by half of them, rounded toward zero
+            inflate = np.trunc(size * ratio - size).astype(np.int64)
+            topleft = topleft - np.trunc(inflate / 2).astype(np.int64)
+            size = size + inflate
+        left, top = topleft.T
+        width, height = size.T
+        return np.flatnonzero(
+            (left < rect.right) & (left + width > rect.left) &
+            (top < rect.bottom) & (top + height > rect.top)
+        )
+
+    def sync(self, rows):
+        """Brings the sprites of `rows` up to date with their rows (see Enemy.sync_from_swarm)."""
+        rows = rows[~self.synced[rows]]
+        if not len(rows):
+            return
+        self.synced[rows] = True
+        enemies = self.enemies
+        pos = self.pos[rows]
+        center = self.center[rows]
+        # Flat columns: a list per row would be a few thousand GC-tracked objects a frame
+        for i, x, y, center_x, center_y, frame, facing_right in zip(
+                rows.tolist(), pos[:, 0].tolist(), pos[:, 1].tolist(), center[:, 0].tolist(), center[:, 1].tolist(),
+                self.frame[rows].tolist(), self.facing_right[rows].tolist()):
+            enemies[i].sync_from_swarm(x, y, (center_x, center_y), frame, facing_right)
+
+    def sync_enemy(self, enemy):
+        self.sync(np.array([enemy.swarm_index]))
+
+    def on_screen(self, camera_x, camera_y, view_w, view_h, alpha=1.0):
+        """
+        Rows whose rect, `alpha` of the way from its last snapshot() to now,
+        lands inside the view, and those rects' (x, y) relative to the camera.
+        Rows added since the snapshot are placed where they are now.
+        """
+        n = self.count
+        topleft = self.topleft[:n]
+        if alpha < 1.0:
+            prev = self.prev_topleft[:n]
+            topleft = np.where(self.fresh[:n, None], topleft, prev + (topleft - prev) * alpha)
+        screen = topleft - (camera_x, camera_y)
+
+        size = self.rect_size[:n]
+        rows = np.flatnonzero(
+            (screen[:, 0] < view_w) & (screen[:, 1] < view_h) &
+            (screen[:, 0] + size[:, 0] > 0) & (screen[:, 1] + size[:, 1] > 0)
+        )
+        return rows, screen[rows]
+
+
+class SwarmGroup(pygame.sprite.Group):
+    """
+    The sprite group for a swarm's enemies, with SpatialGroup's queries.
+    They test the swarm's rect arrays directly, so moving the crowd costs
+    no per-sprite bookkeeping, and only the enemies a query hands back (the
+    ones under a weapon, or on screen via visible()) have their sprites synced.
+    """
+    def __init__(self, swarm):
+        self.swarm = swarm
+        super().__init__()
+
+    def _handout(self, rows):
+        swarm = self.swarm
+        swarm.sync(rows)
+        enemies = swarm.enemies
+        return [enemies[i] for i in rows.tolist()]
+
+    def query_rect(self, rect):
+        return self._handout(self.swarm.overlapping(rect))
+
+    def _colliding_rows(self, sprite, collided):
+        """Rows that collided(sprite, enemy) would pick, for the tests the arrays can run; else None."""
+        if collided is None:
+            return self.swarm.overlapping(sprite.rect)
+        if isinstance(collided, pygame.sprite.collide_rect_ratio):
+            ratio = collided.ratio
+            width, height = sprite.rect.size
+            probe = sprite.rect.inflate(width * ratio - width, height * ratio - height)
+            return self.swarm.overlapping(probe, ratio)
+        return None
+
+    def spritecollide(self, sprite, collided=None):
+        """
+        Same result as pygame.sprite.spritecollide(sprite, self, False, collided)
+        for any collided test that stays inside the two rects (collide_rect,
+        collide_rect_ratio below 1, collide_mask). Rect and rect-ratio tests
+        run on the arrays, so only the enemies hit get synced.
+        """
+        rows = self._colliding_rows(sprite, collided)
+        if rows is not None:
+            return self._handout(rows)
+        return [other for other in self.query_rect(sprite.rect) if collided(sprite, other)]
+
+    def spritecollideany(self, sprite, collided=None):
+        """The first enemy spritecollide() would return, or None."""
+        rows = self._colliding_rows(sprite, collided)
+        if rows is not None:
+            hits = self._handout(rows[:1])
+            return hits[0] if hits else None
+        for other in self.query_rect(sprite.rect):
+            if collided(sprite, other):
+                return other
+        return None
+
+    def snapshot(self):
+        self.swarm.snapshot()
+
+    def visible(self, camera_x, camera_y, view_w, view_h, alpha=1.0):
+        """CameraGroup's index hook: the enemies on screen, synced for drawing, and their (screen_x, screen_y)."""
+        swarm = self.swarm
+        rows, screen = swarm.on_screen(camera_x, camera_y, view_w, view_h, alpha)
+        swarm.sync(rows)
+        enemies = swarm.enemies
+        return [enemies[i] for i in rows.tolist()], list(zip(screen[:, 0].tolist(), screen[:, 1].tolist()))
@@ -1,35 +1,109 @@
 import pygame
+import math
+from asset_cache import ASSETS
+from collections import OrderedDict
+from game_log import LOG
 
 class Environment:
-    def __init__(self, world_width, world_height, background_path):
+    def __init__(self, world_width, world_height, background_path, chunk_size=512, max_cache_bytes=16 * 1024 * 1024):
         """
         Initializes the environment's properties and loads its assets.
         world_width and world_height now refer to the size of the *full map*.
+
+        The background is never scaled to world size in one go. It is cut into
+        chunk_size x chunk_size world-space chunks that are scaled from the
+        source image the first time the camera sees them, and kept in an LRU
+        cache capped at max_cache_bytes.
         """
         self.world_width = world_width
         self.world_height = world_height
         self.background_asset_path = background_path
-        
-        # Load and scale the background surface to WORLD size
+
+        self.chunk_size = chunk_size
+        self.max_cache_bytes = max_cache_bytes
+        self.chunk_cache = OrderedDict()  # (cx, cy) -> Surface, oldest first
+        self.cache_bytes = 0
+
+        # Load the (unscaled) background source image
         self.load_background()
 
     def load_background(self):
         try:
-            # Load the original image
-            original_background = pygame.image.load(self.background_asset_path).convert()
-            # Scale it to the full world dimensions
-            self.background = pygame.transform.scale(original_background, (self.world_width, self.world_height))
-            print(f"Loaded background: {self.background_asset_path} and scaled to {self.world_width}x{self.world_height}")
+            # Load the original image; chunks are scaled from it on demand
+            self.source = ASSETS.get_surface(self.background_asset_path, alpha=False)
+            self.scale_x = self.world_width / self.source.get_width()
+            self.scale_y = self.world_height / self.source.get_height()
+            LOG.info("Loaded background: %s (%dpx chunks over %dx%d)", self.background_asset_path, self.chunk_size, self.world_width, self.world_height)
         except pygame.error as e:
-            print(f"--- FATAL ERROR (Environment) ---")
-            print(f"Unable to load background image: {self.background_asset_path}")
-            print(f"Pygame error: {e}")
-            print("Using a solid black fallback for world map.")
-            self.background = pygame.Surface((self.world_width, self.world_height))
-            self.background.fill((0, 0, 0))
+            LOG.error("--- FATAL ERROR (Environment) --- Unable to load background image: %s (%s). "
+                      "Using a solid black fallback for world map.", self.background_asset_path, e)
+            self.source = None
+
+    def build_chunk(self, cx, cy):
+        size = self.chunk_size
+        world_x = cx * size
+        world_y = cy * size
+        width = min(size, self.world_width - world_x)
+        height = min(size, self.world_height - world_y)
+
+        chunk = pygame.Surface((width, height)).convert()
+
+        if self.source is None:
+            chunk.fill((0, 0, 0))
+            return chunk
+
+        # Source pixels this chunk needs, widened to whole pixels
+        src_x0 = math.floor(world_x / self.scale_x)
+        src_y0 = math.floor(world_y / self.scale_y)
+        src_x1 = min(self.source.get_width(), math.ceil((world_x + width) / self.scale_x))
+        src_y1 = min(self.source.get_height(), math.ceil((world_y + height) / self.scale_y))
+
+        region = self.source.subsurface(pygame.Rect(src_x0, src_y0, src_x1 - src_x0, src_y1 - src_y0))
+        scaled = pygame.transform.scale(region, (
+            max(1, round((src_x1 - src_x0) * self.scale_x)),
+            max(1, round((src_y1 - src_y0) * self.scale_y))
+        ))
+
+        # The widened region starts slightly before the chunk; shift it back
+        chunk.blit(scaled, (round(src_x0 * self.scale_x) - world_x, round(src_y0 * self.scale_y) - world_y))
+        return chunk
+
+    def get_chunk(self, cx, cy):
+        chunk = self.chunk_cache.get((cx, cy))
+        if chunk is not None:
+            self.chunk_cache.move_to_end((cx, cy))
+            return chunk
+
+        chunk = self.build_chunk(cx, cy)
+        self.chunk_cache[(cx, cy)] = chunk
+        self.cache_bytes += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+        # Evict least recently drawn chunks, but never the one just built
+        while self.cache_bytes > self.max_cache_bytes and len(self.chunk_cache) > 1:
+            _, old_chunk = self.chunk_cache.popitem(last=False)
+            self.cache_bytes -= old_chunk.get_width() * old_chunk.get_height() * old_chunk.get_bytesize()
+
+        return chunk
 
     def update(self):
         pass
 
     def draw(self, screen_surface, camera_offset_x, camera_offset_y):
-        screen_surface.blit(self.background, (-camera_offset_x, -camera_offset_y))
\ No newline at end of file
+        view_w, view_h = screen_surface.get_size()
+        size = self.chunk_size
+
+        # One integer offset for every chunk so neighbours can't drift apart
+        offset_x = math.floor(camera_offset_x)
+        offset_y = math.floor(camera_offset_y)
+
+        first_cx = max(0, offset_x // size)
+        first_cy = max(0, offset_y // size)
+        last_cx = min((self.world_width - 1) // size, (offset_x + view_w - 1) // size)
+        last_cy = min((self.world_height - 1) // size, (offset_y + view_h - 1) // size)
+
+        blit_sequence = []
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                blit_sequence.append((self.get_chunk(cx, cy), (cx * size - offset_x, cy * size - offset_y)))
+
+        screen_surface.blits(blit_sequence, doreturn=False)
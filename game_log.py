@@ -0,0 +1,125 @@
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+# --- Levels ---
+DEBUG = 10     # Per-hit combat lines and other per-tick chatter
+INFO = 20      # Game events: level ups, equips, game over
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR}
+
+
+def parse_level(level):
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVEL_NAMES[level.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {level} (valid: {', '.join(LEVEL_NAMES)})")
+
+
+class Logger:
+    """
+    Printing, but off the hot path.
+
+    A call below the current level returns after one comparison: the message
+    is never formatted, so pass values as %-style args rather than building an
+    f-string, e.g. LOG.debug("%s takes %d damage", name, amount).
+
+    Enabled records (message + args, still unformatted) go into a ring buffer.
+    A background thread formats and writes them every flush_interval seconds,
+    so the game never blocks on a slow terminal or pipe. If the buffer fills
+    faster than it drains, the oldest records are dropped and counted.
+    """
+    def __init__(self, level=INFO, capacity=4096, flush_interval=0.1, stream=None):
+        self.level = parse_level(level)
+        self.buffer = deque(maxlen=capacity)
+        self.flush_interval = flush_interval
+        self.stream = stream   # None: whatever sys.stdout is at flush time
+        self.dropped = 0
+
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def set_level(self, level):
+        self.level = parse_level(level)
+
+    def is_enabled(self, level):
+        return level >= self.level
+
+    def debug(self, message, *args):
+        if self.level <= DEBUG:
+            self.emit(DEBUG, message, args)
+
+    def info(self, message, *args):
+        if self.level <= INFO:
+            self.emit(INFO, message, args)
+
+    def warning(self, message, *args):
+        if self.level <= WARNING:
+            self.emit(WARNING, message, args)
+
+    def error(self, message, *args):
+        if self.level <= ERROR:
+            self.emit(ERROR, message, args)
+
+    def emit(self, level, message, args):
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append((time.time(), level, message, args))
+
+        if self._thread is None:
+            self.start()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="game-log-flush", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Formats and writes everything buffered so far. Safe to call from any thread."""
+        with self._flush_lock:
+            lines = []
+            if self.dropped:
+                lines.append(f"[LOG] Dropped {self.dropped} records (buffer full)")
+                self.dropped = 0
+
+            buffer = self.buffer
+            while buffer:
+                try:
+                    _, _, message, args = buffer.popleft()
+                except IndexError:
+                    break
+                lines.append(message % args if args else message)
+
+            if not lines:
+                return
+
+            stream = self.stream or sys.stdout
+            try:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except (OSError, ValueError):
+                # Stream closed or gone (e.g. shutting down); nothing useful left to do
+                pass
+
+
+def level_from_env(default=INFO):
+    level = os.environ.get("GAME_LOG_LEVEL")
+    return parse_level(level) if level else default
+
+
+# The one logger everything in the process shares
+LOG = Logger(level=level_from_env())
+atexit.register(LOG.flush)
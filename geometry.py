@@ -0,0 +1,156 @@
+import numpy as np
+
+# --- Rect vs Polygon ---
+# A rect and a polygon overlap when some polygon edge passes through the
+# rect, or the rect sits wholly inside the polygon. The edge test is a
+# separating-axis test per edge (segment vs box: the x axis, the y axis and
+# the edge's normal), done for all edges at once; the inside case is one
+# point-in-polygon test of the rect's centre.
+#
+# Rects are the open box (left, right) x (top, bottom), like colliderect:
+# a box that only touches the outline doesn't collide, so the player can
+# slide along a wall. Polygons can be concave; Tiled closes them.
+
+
+def rect_array(rects):
+    """pygame Rects or (x, y, w, h) tuples -> float (n, 4) array of left, top, right, bottom."""
+    boxes = np.array([tuple(rect) for rect in rects], dtype=float).reshape(-1, 4)
+    boxes[:, 2] += boxes[:, 0]
+    boxes[:, 3] += boxes[:, 1]
+    return boxes
+
+
+def edges_hit_boxes(edges, boxes):
+    """
+    (boxes, edges) bool array: does edge e pass through the open box b?
+    boxes is an (n, 4) array from rect_array.
+    """
+    left, top, right, bottom = (boxes[:, i:i + 1] for i in range(4))
+
+    overlap = (edges.max_x > left) & (edges.min_x < right) & (edges.max_y > top) & (edges.min_y < bottom)
+
+    # Normal axis: the box's projected half-width against the centre's distance from the edge's line
+    half_w = (right - left) / 2
+    half_h = (bottom - top) / 2
+    distance = edges.nx * (left + half_w) + edges.ny * (top + half_h) - edges.offset
+    radius = half_w * edges.abs_nx + half_h * edges.abs_ny
+    return overlap & (np.abs(distance) < radius)
+
+
+def crossings(edges, px, py):
+    """(points, edges) bool array: does a ray from (px, py) towards +x cross edge e? Even-odd rule."""
+    px = px[:, None]
+    py = py[:, None]
+    straddles = (edges.y0 > py) != (edges.y1 > py)
+    return straddles & (px < edges.x0 + (py - edges.y0) * edges.slope)
+
+
+class Edges:
+    """Edge arrays of one or more closed polygons, precomputed once."""
+    def __init__(self, polygons):
+        starts = [np.asarray(points, dtype=float).reshape(-1, 2) for points in polygons]
+        ends = [np.roll(points, -1, axis=0) for points in starts]
+        start = np.concatenate(starts) if starts else np.zeros((0, 2))
+        end = np.concatenate(ends) if ends else np.zeros((0, 2))
+        owner = np.repeat(np.arange(len(starts)), [len(points) for points in starts])
+
+        # A repeated vertex makes a zero-length edge; its neighbours already cover that point
+        keep = np.any(start != end, axis=1)
+        start, end, self.owner = start[keep], end[keep], owner[keep]
+
+        self.x0, self.y0 = start[:, 0], start[:, 1]
+        self.x1, self.y1 = end[:, 0], end[:, 1]
+        self.min_x, self.max_x = np.minimum(self.x0, self.x1), np.maximum(self.x0, self.x1)
+        self.min_y, self.max_y = np.minimum(self.y0, self.y1), np.maximum(self.y0, self.y1)
+        self.nx = -(self.y1 - self.y0)
+        self.ny = self.x1 - self.x0
+        self.abs_nx, self.abs_ny = np.abs(self.nx), np.abs(self.ny)
+        self.offset = self.nx * self.x0 + self.ny * self.y0  # Each edge's line: n . p == offset
+
+        # dx/dy for the point-in-polygon ray; horizontal edges never straddle a ray, 0 keeps them finite
+        flat = self.nx == 0
+        self.slope = np.where(flat, 0.0, self.ny / np.where(flat, 1.0, -self.nx))
+
+    def __len__(self):
+        return len(self.x0)
+
+
+class Polygon:
+    """
+    One polygon (e.g. a Tiled collision object) with its edges precomputed.
+
+        collide_rect(rect)     one box     -> bool
+        collide_rects(rects)   many boxes  -> bool array, one per box
+        contains(x, y)         point (inside or not; the outline itself is either)
+    """
+    def __init__(self, points):
+        self.points = [(float(x), float(y)) for x, y in points]
+        self.edges = Edges([self.points])
+        xs = [x for x, _ in self.points]
+        ys = [y for _, y in self.points]
+        self.bounds = (min(xs), min(ys), max(xs), max(ys))
+
+    def __len__(self):
+        return len(self.points)
+
+    def collide_rect(self, rect):
+        left, top, width, height = rect
+        min_x, min_y, max_x, max_y = self.bounds
+        right, bottom = left + width, top + height
+        # Plain-Python reject first: most calls are boxes nowhere near it
+        if width <= 0 or height <= 0 or left >= max_x or right <= min_x or top >= max_y or bottom <= min_y:
+            return False
+
+        # edges_hit_boxes for one box, on scalars (at Tiled polygon sizes NumPy's
+        # per-call cost is the whole bill, so: fewest array ops, no reductions
+        # but the one count)
+        edges = self.edges
+        half_w, half_h = width / 2, height / 2
+        center_x, center_y = left + half_w, top + half_h
+        hit = (edges.max_x > left) & (edges.min_x < right) & (edges.max_y > top) & (edges.min_y < bottom)
+        hit &= np.abs(edges.nx * center_x + edges.ny * center_y - edges.offset) < half_w * edges.abs_nx + half_h * edges.abs_ny
+        if np.count_nonzero(hit):
+            return True
+        return self.contains(center_x, center_y)
+
+    def collide_rects(self, rects):
+        boxes = rects if isinstance(rects, np.ndarray) else rect_array(rects)
+        if not len(boxes):
+            return np.zeros(0, dtype=bool)
+        hit = edges_hit_boxes(self.edges, boxes).any(axis=1)
+        inside = crossings(self.edges, (boxes[:, 0] + boxes[:, 2]) / 2, (boxes[:, 1] + boxes[:, 3]) / 2).sum(axis=1) % 2 == 1
+        solid = (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
+        return (hit | inside) & solid
+
+    def contains(self, x, y):
+        edges = self.edges
+        straddles = (edges.y0 > y) != (edges.y1 > y)
+        return bool(np.count_nonzero(straddles & (x < edges.x0 + (y - edges.y0) * edges.slope)) % 2)
+
+
+class PolygonBatch:
+    """
+    Many polygons' edges in one set of arrays, for one box against all of them
+    in a single pass. collide_rect(rect) -> bool array, one per polygon.
+    """
+    def __init__(self, polygons):
+        self.polygons = [polygon if isinstance(polygon, Polygon) else Polygon(polygon) for polygon in polygons]
+        self.edges = Edges([polygon.points for polygon in self.polygons])
+
+    def __len__(self):
+        return len(self.polygons)
+
+    def collide_rect(self, rect):
+        count = len(self.polygons)
+        boxes = rect_array((rect,))
+        left, top, right, bottom = boxes[0]
+        if right <= left or bottom <= top or not count:
+            return np.zeros(count, dtype=bool)
+
+        hit = np.bincount(self.edges.owner, edges_hit_boxes(self.edges, boxes)[0], minlength=count) > 0
+        cross = crossings(self.edges, np.array([(left + right) / 2]), np.array([(top + bottom) / 2]))[0]
+        inside = np.bincount(self.edges.owner, cross, minlength=count) % 2 == 1
+        return hit | inside
+
+    def any_rect(self, rect):
+        return bool(self.collide_rect(rect).any())
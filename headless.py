@@ -0,0 +1,412 @@
+import os
+
+# Must be set before pygame opens a window or an audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# SDL otherwise swallows SIGTERM/SIGINT, which leaves Pool workers unkillable
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+
+import pygame
+import sys
+import argparse
+import contextlib
+import copy
+import csv
+import json
+import math
+import multiprocessing
+import random
+import time
+import numpy as np
+import mobStats
+from weapon import MUSHROOM_SONG, STORM_BLADE
+from UIManager import LevelUpUI
+from asset_cache import ASSETS
+from particle import ParticleManager
+from game_log import LOG, DEBUG, WARNING
+from rng_service import RngService
+from replay import KeyState, InputRecorder, InputReplay, describe_simulation
+from simulation import Simulation, MAP1_SPAWN_TABLE, MAP2_SPAWN_TABLE
+
+# Everything that differs between the survival maps, minus the rendering
+MAP_CONFIGS = {
+    "map1": {"weapon": MUSHROOM_SONG, "spawn_table": MAP1_SPAWN_TABLE},
+    "map2": {"weapon": STORM_BLADE, "spawn_table": MAP2_SPAWN_TABLE},
+}
+
+WORLD_WIDTH, WORLD_HEIGHT = 3500, 3500
+VIEW_WIDTH, VIEW_HEIGHT = 540, 360  # Same canvas as map1/map2 at 2x zoom
+
+REPORT_FIELDS = [
+    "run", "map", "policy", "seed", "score", "time_survived", "kills",
+    "level", "peak_enemies", "ticks", "tick_mean_ms", "tick_p99_ms", "tick_max_ms", "wall_time",
+    "pool_hit_rate", "pool_high_water",
+]
+
+
+# --- Bot Policies ---
+class BotPolicy:
+    name = "idle"
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def get_keys(self, sim):
+        return KeyState()
+
+    def choose_upgrade(self, options):
+        return 0
+
+    @staticmethod
+    def keys_for_direction(dx, dy):
+        keys = KeyState()
+        keys[pygame.K_d] = dx > 0.3
+        keys[pygame.K_a] = dx < -0.3
+        keys[pygame.K_s] = dy > 0.3
+        keys[pygame.K_w] = dy < -0.3
+        return keys
+
+
+class RandomWalkPolicy(BotPolicy):
+    name = "random_walk"
+
+    def __init__(self, rng, hold_ticks=30):
+        super().__init__(rng)
+        self.hold_ticks = hold_ticks
+        self.ticks_left = 0
+        self.keys = KeyState()
+
+    def get_keys(self, sim):
+        if self.ticks_left <= 0:
+            self.ticks_left = self.hold_ticks
+            angle = self.rng.uniform(0, 2 * math.pi)
+            self.keys = self.keys_for_direction(math.cos(angle), math.sin(angle))
+        self.ticks_left -= 1
+        return self.keys
+
+    def choose_upgrade(self, options):
+        return self.rng.randrange(len(options))
+
+
+class KitePolicy(BotPolicy):
+    """Runs away from the crowd's centre of mass and steers back from the world edge."""
+    name = "kite"
+
+    def get_keys(self, sim):
+        player = sim.player
+        swarm = sim.swarm # Enemy sprites are only synced when drawn; the swarm is always current
+        offset = np.array((player.pos.x, player.pos.y)) - swarm.pos[:swarm.count]
+        dist_sq = np.einsum("ij,ij->i", offset, offset)
+        near = (dist_sq > 0) & (dist_sq < 300 * 300)
+        dx, dy = (offset[near] / dist_sq[near, None]).sum(axis=0).tolist()
+
+        # Push back toward the middle when close to a wall
+        margin = 400
+        if player.pos.x < margin: dx += 1
+        if player.pos.x > sim.world_width - margin: dx -= 1
+        if player.pos.y < margin: dy += 1
+        if player.pos.y > sim.world_height - margin: dy -= 1
+
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return KeyState()
+        return self.keys_for_direction(dx / length, dy / length)
+
+
+POLICIES = {policy.name: policy for policy in (BotPolicy, RandomWalkPolicy, KitePolicy)}
+
+
+def apply_mob_overrides(overrides):
+    """overrides looks like {"slime": {"speed": 80}}; patched in place for this process only."""
+    for mob_type, fields in overrides.items():
+        if mob_type not in mobStats.MOB_DATA:
+            raise ValueError(f"Unknown mob_type in override: {mob_type}")
+        mobStats.MOB_DATA[mob_type] = {**mobStats.MOB_DATA[mob_type], **fields}
+
+
+def init_headless():
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        # convert()/convert_alpha() need a display mode, even a dummy one
+        pygame.display.set_mode((1, 1))
+    ASSETS.use_pack()
+
+
+def run_survival(config):
+    """
+    Plays one survival run to completion as fast as the CPU allows and returns
+    a flat result dict. `config` must be picklable so it can cross a Pool.
+    """
+    init_headless()
+
+    map_config = MAP_CONFIGS[config.get("map", "map1")]
+    seed = config.get("seed", 0)
+    max_time = config.get("max_time", 900.0)
+    rngs = RngService(seed)
+
+    apply_mob_overrides(config.get("mob_overrides", {}))
+
+    policy_class = POLICIES[config.get("policy", "kite")]
+    # The bot stands in for the player, so it gets its own generator outside the run's streams
+    policy = policy_class(random.Random(seed))
+
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+        if config.get("verbose", False):
+            LOG.set_level(DEBUG)
+        else:
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+            # Skip formatting the combat log entirely, not just its output
+            LOG.set_level(WARNING)
+
+        sim = Simulation(
+            WORLD_WIDTH, WORLD_HEIGHT,
+            VIEW_WIDTH, VIEW_HEIGHT,
+            # Upgrades mutate the blueprint, so each run gets its own
+            weapon=copy.copy(map_config["weapon"]),
+            spawn_table=map_config["spawn_table"],
+            particle_manager=ParticleManager(rng=rngs.numpy("particles")),
+            tick_rate=config.get("tick_rate", 60),
+            base_spawn_interval=config.get("base_spawn_interval", 2.5),
+            min_spawn_interval=config.get("min_spawn_interval", 0.5),
+            time_to_max_difficulty=config.get("time_to_max_difficulty", 300.0),
+            rngs=rngs,
+        )
+
+        level_up_screen = LevelUpUI(sim.player, sim.all_sprites, VIEW_WIDTH, VIEW_HEIGHT, rng=rngs.random("ui"))
+        sim.on_level_up = level_up_screen.activate
+
+        if config.get("record"):
+            sim.recorder = InputRecorder(rngs, describe_simulation(
+                sim, config.get("map", "map1"), mob_overrides=config.get("mob_overrides", {})))
+
+        tick_times = []
+        peak_enemies = 0
+        start = time.perf_counter()
+
+        while sim.state != 'game_over' and sim.total_time < max_time:
+            if sim.state == 'level_up':
+                choice = policy.choose_upgrade(level_up_screen.current_upgrades)
+                level_up_screen.choose(choice)
+                sim.resume(choice)
+
+            keys = policy.get_keys(sim)
+
+            tick_start = time.perf_counter()
+            sim.tick(keys)
+            tick_times.append(time.perf_counter() - tick_start)
+
+            peak_enemies = max(peak_enemies, len(sim.enemy_group))
+
+        wall_time = time.perf_counter() - start
+
+    if sim.recorder is not None:
+        sim.recorder.save(config["record"])
+
+    tick_count = len(tick_times)
+    tick_mean_ms, tick_p99_ms, tick_max_ms = tick_summary(tick_times)
+
+    pool_stats = sim.enemy_pool.stats()
+    pool_hits = sum(stats["hits"] for stats in pool_stats.values())
+    pool_requests = pool_hits + sum(stats["misses"] for stats in pool_stats.values())
+
+    return {
+        "run": config.get("run", 0),
+        "map": config.get("map", "map1"),
+        "policy": policy.name,
+        "seed": seed,
+        "score": sim.get_score(),
+        "time_survived": round(sim.total_time, 3),
+        "kills": sim.kill_count,
+        "level": sim.player.stats.level,
+        "peak_enemies": peak_enemies,
+        "ticks": tick_count,
+        "tick_mean_ms": tick_mean_ms,
+        "tick_p99_ms": tick_p99_ms,
+        "tick_max_ms": tick_max_ms,
+        "wall_time": round(wall_time, 3),
+        "pool_hit_rate": round(pool_hits / max(1, pool_requests), 4),
+        "pool_high_water": sum(stats["high_water"] for stats in pool_stats.values()),
+    }
+
+
+def tick_summary(tick_times):
+    """(mean, p99, max) of a list of tick durations in seconds, as rounded ms."""
+    if not tick_times:
+        return 0.0, 0.0, 0.0
+    tick_times = sorted(tick_times)
+    p99_index = min(len(tick_times) - 1, int(len(tick_times) * 0.99))
+    return (round(1000 * sum(tick_times) / len(tick_times), 4),
+            round(1000 * tick_times[p99_index], 4),
+            round(1000 * tick_times[-1], 4))
+
+
+def run_replay(path, profile_from=0.0):
+    """
+    Re-simulates a recorded run (from map1/map2 --record or --record-dir here)
+    as fast as the CPU allows. Tick timings only count from `profile_from`
+    simulated seconds on, so a slow stretch late in a run can be profiled on
+    its own.
+    """
+    init_headless()
+    replay = InputReplay.load(path)
+    setup = replay.setup
+    map_config = MAP_CONFIGS[setup["map"]]
+
+    rngs = RngService(replay.seed)
+    replay.restore_rngs(rngs)
+    apply_mob_overrides(setup.get("mob_overrides", {}))
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        LOG.set_level(WARNING)
+
+        world_width, world_height = setup["world_size"]
+        view_width, view_height = setup["view_size"]
+        sim = Simulation(
+            world_width, world_height,
+            view_width, view_height,
+            weapon=copy.copy(map_config["weapon"]),
+            spawn_table=map_config["spawn_table"],
+            particle_manager=ParticleManager(rng=rngs.numpy("particles")),
+            tick_rate=setup["tick_rate"],
+            base_spawn_interval=setup["base_spawn_interval"],
+            min_spawn_interval=setup["min_spawn_interval"],
+            time_to_max_difficulty=setup["time_to_max_difficulty"],
+            rngs=rngs,
+        )
+
+        level_up_screen = LevelUpUI(sim.player, sim.all_sprites, view_width, view_height, rng=rngs.random("ui"))
+        sim.on_level_up = level_up_screen.activate
+
+        def apply_replayed_choice(choice):
+            level_up_screen.choose(choice)
+            sim.resume(choice)
+
+        sim.replay = replay
+        sim.on_replay_choice = apply_replayed_choice
+
+        no_keys = KeyState()   # The replay supplies the real ones
+        tick_times = []
+        peak_enemies = 0
+        start = time.perf_counter()
+
+        while not replay.finished:
+            tick_start = time.perf_counter()
+            sim.tick(no_keys)
+            if sim.total_time >= profile_from:
+                tick_times.append(time.perf_counter() - tick_start)
+            peak_enemies = max(peak_enemies, len(sim.enemy_group))
+
+        wall_time = time.perf_counter() - start
+
+    tick_mean_ms, tick_p99_ms, tick_max_ms = tick_summary(tick_times)
+    return {
+        "replay": path,
+        "map": setup["map"],
+        "seed": replay.seed,
+        "score": sim.get_score(),
+        "time_survived": round(sim.total_time, 3),
+        "kills": sim.kill_count,
+        "level": sim.player.stats.level,
+        "game_over": sim.state == 'game_over',
+        "in_sync": replay.in_sync(rngs),
+        "peak_enemies": peak_enemies,
+        "ticks": replay.ticks_played,
+        "profiled_ticks": len(tick_times),
+        "tick_mean_ms": tick_mean_ms,
+        "tick_p99_ms": tick_p99_ms,
+        "tick_max_ms": tick_max_ms,
+        "wall_time": round(wall_time, 3),
+    }
+
+
+def write_report(results, path):
+    """Writes JSONL if the path ends in .jsonl, CSV otherwise."""
+    if path.endswith(".jsonl"):
+        with open(path, "w") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+
+def parse_mob_overrides(pairs):
+    """Turns ["slime.speed=80", "bunny.max_health=70"] into nested dicts."""
+    overrides = {}
+    for pair in pairs:
+        key, value = pair.split("=", 1)
+        mob_type, field = key.split(".", 1)
+        overrides.setdefault(mob_type, {})[field] = json.loads(value)
+    return overrides
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many headless survival games in parallel.")
+    parser.add_argument("--runs", type=int, default=16)
+    parser.add_argument("--map", choices=sorted(MAP_CONFIGS), default="map1")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="kite")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first run; run i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="Defaults to one per CPU")
+    parser.add_argument("--max-time", type=float, default=900.0, help="Stop a run after this many simulated seconds")
+    parser.add_argument("--base-spawn-interval", type=float, default=2.5)
+    parser.add_argument("--min-spawn-interval", type=float, default=0.5)
+    parser.add_argument("--time-to-max-difficulty", type=float, default=300.0)
+    parser.add_argument("--mob", action="append", default=[], metavar="TYPE.FIELD=VALUE",
+                        help="Override a MOB_DATA field, e.g. --mob slime.speed=80")
+    parser.add_argument("--out", default="survival_report.csv", help=".csv or .jsonl")
+    parser.add_argument("--verbose", action="store_true", help="Keep the game's own prints")
+    parser.add_argument("--record-dir", default=None, help="Save every run's inputs here as run_<i>.json")
+    parser.add_argument("--replay", default=None, metavar="FILE",
+                        help="Re-simulate one recorded run and print its result instead of running a batch")
+    parser.add_argument("--profile-from", type=float, default=0.0, metavar="SECONDS",
+                        help="With --replay: only time ticks from this far into the run")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        result = run_replay(args.replay, args.profile_from)
+        print(json.dumps(result, indent=2))
+        return
+
+    if args.record_dir:
+        os.makedirs(args.record_dir, exist_ok=True)
+
+    mob_overrides = parse_mob_overrides(args.mob)
+    configs = [
+        {
+            "run": i,
+            "map": args.map,
+            "policy": args.policy,
+            "seed": args.seed + i,
+            "max_time": args.max_time,
+            "base_spawn_interval": args.base_spawn_interval,
+            "min_spawn_interval": args.min_spawn_interval,
+            "time_to_max_difficulty": args.time_to_max_difficulty,
+            "mob_overrides": mob_overrides,
+            "verbose": args.verbose,
+            "record": os.path.join(args.record_dir, f"run_{i}.json") if args.record_dir else None,
+        }
+        for i in range(args.runs)
+    ]
+
+    results = []
+    with multiprocessing.Pool(processes=args.workers) as pool:
+        for result in pool.imap_unordered(run_survival, configs):
+            results.append(result)
+            print(f"[BATCH] run {result['run']}: survived {result['time_survived']}s, "
+                  f"{result['kills']} kills, score {result['score']} ({len(results)}/{args.runs})")
+        pool.close()
+        pool.join()
+
+    results.sort(key=lambda r: r["run"])
+    write_report(results, args.out)
+
+    scores = [r["score"] for r in results]
+    print(f"[BATCH] Wrote {len(results)} runs to {args.out} | mean score {sum(scores) / max(1, len(scores)):.1f}")
+
+
+if __name__ == "__main__":
+    main()
+    sys.exit()
@@ -1,308 +1,284 @@
 import pygame
 import sys
+import argparse
+import copy
+import time
 from environment import Environment
-from character import Character
-from mob import Enemy
-import math
-import random
 from weapon import MUSHROOM_SONG, STORM_BLADE
 from UIManager import LevelUpUI, GameOverUI 
 from particle import ParticleManager
-from meeleehitbox import MeleeHitbox
-
-class CameraGroup(pygame.sprite.Group):
-    def __init__(self):
-        super().__init__()
-        
-    def draw(self, surface, camera_x, camera_y):
-        for sprite in self.sprites():
-            screen_x = sprite.rect.x - camera_x
-            screen_y = sprite.rect.y - camera_y
-
-            if hasattr(sprite, 'draw_shadow'):
-                 sprite.draw_shadow(surface, screen_x, screen_y)
-            
-            surface.blit(sprite.image, (screen_x, screen_y))
-
-def update_camera(player_rect, camera_x, camera_y, SCREEN_W, SCREEN_H, MAP_W, MAP_H, camera_smoothness):
-
-    camera_target_x = player_rect.centerx - SCREEN_W // 2
-    camera_target_y = player_rect.centery - SCREEN_H // 2
-
-    camera_target_x = max(0, min(camera_target_x, MAP_W - SCREEN_W))
-    camera_target_y = max(0, min(camera_target_y, MAP_H - SCREEN_H))
-    
-    new_camera_x = camera_x + (camera_target_x - camera_x) * camera_smoothness
-    new_camera_y = camera_y + (camera_target_y - camera_y) * camera_smoothness
-    
-    return new_camera_x, new_camera_y
-
-def main():
+from presenter import Presenter
+from asset_cache import ASSETS
+from audio import AudioManager, init_mixer
+from text_cache import TEXT, GlyphAtlas
+from preloader import Preloader, survival_manifest
+from game_log import LOG
+from profiler import FrameProfiler
+from rng_service import RngService
+from replay import InputRecorder, InputReplay, describe_simulation
+from simulation import Simulation, render_world, MAP2_SPAWN_TABLE
+
+def main(zoom_level=2.0, scaled_display=False, vsync=False, profiler=None, seed=None, record_path=None, replay=None, preload=False):
+    startup_start = time.perf_counter() # For the time-to-first-frame log
+    init_mixer()
     pygame.init()
 
     # --- Game Constants ---
     SCREEN_WIDTH, SCREEN_HEIGHT = 1080, 720
     WORLD_WIDTH, WORLD_HEIGHT = 3500,3500
-    FPS = 60
+    FPS = 144        # Render rate cap
+    TICK_RATE = 60   # Simulation rate, independent of FPS
     BACKGROUND_IMAGE_PATH = r"Images\unnamed.jpg"
 
     Place_Holder_hp_image_path = r"Images\pixil-frame-0_1_-removebg-preview.png"
 
-    timer_font = pygame.font.SysFont("Arial", 24)
-
-    total_time = 0.0
-    
     # --- Setup ---
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    if profiler is None:
+        profiler = FrameProfiler()
+
+    # Every run is seeded so it can be recorded (no seed: a fresh one from the OS);
+    # a replay brings its own generator state
+    rngs = RngService(seed)
+    if replay is not None:
+        replay.restore_rngs(rngs)
+    LOG.info("Run seed: %d", rngs.seed)
+
+    presenter = Presenter(SCREEN_WIDTH, SCREEN_HEIGHT, zoom_level, scaled_display, vsync)
+    screen = presenter.screen
+    hud_scale = presenter.hud_scale # Same on-screen HUD size in --scaled mode
+
+    timer_font = pygame.font.SysFont("Arial", round(24 * hud_scale))
+    timer_digits = GlyphAtlas(timer_font, (255, 255, 255)) # The clock changes every second; glyphs don't
     pygame.display.set_caption("My Scrolling Game")
     clock = pygame.time.Clock()
 
-    zoom_level = 2.0
+    GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT = presenter.canvas_size
 
-    GAME_CANVAS_WIDTH = int(SCREEN_WIDTH/zoom_level)
-    GAME_CANVAS_HEIGHT = int(SCREEN_HEIGHT/zoom_level) 
+    game_canvas = presenter.canvas
 
-    game_canvas = pygame.Surface((GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT))
+    # --- Assets ---
+    # Opt-in (--preload): decoded on worker threads behind a loading screen, and
+    # everything below then hits ASSETS. Not the default: the decoders mostly
+    # hold the GIL, so this measured slower to the first frame than on demand
+    if preload:
+        preloader = Preloader(survival_manifest(MAP2_SPAWN_TABLE, STORM_BLADE, BACKGROUND_IMAGE_PATH,
+                                                images=[Place_Holder_hp_image_path]))
+        if not preloader.run(screen):
+            return 'quit'
     
     # --- Game Objects ---
     game_environment = Environment(WORLD_WIDTH, WORLD_HEIGHT, BACKGROUND_IMAGE_PATH)
 
-    all_sprites = CameraGroup()
-    enemy_group = pygame.sprite.Group()
-    
-    player = Character(WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
-
-    hit_sound = pygame.mixer.Sound(r"Images\atk.mp3")
-    levelup_sound = pygame.mixer.Sound(r"Images\chest2.mp3")
-
-    particle_manager = ParticleManager(hit_sound=hit_sound, levelup=levelup_sound)
-    player.set_particle_manager(particle_manager)
-    player.set_groups(all_sprites, enemy_group)
-
-
-    player.equip_weapon(STORM_BLADE)
-    
-    all_sprites.add(player)
+    audio = AudioManager()
+
+    particle_manager = ParticleManager(audio=audio, additive_glow=True,
+                                       rng=rngs.numpy("particles"))
+
+    sim = Simulation(
+        WORLD_WIDTH, WORLD_HEIGHT,
+        GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT,
+        # Upgrades mutate the blueprint, so each run gets its own
+        weapon=copy.copy(STORM_BLADE),
+        spawn_table=MAP2_SPAWN_TABLE,
+        particle_manager=particle_manager,
+        tick_rate=TICK_RATE,
+        profiler=profiler,
+        rngs=rngs
+    )
+    player = sim.player
 
     level_up_screen = LevelUpUI(
         player, 
-        all_sprites, 
+        sim.all_sprites, 
         GAME_CANVAS_WIDTH, 
-        GAME_CANVAS_HEIGHT
+        GAME_CANVAS_HEIGHT,
+        rng=rngs.random("ui")
     )
 
     game_over_screen = GameOverUI(GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT)
 
-    game_state = 'running'
+    sim.on_level_up = level_up_screen.activate
+    sim.on_game_over = game_over_screen.activate
 
-    # --- Camera Variables ---
-    camera_x = 0 
-    camera_y = 0
-    CAMERA_SMOOTHNESS = 0.05
+    # --- Record / Replay ---
+    recorder = None
+    if record_path:
+        recorder = sim.recorder = InputRecorder(rngs, describe_simulation(sim, "map2", zoom=zoom_level))
 
-    spawn_timer = 0.0
-    
-    base_spawn_interval = 2.5       
-    min_spawn_interval = 0.5        
-    time_to_max_difficulty = 300.0 
+    if replay is not None:
+        if replay.setup["view_size"] != [GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT]:
+            LOG.warning("Replay was recorded with a %s canvas, this one is %s; spawns will differ",
+                        replay.setup["view_size"], [GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT])
 
-    POINTS_PER_KILL = 50
-    POINTS_PER_SECOND = 1
+        def apply_replayed_choice(choice):
+            level_up_screen.choose(choice)
+            sim.resume(choice)
 
-    total_time = 0.0
-    kill_count = 0
+        sim.replay = replay
+        sim.on_replay_choice = apply_replayed_choice
 
     try:
-        hp_image_raw = pygame.image.load(Place_Holder_hp_image_path).convert_alpha()
-        hp_image = pygame.transform.scale(hp_image_raw, (40, 40))
+        hp_image_raw = ASSETS.get_surface(Place_Holder_hp_image_path)
+        hp_image = pygame.transform.scale(hp_image_raw, (round(40 * hud_scale), round(40 * hud_scale)))
     except Exception as e:
-        print(f"Error loading HP image: {e}")
-        hp_image = pygame.Surface((40, 40))
+        LOG.error("Error loading HP image: %s", e)
+        hp_image = pygame.Surface((round(40 * hud_scale), round(40 * hud_scale)))
         hp_image.fill((255, 0, 255))
 
+
+
+    def finish(result):
+        LOG.info(audio.report())
+        LOG.info(TEXT.report())
+        if recorder is not None:
+            recorder.save(record_path)
+        return result
+
     running = True
     while running:
         
         dt = clock.tick(FPS) / 1000.0
-        
-        particle_manager.update(dt) 
+        profiler.begin_frame()
+
+        with profiler.section("events"):
+            events = pygame.event.get()
 
-        events = pygame.event.get()
-        
         for event in events:
             if event.type == pygame.QUIT:
-                return 'quit' 
+                return finish('quit')
 
-            if game_state == 'level_up':
-                action = level_up_screen.handle_event(event, zoom_level)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F1:
+                profiler.toggle() # Frame timing overlay
+
+            if sim.state == 'level_up' and replay is not None:
+                pass # The replay makes the choice
+            elif sim.state == 'level_up':
+                action = level_up_screen.handle_event(event, presenter.to_canvas)
                 if action == 'running':
-                    particle_manager.create_level_up_burst(player.pos.x, player.pos.y)
-                    game_state = 'running'
-            elif game_state == 'game_over':
-                action = game_over_screen.handle_event(event, zoom_level)
+                    sim.resume(level_up_screen.last_choice)
+            elif sim.state == 'game_over':
+                action = game_over_screen.handle_event(event, presenter.to_canvas)
                 if action == 'restart':
-                    return {
+                    return finish({
                         "status": "game_over",
                         "score": game_over_screen.final_score,
                         "time": game_over_screen.final_time,
                         "kills": game_over_screen.kill_count
-                    }
-
-        if game_state == 'running':
-            if dt == 0: continue 
+                    })
 
-            total_time += dt
-            spawn_timer += dt
+        if replay is not None and replay.finished:
+            LOG.info("[REPLAY] Finished after %d ticks (%s)", replay.ticks_played,
+                     "in sync" if replay.in_sync(rngs) else "DESYNCED: random streams ended elsewhere")
+            return finish('quit')
 
-            keys = pygame.key.get_pressed()
-
-            if keys[pygame.K_l]: # Debug key
-                 particle_manager.create_level_up_burst(player.pos.x, player.pos.y)
-
-
-            difficulty_progress = min(1.0, total_time / time_to_max_difficulty)
-            current_spawn_interval = base_spawn_interval - (base_spawn_interval - min_spawn_interval) * difficulty_progress
-            
-            if spawn_timer >= current_spawn_interval:
-                spawn_timer = 0.0
-                try:
-                    margin = 100
-                    spawn_radius = max(GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT) / 2 + margin
-                    player_x = player.pos.x
-                    player_y = player.pos.y
-                    angle = random.uniform(0, 2 * math.pi)
-                    spawn_x = player_x + math.cos(angle) * spawn_radius
-                    spawn_y = player_y + math.sin(angle) * spawn_radius
-                    
-                    if random.random() < 0.5: # 50% chance for slime
-                        new_enemy = Enemy(
-                            x=spawn_x, 
-                            y=spawn_y, 
-                            frames_folder_path=r"Images\spr_BreadDog", 
-                            mob_type="slime", 
-                            scale=1, 
-                            player_level=player.stats.level,
-                            particle_manager=particle_manager,
-                        )
-                    else: # 50% chance for bunny
-                        new_enemy = Enemy(
-                            x=spawn_x,
-                            y=spawn_y,
-                            frames_folder_path=r"Images\spr_Investigaters",
-                            mob_type="bunny",
-                            scale=1,
-                            player_level=player.stats.level,
-                            particle_manager=particle_manager
-                        )
-                    
-                    all_sprites.add(new_enemy)
-                    enemy_group.add(new_enemy)
-                    
-                    
-                except Exception as e:
-                    print(f"FATAL: Error spawning enemy: {e}")
-
-            player.update(dt, keys)
-            game_environment.update()
-            
-            player_hitbox = player.get_player_collision_box()
-
-            for enemy in enemy_group:
-                xp_reward = enemy.update(dt, player) 
-
-                if xp_reward is not None:
-                    kill_count += 1
-                    if player.stats.add_xp(xp_reward):
-                        game_state = 'level_up'
-                        level_up_screen.activate()
-                        print("--- LEVEL UP! --- Pausing game.")
-
-            for enemy in enemy_group:
-                if player_hitbox.colliderect(enemy.collision_box):
-                    if enemy.can_deal_touch_damage():
-                        enemy.deal_damage(player)
-
-            camera_x, camera_y = update_camera(
-                player.rect, camera_x, camera_y, 
-                GAME_CANVAS_WIDTH, GAME_CANVAS_HEIGHT,
-                WORLD_WIDTH, WORLD_HEIGHT, 
-                CAMERA_SMOOTHNESS
-            )
-            
-            if player.stats.current_health <= 0:
-                game_state = 'game_over'
-                score_from_time = int(total_time * POINTS_PER_SECOND)
-                score_from_kills = kill_count * POINTS_PER_KILL
-                final_score = score_from_time + score_from_kills
-                game_over_screen.activate(final_score, total_time, kill_count)
-                print("--- GAME OVER ---")
-                player.kill()
+        keys = pygame.key.get_pressed()  # Ignored by the simulation while replaying
+        sim.advance(dt, keys)
+        audio.update() # Plays this frame's coalesced hit / level-up sounds
+        game_environment.update()
 
         
         # --- Drawing ---
-        game_canvas.fill((0,0,0))
-        game_environment.draw(game_canvas, camera_x, camera_y) 
-        all_sprites.draw(game_canvas, camera_x, camera_y)
-        particle_manager.draw(game_canvas, camera_x, camera_y)
+        render_world(sim, game_canvas, game_environment)
 
         
         # --- UI Drawing ---
-        if game_state == 'level_up':
-            level_up_screen.draw(game_canvas)
-        elif game_state == 'game_over':
-            game_over_screen.draw(game_canvas)
+        with profiler.section("hud"):
+            if sim.state == 'level_up':
+                level_up_screen.draw(game_canvas)
+            elif sim.state == 'game_over':
+                game_over_screen.draw(game_canvas)
+
+        with profiler.section("scale"):
+            presenter.present()
+
+        with profiler.section("hud"):
+            if sim.state != 'game_over':
+                total_seconds = int(sim.total_time)
+                minutes = total_seconds // 60
+                seconds = total_seconds % 60
+                time_string = f"{minutes:02}:{seconds:02}"
+                timer_digits.draw(screen, time_string, topright=(screen.get_width() - round(10 * hud_scale), round(10 * hud_scale)))
+
+                screen.blit(hp_image, (round(10 * hud_scale), round(10 * hud_scale)))
 
-        screen.fill((0,0,0))
-        scaled_canvas = pygame.transform.scale(game_canvas, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        screen.blit(scaled_canvas, (0, 0))
+                current_hp = player.stats.current_health
+                max_hp = player.stats.max_health
+                health_ratio = max(0, current_hp / max_hp) 
 
-        if game_state != 'game_over':
-            total_seconds = int(total_time)
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
-            time_string = f"{minutes:02}:{seconds:02}"
-            total_time_text = timer_font.render(time_string, True, (255, 255, 255))
-            time_rect = total_time_text.get_rect()
-            time_rect.topright = (SCREEN_WIDTH -  10, 10)
-            screen.blit(total_time_text, time_rect)
+                bar_width = 200 * hud_scale
+                bar_height = 25 * hud_scale
+                bar_x = 60 * hud_scale
+                bar_y = 15 * hud_scale
 
-            screen.blit(hp_image, (10, 10))
+                current_health_width = bar_width * health_ratio
 
-            current_hp = player.stats.current_health
-            max_hp = player.stats.max_health
-            health_ratio = max(0, current_hp / max_hp) 
+                background_bar_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
+                health_bar_rect = pygame.Rect(bar_x, bar_y, current_health_width, bar_height)
 
-            bar_width = 200
-            bar_height = 25
-            bar_x = 60
-            bar_y = 15
+                pygame.draw.rect(screen, (50, 50, 50), background_bar_rect)
+                pygame.draw.rect(screen, (255, 0, 0), health_bar_rect)
 
-            current_health_width = bar_width * health_ratio
+            profiler.draw(screen)
 
-            background_bar_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-            health_bar_rect = pygame.Rect(bar_x, bar_y, current_health_width, bar_height)
+        with profiler.section("flip"):
+            presenter.flip()
 
-            pygame.draw.rect(screen, (50, 50, 50), background_bar_rect)
-            pygame.draw.rect(screen, (255, 0, 0), health_bar_rect)
+        if startup_start is not None:
+            LOG.info("[STARTUP] First frame %.0f ms after start (%s)", 1000 * (time.perf_counter() - startup_start),
+                     "preloaded" if preload else "loaded on demand")
+            startup_start = None
 
-        pygame.display.flip()
+        profiler.end_frame(
+            enemies=len(sim.enemy_group),
+            particles=len(sim.particle_manager),
+            sprites=len(sim.all_sprites)
+        )
 
-    return 'quit'
+    return finish('quit')
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--zoom", type=float, default=2.0, help="Window pixels per game pixel")
+    parser.add_argument("--scaled", action="store_true", help="Let SDL's SCALED mode do the zoom on the GPU")
+    parser.add_argument("--vsync", action="store_true")
+    parser.add_argument("--log-level", default=None, help="DEBUG shows every hit; default INFO (or $GAME_LOG_LEVEL)")
+    parser.add_argument("--profile-csv", default=None, help="Stream per-frame section timings to this CSV file")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the run (random if not given)")
+    parser.add_argument("--record", default=None, metavar="FILE", help="Record inputs of the latest run to FILE")
+    parser.add_argument("--replay", default=None, metavar="FILE", help="Play back a recorded run, then exit")
+    parser.add_argument("--preload", action="store_true", help="Decode assets behind a loading screen instead of on first use")
+    parser.add_argument("--no-pack", action="store_true", help="Ignore assets.pack and decode the loose image files")
+    args = parser.parse_args()
+
+    replay = InputReplay.load(args.replay) if args.replay else None
+    if replay is not None and "zoom" in replay.setup:
+        args.zoom = replay.setup["zoom"] # Same canvas size, same spawn ring
+
+    # Lives across restarts so the CSV covers the whole session; F1 shows the overlay
+    profiler = FrameProfiler(csv_path=args.profile_csv)
+
+    if args.log_level:
+        LOG.set_level(args.log_level)
+
+    if not args.no_pack:
+        ASSETS.use_pack() # Pre-decoded pixels from `python asset_pack.py build`, if present
     
     while True:
-        action = main() # Run the game
+        action = main(args.zoom, args.scaled, args.vsync, profiler,
+                      seed=args.seed, record_path=args.record, replay=replay,
+                      preload=args.preload) # Run the game
         
-        if action == 'quit':
+        if action == 'quit' or replay is not None:
             break # Exit the `while True` loop
         
         if action == 'restart':
-            print("--- RESTARTING GAME ---")
+            LOG.info("--- RESTARTING GAME ---")
             continue # Go to the top of the `while True` loop and call main() again
             
 
-    print("--- SHUTTING DOWN ---")
+    profiler.close()
+    LOG.info(ASSETS.report())
+    LOG.info("--- SHUTTING DOWN ---")
     pygame.quit()
     sys.exit()
\ No newline at end of file
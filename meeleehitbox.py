@@ -1,4 +1,5 @@
 import pygame
+from game_log import LOG
 
 class MeleeHitbox(pygame.sprite.Sprite):
     def __init__(self, player, weapon, enemy_group, particle_manager):
@@ -27,7 +28,7 @@ class MeleeHitbox(pygame.sprite.Sprite):
         else:
             self.rect.midright = self.player.rect.midleft
             
-        print(f"[ATTACK] Melee hitbox created for {self.weapon.name}")
+        LOG.debug("[ATTACK] Melee hitbox created for %s", self.weapon.name)
 
     def update(self, dt):
         # 1. Tick down lifetime
@@ -41,7 +42,7 @@ class MeleeHitbox(pygame.sprite.Sprite):
         
     def check_collisions(self):
         # Find all enemies that are touching this hitbox
-        collided_list = pygame.sprite.spritecollide(self, self.enemy_group, False)
+        collided_list = self.enemy_group.spritecollide(self)
         
         for enemy in collided_list:
             # Check if we've already hit this enemy
@@ -52,7 +53,7 @@ class MeleeHitbox(pygame.sprite.Sprite):
                 
                 # 2. Calculate damage
                 damage = self.player.stats.attack_power + self.weapon.weapon_damage
-                print(f"[COMBAT] {self.weapon.name} hit {enemy.stats.name} for {damage} damage!")
+                LOG.debug("[COMBAT] %s hit %s for %d damage!", self.weapon.name, enemy.stats.name, damage)
                 
                 # 3. Deal damage
                 enemy.take_damage(damage)
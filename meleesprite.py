@@ -1,4 +1,6 @@
 import pygame
+from asset_cache import ASSETS
+from game_log import LOG
 
 class MeleeWeaponSprite(pygame.sprite.Sprite):
     def __init__(self, player, weapon_blueprint):
@@ -12,12 +14,10 @@ class MeleeWeaponSprite(pygame.sprite.Sprite):
         self.start_pos = pygame.math.Vector2(self.player.rect.center)
 
         try:
-            image = pygame.image.load(weapon_blueprint.image_path).convert_alpha()
-            w, h = image.get_size()
-            scale = weapon_blueprint.scale
-            self.base_image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
+            # Cached: a swing used to decode the weapon PNG from disk every time
+            self.base_image = ASSETS.get_image(weapon_blueprint.image_path, weapon_blueprint.scale)
         except Exception as e:
-            print(f"--- WEAPON SPRITE ERROR: {e} ---")
+            LOG.error("--- WEAPON SPRITE ERROR: %s ---", e)
             self.base_image = pygame.Surface((30, 60))
             self.base_image.fill((255, 0, 255)) # Pink error
         
@@ -32,6 +32,7 @@ class MeleeWeaponSprite(pygame.sprite.Sprite):
             nudge_x = -self.player.rect.width // 2
             self.start_pos.x += nudge_x
 
+        # Our own copy, so fading it with set_alpha() doesn't touch the cached image
         self.image = self.base_image.copy()
         self.rect = self.image.get_rect(center=self.start_pos)
         self.pos = pygame.math.Vector2(self.rect.topleft) # Use float for smooth lunge
@@ -45,6 +46,5 @@ class MeleeWeaponSprite(pygame.sprite.Sprite):
         self.pos.x += self.lunge_speed * dt
         self.rect.topleft = self.pos
 
-        self.image = self.base_image.copy()
         alpha = max(0, 255 * (self.life_timer / self.life_duration))
         self.image.set_alpha(alpha)
\ No newline at end of file
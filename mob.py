@@ -1,9 +1,14 @@
 import pygame
 from mobStats import MobStats
-from mobStats import get_stats
+from mobStats import get_stats, reset_stats
 import os
 import sys
 from particle import ParticleManager
+from asset_cache import ASSETS, load_mask
+from animation_bank import AnimationBank
+from game_log import LOG
+
+ENEMY_FLASH_COLOR = (150, 150, 150)
 
 
 def load_frames_from_folder(folder_path, scale):
@@ -12,8 +17,7 @@ def load_frames_from_folder(folder_path, scale):
     try:
         filenames = os.listdir(folder_path)
     except FileNotFoundError:
-        print(f"--- FATAL ERROR (Folder Load) ---")
-        print(f"Folder not found: {folder_path}")
+        LOG.error("--- FATAL ERROR (Folder Load) --- Folder not found: %s", folder_path)
         return []
 
     filenames.sort()
@@ -25,26 +29,22 @@ def load_frames_from_folder(folder_path, scale):
         file_path = os.path.join(folder_path, filename)
 
         try:
-            image = pygame.image.load(file_path).convert_alpha()
+            image = ASSETS.get_image(file_path, scale)
         except pygame.error as e:
-            print(f"--- ERROR (Image Load) ---")
-            print(f"Unable to load image: {file_path}")
-            print(f"Pygame error: {e}")
+            LOG.error("--- ERROR (Image Load) --- Unable to load image: %s (%s)", file_path, e)
             continue
 
-        if scale != 1:
-            new_width = int(image.get_width() * scale)
-            new_height = int(image.get_height() * scale)
-            image = pygame.transform.scale(image, (new_width, new_height))
-
         frames.append(image)
 
     if not frames:
-        print(f"--- WARNING (Empty Folder) ---")
-        print(f"No images were loaded from: {folder_path}")
+        LOG.warning("--- WARNING (Empty Folder) --- No images were loaded from: %s", folder_path)
 
     return frames
 
+def load_enemy_animation(folder_path, scale):
+    frames = ASSETS.get("frames", load_frames_from_folder, folder_path, scale)
+    return AnimationBank(frames, flash_color=ENEMY_FLASH_COLOR)
+
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, frames_folder_path, mob_type, scale, player_level, particle_manager, use_mask_collision=False, mask_path=None):
         super().__init__()
@@ -52,58 +52,90 @@ class Enemy(pygame.sprite.Sprite):
         self.stats = get_stats(mob_type)
         if self.stats is None:
             raise ValueError(f"Failed to get stats for mob_type: {mob_type}")
+        self.mob_type = mob_type
         self.scale_to_player_level(player_level)
         self.particle_manager = particle_manager
 
-        self.frames = load_frames_from_folder(frames_folder_path, scale)
+        # Shared with every other Enemy of this type; never draw onto these
+        self.frames = ASSETS.get("frames", load_frames_from_folder, frames_folder_path, scale)
         if not self.frames:
-            print(f"--- FATAL: No frames loaded for Enemy at {frames_folder_path} ---")
+            LOG.error("--- FATAL: No frames loaded for Enemy at %s ---", frames_folder_path)
             fallback = pygame.Surface((32 * scale, 32 * scale))
             fallback.fill((255, 0, 0))
             self.frames = [fallback]
-        
-        self.frame_index = 0
-        
-        self.base_image = self.frames[self.frame_index]
-        self.image = self.base_image.copy()
-        
-        self.last_anim_update = pygame.time.get_ticks()
-        self.anim_speed = self.stats.anim_speed
+            self.animation = AnimationBank(self.frames, flash_color=ENEMY_FLASH_COLOR)
+        else:
+            # Flipped and flashing variants are baked once per mob type
+            self.animation = ASSETS.get("animation", load_enemy_animation, frames_folder_path, scale)
 
+        self.anim_speed = self.stats.anim_speed
 
         self.pos = pygame.math.Vector2(x, y)
         self.vel = pygame.math.Vector2(0, 0)
-        self.rect = self.image.get_rect(center=(int(self.pos.x), int(self.pos.y)))
+        self.rect = self.animation.get(0).get_rect()
 
         default_w = int(self.rect.width * 0.3)
         default_h = int(self.rect.height * 0.3)
         self.collision_box = pygame.Rect(0, 0, default_w, default_h)
-        self.collision_box.center = self.rect.center
         
         self.use_mask_collision = use_mask_collision
         if use_mask_collision:
             if mask_path and os.path.exists(mask_path):
-                mask_image = pygame.image.load(mask_path).convert_alpha()
-                self.mask = pygame.mask.from_surface(mask_image)
+                self.mask = ASSETS.get("mask", load_mask, mask_path)
             else:
                 self.mask = pygame.mask.from_surface(self.frames[0])
         else:
             self.mask = None 
 
+        self.touch_damage_cooldown = 1.0
+        self.hit_stun_duration = 0.3 
+        self.flash_interval = 0.1
+
+        # Set by EnemySwarm.add(); while in a swarm it moves this enemy
+        self.swarm = None
+        self.swarm_index = -1
+
+        # Set by EnemyPool; kill() hands the instance back to it
+        self.pool = None
+
+        self.reset_state(x, y)
+
+    def reset_state(self, x, y):
+        """Everything that changes during one life, back to how a new Enemy starts."""
+        self.frame_index = 0
+        self.facing_right = True
+        self.image = self.animation.get(self.frame_index)
+        self.last_anim_update = pygame.time.get_ticks()
+
+        self.pos.update(x, y)
+        self.vel.update(0, 0)
+        self.rect.center = (int(self.pos.x), int(self.pos.y))
+        self.collision_box.center = self.rect.center
+
         self.target = None
         self.state = 'idle'
 
-
-        self.touch_damage_cooldown = 1.0
         self.touch_damage_timer = 0.0 
 
         self.isHit = False
-        self.hit_stun_duration = 0.3 
         self.hit_stun_timer = 0.0
-        self.flash_interval = 0.1
         self.flash_timer = 0.0
         self.flash_toggle = True
 
+    def respawn(self, x, y, player_level):
+        """Brings a killed (pooled) enemy back at a new spot, scaled to player_level."""
+        reset_stats(self.stats, self.mob_type)
+        self.scale_to_player_level(player_level)
+        self.reset_state(x, y)
+
+    def kill(self):
+        if self.swarm is not None:
+            self.swarm.remove(self)
+        was_alive = self.alive()
+        super().kill()
+        if self.pool is not None and was_alive:
+            self.pool.release(self)
+
     def scale_to_player_level(self, level):
         scale_factor = 1 + (level - 1) * 0.15
         self.stats.max_health = int(self.stats.max_health * scale_factor)
@@ -119,8 +151,10 @@ class Enemy(pygame.sprite.Sprite):
             
         damage_taken = max(1, amount - self.stats.defense)
         self.stats.current_health -= damage_taken
+        if self.swarm is not None:
+            self.swarm.struck[self] = None # Checked for death / flashed by the swarm's tick
         
-        print(f"{self.stats.name} takes {damage_taken} damage, {self.stats.current_health} HP left.")
+        LOG.debug("%s takes %d damage, %d HP left.", self.stats.name, damage_taken, self.stats.current_health)
         
         if self.stats.current_health > 0:
              self.isHit = True
@@ -136,17 +170,21 @@ class Enemy(pygame.sprite.Sprite):
         self.touch_damage_timer = self.touch_damage_cooldown
 
         damage = self.stats.attack_power
-        print(f"[COMBAT] {self.stats.name} collides with player for {damage} damage!")
+        LOG.debug("[COMBAT] %s collides with player for %d damage!", self.stats.name, damage)
         player_target.take_damage(damage)
         
+    def is_dead(self):
+        return self.stats.current_health <= 0
+
+    def die(self):
+        xp_drop = self.stats.xp_reward
+        self.particle_manager.create_death_explosion(self.pos.x, self.pos.y)
+        self.kill()
+        return xp_drop
+
     def update(self, dt, player):
-        if self.stats.current_health <= 0:
-            xp_drop = self.stats.xp_reward
-            self.particle_manager.create_death_explosion(self.pos.x, self.pos.y)
-            self.kill()
-            return xp_drop
-            
-        self.image = self.base_image.copy()
+        if self.is_dead():
+            return self.die()
             
         if self.touch_damage_timer > 0:
             self.touch_damage_timer -= dt
@@ -171,7 +209,24 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.center = self.pos
         self.collision_box.center = self.rect.center
 
+        self.update_flash(dt)
+
+        return None
 
+    def sync_from_swarm(self, x, y, center, frame_index, facing_right):
+        """
+        Copies this enemy's EnemySwarm row back for drawing / collision, once
+        something looks at it. `center` is the already-rounded integer rect
+        centre. Velocity, state and the animation clock stay in the swarm
+        (only update() / animate() read them, and the swarm stands in for those).
+        """
+        self.pos.update(x, y)
+        self.rect.center = center
+        self.collision_box.center = center
+        self.image = self.animation.get(frame_index, facing_right, self.isHit and self.flash_toggle)
+
+    def update_flash(self, dt):
+        flashing = False
         if self.isHit:
             self.hit_stun_timer += dt
             self.flash_timer += dt
@@ -185,26 +240,24 @@ class Enemy(pygame.sprite.Sprite):
                     self.flash_timer = 0
                     self.flash_toggle = not self.flash_toggle
                 
-                # Apply the white flash if toggled on
-                if self.flash_toggle:
-                    self.image.fill((150, 150, 150), special_flags=pygame.BLEND_RGB_ADD)
+                # Show the white flash if toggled on
+                flashing = self.flash_toggle
 
-        return None
+        self.image = self.animation.get(self.frame_index, self.facing_right, flashing)
 
-    def animate(self):
-        # This method now updates self.base_image, not self.image
-        now = pygame.time.get_ticks()
+    def animate(self, now=None):
+        # This method only picks frame_index / facing; update() looks up the image
+        if now is None:
+            now = pygame.time.get_ticks()
         
         if self.state == 'chasing': 
             if now - self.last_anim_update > self.anim_speed:
                 self.last_anim_update = now
-                self.frame_index = (self.frame_index + 1) % len(self.frames)
-                self.base_image = self.frames[self.frame_index]
+                self.frame_index = (self.frame_index + 1) % len(self.animation)
                 
                 # Flipping logic
-                if self.vel.x < 0:
-                   self.base_image = pygame.transform.flip(self.base_image, True, False)
+                self.facing_right = not (self.vel.x < 0)
         
         elif self.state == 'idle':
             self.frame_index = 0
-            self.base_image = self.frames[self.frame_index]
+            self.facing_right = True
@@ -1,3 +1,5 @@
+from game_log import LOG
+
 class MobStats:
     def __init__(self, name, max_health, attack_power, xp_reward, defense, speed, aggro_range, attack_range, anim_speed=100):
         
@@ -46,11 +48,14 @@ MOB_DATA = {
 def get_stats(mob_type):
 
     if mob_type not in MOB_DATA:
-        print(f"--- FATAL (mobStats) ---")
-        print(f"Unknown mob_type: {mob_type}")
-        print(f"Valid types are: {list(MOB_DATA.keys())}")
+        LOG.error("--- FATAL (mobStats) --- Unknown mob_type: %s. Valid types are: %s", mob_type, list(MOB_DATA.keys()))
         return None 
 
     stats_dict = MOB_DATA[mob_type]
     
     return MobStats(**stats_dict)
+
+
+def reset_stats(stats, mob_type):
+    """Puts an existing MobStats back to mob_type's base values (used by pooled enemies)."""
+    stats.__init__(**MOB_DATA[mob_type])
@@ -1,128 +1,259 @@
 import pygame
-import random
 import math
+import numpy as np
+from game_log import LOG
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.pos = pygame.math.Vector2(x, y)
-        self.vel = pygame.math.Vector2(0, 0)
+# --- Particle Shapes ---
+CIRCLE = 0   # Hit splats
+SQUARE = 1   # Death / damage / level-up bursts
 
-    def update(self, dt):
-        return True # Default: stay alive
+HIT_SPLAT_COLOR = (200, 200, 200) # Whitish
+DEATH_BURST_COLOR = (200, 50, 50)
+PLAYER_DAMAGE_COLOR = (220, 0, 0)
+LEVEL_UP_COLORS = [
+    (255, 255, 100), # Bright Yellow
+    (255, 255, 255), # White
+    (255, 180, 50)   # Orange
+]
 
-    def draw(self, surface, camera_x, camera_y):
-        pass
-
-class HitSplat(Particle):
-    def __init__(self, x, y):
-        super().__init__(x, y)
-        self.size = random.randint(4, 6)
-        self.color = (200, 200, 200) # Whitish
-        self.vel.x = random.uniform(-0.5, 0.5) * 60
-        self.vel.y = random.uniform(-1.5, -0.5) * 60
-        self.life = random.uniform(0.2, 0.4) # In seconds
-        self.size_decay = 8.0
+# Stamps are cached per (colour, shape, whole-pixel size); bigger particles draw at this size
+MAX_STAMP_SIZE = 16
 
-    def update(self, dt):
-        self.pos += self.vel * dt
-        self.size -= self.size_decay * dt
-        self.life -= dt
-        
-        # Return False when dead
-        return self.size > 0 and self.life > 0
 
-    def draw(self, surface, camera_x, camera_y):
-        screen_x = int(self.pos.x - camera_x)
-        screen_y = int(self.pos.y - camera_y)
-        pygame.draw.circle(surface, self.color, (screen_x, screen_y), int(self.size))
-
-class DeathBurst(Particle):
-    def __init__(self, x, y, color=(200, 50, 50)):
-        super().__init__(x, y)
-        self.size = random.randint(3, 7)
-        self.angle = random.uniform(0, 2 * math.pi)
-        self.speed = random.uniform(2, 6) * 60
-        self.color = color
-        self.life = random.uniform(0.8, 1.5)
-        self.size_decay = 10.0
+# This one object will control all world particles.
+class ParticleManager:
+    """
+    Every live particle is one row in a set of preallocated NumPy arrays
+    (position, velocity, damping, size, size decay, life, colour index, shape).
+    Emitting, moving, shrinking and culling are whole-array operations.
+
+    Rows are kept in emission order, oldest first. When an emit would go past
+    `capacity`, the oldest particles are dropped to make room.
+
+    Drawing blits pre-rendered stamps (one per colour/shape/size) in a single
+    Surface.blits() call. With additive_glow the level-up burst is added onto
+    the scene (BLEND_RGB_ADD) instead of painted over it.
+
+    Randomness comes from `rng` (a NumPy Generator, normally the run's
+    "particles" stream) or, without one, a generator seeded with `seed`.
+    Sounds go through `audio` (an AudioManager), if given.
+    """
+    def __init__(self, audio=None, capacity=16384, seed=None, additive_glow=False, rng=None):
+        self.audio = audio
+        self.additive_glow = additive_glow
+
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+        self.capacity = capacity
+        self.count = 0
+        self.recycled = 0   # Particles dropped early because the pool was full
+
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.damping = np.ones(capacity)
+        self.size = np.zeros(capacity)
+        self.size_decay = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self.shape = np.zeros(capacity, dtype=np.int8)
+        self.blend = np.zeros(capacity, dtype=np.int32)  # Blit special_flags
+        self.columns = (self.pos, self.vel, self.damping, self.size, self.size_decay,
+                        self.life, self.color, self.shape, self.blend)
+
+        # colour tuple <-> small int stored per particle
+        self.palette = []
+        self.palette_index = {}
+
+        # stamp key -> Surface, built the first time that stamp is drawn
+        self.stamps = {}
+
+    def __len__(self):
+        return self.count
+
+    def get_color_index(self, color):
+        index = self.palette_index.get(color)
+        if index is None:
+            index = self.palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+
+    def make_room(self, amount):
+        """Drops the oldest particles so `amount` more fit. Returns how many can be emitted."""
+        amount = min(amount, self.capacity)
+        overflow = self.count + amount - self.capacity
+        if overflow > 0:
+            keep = self.count - overflow
+            for column in self.columns:
+                column[:keep] = column[overflow:self.count]
+            self.count = keep
+            self.recycled += overflow
+        return amount
+
+    def emit(self, x, y, vel, size, size_decay, life, damping, color, shape, blend=0):
+        """Appends len(size) particles at (x, y). `color` is one index or one per particle."""
+        amount = self.make_room(len(size))
+        start = self.count
+        end = start + amount
+
+        self.pos[start:end] = (x, y)
+        self.vel[start:end] = vel[-amount:]
+        self.size[start:end] = size[-amount:]
+        self.size_decay[start:end] = size_decay
+        self.life[start:end] = life[-amount:]
+        self.damping[start:end] = damping
+        self.color[start:end] = color if np.isscalar(color) else color[-amount:]
+        self.shape[start:end] = shape
+        self.blend[start:end] = blend
+        self.count = end
 
     def update(self, dt):
-        self.pos.x += math.cos(self.angle) * self.speed * dt
-        self.pos.y += math.sin(self.angle) * self.speed * dt
-        self.size -= self.size_decay * dt
-        self.life -= dt
-        
-        self.speed *= 0.95 
-        
-        return self.size > 0 and self.life > 0
+        n = self.count
+        if n == 0:
+            return
+
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        size = self.size[:n]
+        life = self.life[:n]
+
+        pos += vel * dt
+        # Bursts slow down by a fixed factor per update (one simulation tick)
+        vel *= self.damping[:n, None]
+        size -= self.size_decay[:n] * dt
+        life -= dt
+
+        alive = (size > 0) & (life > 0)
+        if alive.all():
+            return
+
+        # Compact the survivors to the front, keeping them oldest first
+        keep = np.flatnonzero(alive)
+        for column in self.columns:
+            column[:len(keep)] = column[keep]
+        self.count = len(keep)
+
+    def build_stamp(self, key):
+        color_index, shape, size = self.split_stamp_key(key)
+        color = self.palette[color_index]
+
+        if shape == CIRCLE:
+            # Same pixels draw.circle would set for this radius
+            stamp = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, color, (size, size), size)
+        else:
+            stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+            stamp.fill(color)
+
+        stamp = stamp.convert_alpha()
+        self.stamps[key] = stamp
+        return stamp
+
+    @staticmethod
+    def split_stamp_key(key):
+        size = key % MAX_STAMP_SIZE
+        key //= MAX_STAMP_SIZE
+        return key // 2, key % 2, size
 
     def draw(self, surface, camera_x, camera_y):
-        screen_x = int(self.pos.x - camera_x)
-        screen_y = int(self.pos.y - camera_y)
-        
-
-        rect = pygame.Rect(
-            screen_x - self.size // 2,
-            screen_y - self.size // 2,
-            self.size,
-            self.size
+        n = self.count
+        if n == 0:
+            return
+
+        view_w, view_h = surface.get_size()
+        size = np.minimum(self.size[:n].astype(np.int64), MAX_STAMP_SIZE - 1)
+        shape = self.shape[:n]
+        circle = shape == CIRCLE
+
+        # Top-left of each stamp: circles are centred on (2r+1) squares, squares on their size
+        offset = np.where(circle, size, size // 2)
+        extent = np.where(circle, 2 * size + 1, size)
+        left = (self.pos[:n, 0] - camera_x).astype(np.int64) - offset
+        top = (self.pos[:n, 1] - camera_y).astype(np.int64) - offset
+
+        # Skip anything shrunk to nothing or entirely off the canvas
+        visible = np.flatnonzero(
+            (size > 0) &
+            (left < view_w) & (left + extent > 0) &
+            (top < view_h) & (top + extent > 0)
         )
-        pygame.draw.rect(surface, self.color, rect)
+        if len(visible) == 0:
+            return
 
+        keys = ((self.color[:n][visible] * 2 + shape[visible]) * MAX_STAMP_SIZE + size[visible]).tolist()
+        lefts = left[visible].tolist()
+        tops = top[visible].tolist()
+        flags = self.blend[:n][visible].tolist()
 
-# This one object will control all world particles.
-class ParticleManager:
-    def __init__(self, hit_sound =None, levelup = None):
-        self.particles = set()
-        self.hit_sound = hit_sound
-        self.levelup_sound = levelup
+        stamps = self.stamps
+        blit_sequence = []
+        for i, key in enumerate(keys):
+            stamp = stamps.get(key)
+            if stamp is None:
+                stamp = self.build_stamp(key)
+            blit_sequence.append((stamp, (lefts[i], tops[i]), None, flags[i]))
 
-    def update(self, dt):
+        surface.blits(blit_sequence, doreturn=False)
 
-        dead_particles = set()
-        for particle in self.particles:
-            is_alive = particle.update(dt)
-            if not is_alive:
-                dead_particles.add(particle)
-        
-        self.particles.difference_update(dead_particles)
+    # --- Emitters ---
 
-    def draw(self, surface, camera_x, camera_y):
-        for particle in self.particles:
-            particle.draw(surface, camera_x, camera_y)
+    # Each emitter draws its whole burst in one call: a row of uniforms per
+    # particle, one column per randomised property, scaled in place.
+
+    def emit_splats(self, x, y, amount, color):
+        u = self.rng.random((amount, 4))
+        vel = np.empty((amount, 2))
+        vel[:, 0] = (u[:, 0] - 0.5) * 60          # -0.5 .. 0.5
+        vel[:, 1] = (u[:, 1] - 1.5) * 60          # -1.5 .. -0.5
+        self.emit(
+            x, y, vel,
+            size=np.floor(4 + 3 * u[:, 2]),       # 4 .. 6
+            size_decay=8.0,
+            life=0.2 + 0.2 * u[:, 3], # In seconds
+            damping=1.0,
+            color=self.get_color_index(color),
+            shape=CIRCLE,
+        )
 
+    def emit_burst(self, x, y, amount, color, blend=0):
+        u = self.rng.random((amount, 4))
+        angle = u[:, 0] * (2 * math.pi)
+        speed = (2 + 4 * u[:, 1]) * 60            # 2 .. 6
+        vel = np.empty((amount, 2))
+        vel[:, 0] = np.cos(angle) * speed
+        vel[:, 1] = np.sin(angle) * speed
+        self.emit(
+            x, y, vel,
+            size=np.floor(3 + 5 * u[:, 2]),       # 3 .. 7
+            size_decay=10.0,
+            life=0.8 + 0.7 * u[:, 3],
+            damping=0.95,
+            color=color,
+            shape=SQUARE,
+            blend=blend,
+        )
 
     def create_hit_effect(self, x, y):
         # Create a few small splats
-        for _ in range(random.randint(2, 4)):
-            self.particles.add(HitSplat(x, y))
-        
-        if hasattr(self, "hit_sound") and self.hit_sound:
-            self.hit_sound.play()
-    
+        self.emit_splats(x, y, int(self.rng.integers(2, 5)), HIT_SPLAT_COLOR)
+
+        if self.audio:
+            self.audio.play("hit")
+
     def create_death_explosion(self, x, y):
         # Create a big burst
-        for _ in range(random.randint(15, 25)):
-            self.particles.add(DeathBurst(x, y))
+        self.emit_burst(x, y, int(self.rng.integers(15, 26)), self.get_color_index(DEATH_BURST_COLOR))
 
     def create_player_damage_effect(self, x, y):
         # Create a red burst
-        red_color = (220, 0, 0)
-        for _ in range(random.randint(10, 15)):
-            self.particles.add(DeathBurst(x, y, color=red_color))
-            
+        self.emit_burst(x, y, int(self.rng.integers(10, 16)), self.get_color_index(PLAYER_DAMAGE_COLOR))
+
     def create_level_up_burst(self, x, y):
-        print("--- [DEBUG] Creating level up burst! ---")
-        colors = [
-            (255, 255, 100), # Bright Yellow
-            (255, 255, 255), # White
-            (255, 180, 50)   # Orange
-        ]
-        
+        LOG.debug("--- [DEBUG] Creating level up burst! ---")
+
         # Spawn more particles
-        for _ in range(random.randint(60, 90)): # Was 30-50
-            color = random.choice(colors)
-            self.particles.add(DeathBurst(x, y, color=color))
-        if self.levelup_sound:
-            self.levelup_sound.play()
+        amount = int(self.rng.integers(60, 91)) # Was 30-50
+        color_indices = np.array([self.get_color_index(color) for color in LEVEL_UP_COLORS], dtype=np.int16)
+        blend = pygame.BLEND_RGB_ADD if self.additive_glow else 0
+        self.emit_burst(x, y, amount, self.rng.choice(color_indices, amount), blend)
+        if self.audio:
+            self.audio.play("level_up")
@@ -0,0 +1,207 @@
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+import pygame
+from asset_cache import ASSETS, load_surface, convert_surface
+from audio import SOUNDS, load_sound
+from character import IDLE_SHEET_PATH, MOVING_SHEET_PATH
+from game_log import LOG
+
+# Same set mob.load_frames_from_folder accepts
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# --- Manifests ---
+# A manifest is a list of (kind, path):
+#   "image"   decoded, then convert_alpha()    -> ASSETS.get_surface(path)
+#   "opaque"  decoded, then convert()          -> ASSETS.get_surface(path, alpha=False)
+#   "folder"  every image file inside, as "image"
+#   "sound"   decoded into a mixer Sound       -> ASSETS.get("sound", load_sound, path)
+
+def survival_manifest(spawn_table, weapon, background_path, images=()):
+    """Everything map1/map2 decode before their first frame."""
+    manifest = [
+        ("opaque", background_path),
+        ("image", IDLE_SHEET_PATH),
+        ("image", MOVING_SHEET_PATH),
+        ("image", weapon.image_path),
+    ]
+    manifest += [("image", path) for path in images]
+    for entry in spawn_table:
+        manifest.append(("folder", entry["frames_folder_path"]))
+        if entry.get("mask_path"):
+            manifest.append(("image", entry["mask_path"]))
+    manifest += [("sound", spec["path"]) for spec in SOUNDS.values()]
+    return manifest
+
+
+def expand_manifest(manifest):
+    """Folders become their image files; anything ASSETS already holds, or its pack has, is dropped."""
+    jobs = []
+    for kind, path in manifest:
+        if kind == "folder":
+            try:
+                filenames = sorted(os.listdir(path))
+            except FileNotFoundError:
+                continue # The loader reports it when it gets there
+            jobs += [("image", os.path.join(path, filename)) for filename in filenames
+                     if filename.lower().endswith(IMAGE_EXTENSIONS)]
+        else:
+            jobs.append((kind, path))
+
+    unique = []
+    for kind, path in dict.fromkeys(jobs):
+        if kind != "sound" and ASSETS.packed_image(path):
+            continue # Nothing to decode
+        if kind == "sound":
+            cached = ASSETS.contains(load_sound, path)
+        else:
+            cached = ASSETS.contains(load_surface, path, kind == "image")
+        if not cached:
+            unique.append((kind, path))
+    return unique
+
+
+def decode(kind, path):
+    """Worker side: file bytes -> unconverted Surface / Sound. Touches no display state."""
+    with open(path, "rb") as f:
+        data = io.BytesIO(f.read())
+    if kind == "sound":
+        return pygame.mixer.Sound(file=data)
+    return pygame.image.load(data, path) # Name hint: the decoder goes by extension
+
+
+class Preloader:
+    """
+    Decodes a manifest's files on a thread pool (reading and decompressing
+    PNG/JPG/MP3 doesn't need the display) and finishes each one on the main
+    thread: convert()/convert_alpha() into the display's pixel format, then
+    into ASSETS under the same key the regular loaders use. Whatever asks
+    for those assets afterwards gets a cache hit.
+
+    poll() does a time-boxed slice of main-thread work, so a loading screen
+    can keep drawing and pumping events in between; run() is that loop.
+    A file that fails to decode is skipped here and left to its loader,
+    which reports it as before.
+
+    The decoders hold the GIL for most of their work, so the threads overlap
+    little more than file reads: map1 reaches its first frame no sooner than
+    loading on demand, and only uses this with --preload.
+    """
+    def __init__(self, manifest, workers=None):
+        self.jobs = expand_manifest(manifest)
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.total = len(self.jobs)
+        self.completed = 0
+        self.failed = 0
+        self.executor = None
+        self.pending = []
+        self.started_at = None
+        self.elapsed = 0.0
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        if not self.jobs:
+            return
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-decode")
+        sound_ok = pygame.mixer.get_init() is not None
+        for kind, path in self.jobs:
+            if kind == "sound" and not sound_ok:
+                self.completed += 1
+                continue
+            self.pending.append((kind, path, self.executor.submit(decode, kind, path)))
+
+    @property
+    def progress(self):
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def finished(self):
+        return not self.pending
+
+    def poll(self, budget=0.008):
+        """Converts and stores decoded files, in manifest order, for up to `budget` seconds."""
+        deadline = time.perf_counter() + budget
+        while self.pending and time.perf_counter() < deadline:
+            kind, path, future = self.pending[0]
+            if not future.done():
+                break
+            self.pending.pop(0)
+            self.completed += 1
+
+            try:
+                decoded = future.result()
+            except (OSError, pygame.error) as e:
+                self.failed += 1
+                LOG.warning("[PRELOAD] Could not decode %s: %s", path, e)
+                continue
+
+            if kind == "sound":
+                ASSETS.put("sound", decoded, load_sound, path)
+            else:
+                alpha = kind == "image"
+                ASSETS.put("surface", convert_surface(decoded, alpha), load_surface, path, alpha)
+
+        if self.finished:
+            self.close()
+        return self.progress
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            self.elapsed = time.perf_counter() - self.started_at
+
+    def run(self, screen, fps=60):
+        """
+        Loading screen: draws progress until everything is in. Returns False
+        if the window was closed meanwhile.
+        """
+        if not self.jobs:
+            return True # All cached already (e.g. re-entering a scene)
+
+        self.start()
+        font = pygame.font.SysFont("Arial", 24)
+        frame_time = 1.0 / fps
+        last_draw = float("-inf")
+
+        while not self.finished:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.pending.clear()
+                    self.close()
+                    return False
+
+            self.poll()
+
+            now = time.perf_counter()
+            if now - last_draw >= frame_time:
+                draw_loading_screen(screen, font, self.completed, self.total)
+                pygame.display.flip()
+                last_draw = now
+
+            # Sleep until the next file is decoded (not a fixed frame), so a
+            # fast load isn't padded out to whole frames
+            if self.pending:
+                wait([self.pending[0][2]], timeout=frame_time)
+
+        self.close()
+        LOG.info("[PRELOAD] %d files in %.0f ms on %d threads (%d failed)",
+                 self.total, 1000 * self.elapsed, self.workers, self.failed)
+        return True
+
+
+def draw_loading_screen(screen, font, completed, total):
+    width, height = screen.get_size()
+    screen.fill((15, 15, 20))
+
+    bar_width, bar_height = width // 2, 20
+    bar_rect = pygame.Rect((width - bar_width) // 2, height // 2, bar_width, bar_height)
+    filled = bar_rect.copy()
+    filled.width = int(bar_width * completed / total) if total else bar_width
+
+    pygame.draw.rect(screen, (50, 50, 50), bar_rect)
+    pygame.draw.rect(screen, (255, 255, 255), filled)
+
+    text = font.render(f"Loading... {completed}/{total}", True, (255, 255, 255))
+    screen.blit(text, text.get_rect(midbottom=(width // 2, bar_rect.top - 10)))
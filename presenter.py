@@ -0,0 +1,113 @@
+import pygame
+
+
+class Presenter:
+    """
+    Owns the window and the low-res game canvas, and gets the canvas onto the
+    screen each frame without allocating anything.
+
+    - zoom 1: the canvas *is* the display surface, nothing to scale.
+    - integer zoom: the canvas is sized so canvas * zoom fits the window
+      exactly, and transform.scale writes straight into the display surface.
+    - any other zoom: the canvas is stretched over the whole window, again
+      scaling straight into the display surface.
+    - scaled_display: SDL's SCALED mode. The display surface is canvas-sized
+      and the GPU does the zoom on flip, so present() has nothing to do.
+    """
+    def __init__(self, screen_width, screen_height, zoom_level=2.0, scaled_display=False, vsync=False):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.scaled_display = scaled_display
+        self.vsync = vsync
+        self.set_zoom(zoom_level)
+
+    @property
+    def hud_scale(self):
+        """
+        Multiply HUD sizes by this. The HUD is laid out in window pixels and
+        drawn on `screen` after present(); in scaled_display mode `screen` is
+        the canvas and gets zoomed on flip, so the layout shrinks to match.
+        """
+        return 1.0 / self.zoom_level if self.scaled_display else 1.0
+
+    def to_canvas(self, window_pos):
+        """Window (mouse) coordinates -> canvas coordinates."""
+        x, y = window_pos
+        if self.target is None:
+            # Canvas is the display surface; SCALED already reports the mouse in canvas pixels
+            return x, y
+        offset_x, offset_y = self.target.get_abs_offset()  # Border when the zoom doesn't divide the window
+        target_width, target_height = self.target.get_size()
+        canvas_width, canvas_height = self.canvas_size
+        return (x - offset_x) * canvas_width / target_width, (y - offset_y) * canvas_height / target_height
+
+    def set_zoom(self, zoom_level):
+        """
+        Rebuilds the display and canvas for a new zoom. Anything laid out in
+        canvas coordinates (UI screens, the simulation's view size) must be
+        rebuilt by the caller afterwards.
+        """
+        self.zoom_level = zoom_level
+        integer_zoom = float(zoom_level).is_integer()
+
+        canvas_width = int(self.screen_width / zoom_level)
+        canvas_height = int(self.screen_height / zoom_level)
+        self.canvas_size = (canvas_width, canvas_height)
+
+        if self.scaled_display:
+            flags = pygame.SCALED
+            self.screen = pygame.display.set_mode(self.canvas_size, flags, vsync=int(self.vsync))
+            self.canvas = self.screen
+            self.target = None
+            self.border_rects = []
+            self.mode = 'scaled_display'
+            return
+
+        # vsync is only honoured with SCALED/OPENGL; at full window size SCALED is a 1:1 no-op
+        flags = pygame.SCALED if self.vsync else 0
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), flags, vsync=int(self.vsync))
+        self.screen.fill((0, 0, 0))
+
+        if zoom_level == 1:
+            self.canvas = self.screen
+            self.target = None
+            self.border_rects = []
+            self.mode = 'direct'
+            return
+
+        # Same pixel format as the display so scale() can write into it directly
+        self.canvas = pygame.Surface(self.canvas_size, 0, self.screen)
+
+        if integer_zoom:
+            # Square pixels; any leftover border stays black
+            target_size = (canvas_width * int(zoom_level), canvas_height * int(zoom_level))
+            target_rect = pygame.Rect((0, 0), target_size)
+            target_rect.center = self.screen.get_rect().center
+            self.mode = 'integer'
+        else:
+            target_rect = self.screen.get_rect()
+            self.mode = 'stretch'
+
+        self.target = self.screen.subsurface(target_rect)
+
+        # Strips of window the scaled canvas doesn't cover (HUD can draw there)
+        screen_rect = self.screen.get_rect()
+        self.border_rects = [
+            rect for rect in (
+                pygame.Rect(0, 0, screen_rect.width, target_rect.top),
+                pygame.Rect(0, target_rect.bottom, screen_rect.width, screen_rect.height - target_rect.bottom),
+                pygame.Rect(0, target_rect.top, target_rect.left, target_rect.height),
+                pygame.Rect(target_rect.right, target_rect.top, screen_rect.width - target_rect.right, target_rect.height),
+            )
+            if rect.width > 0 and rect.height > 0
+        ]
+
+    def present(self):
+        """Copies the finished canvas to the window. Call before drawing the HUD."""
+        if self.target is not None:
+            pygame.transform.scale(self.canvas, self.target.get_size(), self.target)
+        for rect in self.border_rects:
+            self.screen.fill((0, 0, 0), rect)
+
+    def flip(self):
+        pygame.display.flip()
@@ -0,0 +1,186 @@
+import csv
+import time
+import numpy as np
+import pygame
+
+# Everything the survival main loop is split into, in overlay order
+FRAME_SECTIONS = [
+    "events", "player", "enemies", "contacts", "particles",
+    "environment", "sprites", "scale", "hud", "flip",
+]
+
+
+class NullScope:
+    """What section() hands out while profiling is off: a `with` that does nothing."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SCOPE = NullScope()
+
+
+class Scope:
+    """One reusable timer per section; adds its elapsed time to the current frame."""
+    __slots__ = ("totals", "index", "start")
+
+    def __init__(self, totals, index):
+        self.totals = totals
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.totals[self.index] += time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """
+    Scoped timers for the main loop:
+
+        with profiler.section("enemies"):
+            ...
+
+    A section can be entered several times per frame (e.g. once per fixed
+    tick); its times add up. end_frame() files the frame's totals into a
+    rolling window for the overlay's averages / p99, and into a CSV file if
+    one was given.
+
+    While disabled (overlay hidden, no CSV) section() returns a shared no-op
+    scope and begin/end_frame return straight away.
+    """
+    def __init__(self, sections=FRAME_SECTIONS, window=120, csv_path=None):
+        self.sections = list(sections)
+        self.window = window
+        self.overlay_visible = False
+
+        self.totals = [0.0] * len(self.sections)
+        self.scopes = {name: Scope(self.totals, i) for i, name in enumerate(self.sections)}
+
+        # Rolling history: one row per frame, section columns + the whole frame
+        self.history = np.zeros((window, len(self.sections) + 1))
+        self.frames_recorded = 0
+        self.frame_start = 0.0
+        self.entity_counts = {}
+
+        self.csv_file = None
+        self.csv_writer = None
+        if csv_path:
+            self.csv_file = open(csv_path, "w", newline="")
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(["frame"] + [f"{name}_ms" for name in self.sections] + ["frame_ms"])
+
+        self.font = None
+        self.panel = None
+        self.panel_refresh_interval = 15   # Frames between overlay re-renders
+        self.frames_since_panel = 0
+
+        self.enabled = False
+        self.pending_start = False   # Enabled since the last begin_frame(): this frame has no start time
+        self.update_enabled()
+
+    def update_enabled(self):
+        was_enabled = self.enabled
+        self.enabled = self.overlay_visible or self.csv_writer is not None
+        if self.enabled and not was_enabled:
+            # Turned on mid-frame (F1): skip to the next whole frame, and don't
+            # average in rows from the last time it was on
+            self.pending_start = True
+            self.history[:] = 0.0
+            self.frames_recorded = 0
+            for i in range(len(self.totals)):
+                self.totals[i] = 0.0
+
+    def toggle(self):
+        self.overlay_visible = not self.overlay_visible
+        self.panel = None
+        self.update_enabled()
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SCOPE
+        return self.scopes[name]
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        totals = self.totals
+        for i in range(len(totals)):
+            totals[i] = 0.0
+        self.frame_start = time.perf_counter()
+        self.pending_start = False
+
+    def end_frame(self, **entity_counts):
+        """Closes the frame. Keyword args are entity counts shown on the overlay."""
+        if not self.enabled or self.pending_start:
+            return
+        frame_time = time.perf_counter() - self.frame_start
+
+        row = self.history[self.frames_recorded % self.window]
+        row[:-1] = self.totals
+        row[-1] = frame_time
+        self.frames_recorded += 1
+        self.entity_counts = entity_counts
+
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(
+                [self.frames_recorded] + [round(1000 * t, 4) for t in self.totals] + [round(1000 * frame_time, 4)])
+
+    def stats(self):
+        """{section: (average ms, p99 ms)} over the rolling window, plus 'frame'."""
+        recorded = min(self.frames_recorded, self.window)
+        if recorded == 0:
+            return {}
+        history = self.history[:recorded] * 1000
+        averages = history.mean(axis=0)
+        p99 = np.percentile(history, 99, axis=0)
+        names = self.sections + ["frame"]
+        return {name: (averages[i], p99[i]) for i, name in enumerate(names)}
+
+    def build_panel(self):
+        if self.font is None:
+            self.font = pygame.font.SysFont("consolas", 14)
+
+        lines = [f"{'section':<12}{'avg ms':>8}{'p99 ms':>8}"]
+        for name, (average, p99) in self.stats().items():
+            lines.append(f"{name:<12}{average:>8.2f}{p99:>8.2f}")
+        lines.append("  ".join(f"{name}: {count}" for name, count in self.entity_counts.items()))
+
+        rendered = [self.font.render(line, True, (255, 255, 0)) for line in lines]
+        line_height = self.font.get_linesize()
+        width = max(text.get_width() for text in rendered) + 12
+        height = line_height * len(rendered) + 12
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, text in enumerate(rendered):
+            panel.blit(text, (6, 6 + i * line_height))
+        return panel
+
+    def draw(self, screen, topleft=(10, 50)):
+        if not self.overlay_visible:
+            return
+        self.frames_since_panel += 1
+        if self.panel is None or self.frames_since_panel >= self.panel_refresh_interval:
+            self.panel = self.build_panel()
+            self.frames_since_panel = 0
+        screen.blit(self.panel, topleft)
+
+    def close(self):
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+            self.update_enabled()
+
+
+# Handed to code that can be profiled but wasn't given a profiler
+NULL_PROFILER = FrameProfiler()
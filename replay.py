@@ -0,0 +1,175 @@
+import json
+import pygame
+from game_log import LOG
+
+REPLAY_VERSION = 2
+
+# The only keys a survival tick reads: movement in Character.update, L in Simulation.tick
+TRACKED_KEYS = [
+    ("w", pygame.K_w),
+    ("a", pygame.K_a),
+    ("s", pygame.K_s),
+    ("d", pygame.K_d),
+    ("l", pygame.K_l),
+]
+
+
+class KeyState(dict):
+    """Stands in for pygame.key.get_pressed(): any key not set reads as up."""
+    def __missing__(self, key):
+        return False
+
+
+def keys_to_mask(keys):
+    mask = 0
+    for bit, (_, key) in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_to_keys(mask):
+    keys = KeyState()
+    for bit, (_, key) in enumerate(TRACKED_KEYS):
+        if mask & (1 << bit):
+            keys[key] = True
+    return keys
+
+
+def describe_simulation(sim, map_name, **extra):
+    """Everything needed to rebuild `sim`'s world for a replay (besides the seed)."""
+    setup = {
+        "map": map_name,
+        "world_size": [sim.world_width, sim.world_height],
+        "view_size": [sim.view_width, sim.view_height],
+        "tick_rate": round(1.0 / sim.tick_dt),
+        "base_spawn_interval": sim.base_spawn_interval,
+        "min_spawn_interval": sim.min_spawn_interval,
+        "time_to_max_difficulty": sim.time_to_max_difficulty,
+    }
+    setup.update(extra)
+    return setup
+
+
+class InputRecorder:
+    """
+    Captures everything a survival run consumes that isn't derived from the
+    seed: the tracked keys of every tick, and which level-up option was picked
+    between which ticks.
+
+    The run's RngService state is snapshotted when recording starts (the
+    replay restores it), and fingerprinted on save (the replay compares
+    against it to tell whether it stayed in sync).
+
+    Keys are stored as a bitmask per tick, run-length encoded as [mask, ticks]
+    pairs; holding a direction for a few seconds is one pair.
+
+    `setup` holds whatever the Simulation was built with (map, view size,
+    spawn tuning...) so a replay can rebuild the same world.
+    """
+    def __init__(self, rngs, setup):
+        self.rngs = rngs
+        self.seed = rngs.seed
+        self.rng_state = rngs.get_state()
+        self.setup = setup
+        self.key_runs = []
+        self.choices = []   # [tick_count, option index]
+        self.ticks = 0
+
+    def record_keys(self, keys):
+        mask = keys_to_mask(keys)
+        if self.key_runs and self.key_runs[-1][0] == mask:
+            self.key_runs[-1][1] += 1
+        else:
+            self.key_runs.append([mask, 1])
+        self.ticks += 1
+
+    def record_choice(self, tick_count, choice):
+        self.choices.append([tick_count, choice])
+
+    def to_dict(self):
+        return {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "rng_state": self.rng_state,
+            "rng_final": self.rngs.state_digest(),
+            "setup": self.setup,
+            "ticks": self.ticks,
+            "keys": [name for name, _ in TRACKED_KEYS],
+            "key_runs": self.key_runs,
+            "choices": self.choices,
+        }
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        LOG.info("[REPLAY] Saved %d ticks, %d key runs, %d level-up choices to %s",
+                 self.ticks, len(self.key_runs), len(self.choices), path)
+
+
+class InputReplay:
+    """
+    Plays an InputRecorder file back into a Simulation, tick by tick:
+    next_keys() gives the keys for the coming tick and take_choice() the
+    level-up option picked before it, if any.
+    """
+    def __init__(self, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        if data.get("keys") != [name for name, _ in TRACKED_KEYS]:
+            raise ValueError(f"Replay tracks different keys: {data.get('keys')}")
+
+        self.seed = data["seed"]
+        self.rng_state = data["rng_state"]
+        self.rng_final = data["rng_final"]
+        self.setup = data["setup"]
+        self.ticks = data["ticks"]
+        self.key_runs = data["key_runs"]
+        self.choices = data["choices"]
+
+        self.run_index = 0
+        self.run_left = self.key_runs[0][1] if self.key_runs else 0
+        self.choice_index = 0
+        self.ticks_played = 0
+        self.key_cache = {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def restore_rngs(self, rngs):
+        rngs.set_state(self.rng_state)
+
+    def in_sync(self, rngs):
+        """Once finished: did every stream end where the recorded run's did?"""
+        return rngs.state_digest() == self.rng_final
+
+    @property
+    def finished(self):
+        return self.ticks_played >= self.ticks
+
+    def next_keys(self):
+        if self.finished:
+            return KeyState()
+
+        while self.run_left == 0:
+            self.run_index += 1
+            self.run_left = self.key_runs[self.run_index][1]
+
+        mask = self.key_runs[self.run_index][0]
+        self.run_left -= 1
+        self.ticks_played += 1
+
+        keys = self.key_cache.get(mask)
+        if keys is None:
+            keys = self.key_cache[mask] = mask_to_keys(mask)
+        return keys
+
+    def take_choice(self, tick_count):
+        """The option picked after `tick_count` ticks, or None."""
+        if self.choice_index < len(self.choices) and self.choices[self.choice_index][0] == tick_count:
+            choice = self.choices[self.choice_index][1]
+            self.choice_index += 1
+            return choice
+        return None
@@ -0,0 +1,68 @@
+import hashlib
+import json
+import random
+import numpy as np
+
+# One independent stream per subsystem, so e.g. a change in how many particles
+# a hit makes can't shift which mob spawns next. Order matters: stream i is
+# always built from child i of the run's seed sequence, so only ever append.
+STREAMS = ["spawn", "particles", "loot", "ui"]
+
+
+class RngService:
+    """
+    Hands out the random number generators for one run, all derived from a
+    single seed through NumPy's SeedSequence:
+
+        rngs.random("spawn")      # random.Random, for scalar picks
+        rngs.numpy("particles")   # numpy Generator, for whole-array draws
+
+    Streams are statistically independent of each other and of the streams of
+    any other seed, so batch runs with seeds 0, 1, 2... don't overlap.
+
+    With seed=None a fresh one is taken from the OS; `seed` then holds it, so
+    the run can still be recorded and replayed.
+    """
+    def __init__(self, seed=None):
+        sequence = np.random.SeedSequence(seed)
+        self.seed = sequence.entropy
+
+        self.py_streams = {}
+        self.np_streams = {}
+        for name, child in zip(STREAMS, sequence.spawn(len(STREAMS))):
+            # Two independent children of the child: one per generator kind
+            py_seed, np_seed = child.spawn(2)
+            self.py_streams[name] = random.Random(int(py_seed.generate_state(1, np.uint64)[0]))
+            self.np_streams[name] = np.random.default_rng(np_seed)
+
+    def random(self, name):
+        return self.py_streams[name]
+
+    def numpy(self, name):
+        return self.np_streams[name]
+
+    # --- Snapshots ---
+    def get_state(self):
+        """Every stream's position, as plain JSON-able data."""
+        py_states = {}
+        for name, rng in self.py_streams.items():
+            version, internal, gauss_next = rng.getstate()
+            py_states[name] = [version, list(internal), gauss_next]
+
+        return {
+            "seed": self.seed,
+            "random": py_states,
+            "numpy": {name: rng.bit_generator.state for name, rng in self.np_streams.items()},
+        }
+
+    def state_digest(self):
+        """Short fingerprint of get_state(), for checking two runs ended up in the same place."""
+        return hashlib.sha1(json.dumps(self.get_state(), sort_keys=True).encode()).hexdigest()
+
+    def set_state(self, state):
+        """Rewinds / fast-forwards every stream to a get_state() snapshot."""
+        self.seed = state["seed"]
+        for name, (version, internal, gauss_next) in state["random"].items():
+            self.py_streams[name].setstate((version, tuple(internal), gauss_next))
+        for name, bit_state in state["numpy"].items():
+            self.np_streams[name].bit_generator.state = bit_state
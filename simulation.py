@@ -0,0 +1,305 @@
+import pygame
+import math
+from operator import attrgetter
+from character import Character
+from enemy_pool import EnemyPool
+from camera import CameraGroup, update_camera
+from enemy_swarm import EnemySwarm, SwarmGroup
+from game_log import LOG
+from profiler import NULL_PROFILER
+from rng_service import RngService
+
+# --- Spawn Tables ---
+# One entry per mob a map can spawn. Each spawn picks one entry at random and
+# passes the rest of the dict straight to Enemy() (through the EnemyPool).
+MAP1_SPAWN_TABLE = [
+    {
+        "mob_type": "slime",
+        "frames_folder_path": r"Images\Slime",
+        "scale": 1,
+        "use_mask_collision": True,
+        "mask_path": r"Images\spr_Soratomo_mask.png"
+    },
+    {
+        "mob_type": "bunny",
+        "frames_folder_path": r"Images\Nousagi",
+        "scale": 1
+    },
+]
+
+MAP2_SPAWN_TABLE = [
+    {
+        "mob_type": "slime",
+        "frames_folder_path": r"Images\spr_BreadDog",
+        "scale": 1
+    },
+    {
+        "mob_type": "bunny",
+        "frames_folder_path": r"Images\spr_Investigaters",
+        "scale": 1
+    },
+]
+
+
+class Simulation:
+    """
+    Owns everything that moves in a survival map and advances it on a fixed
+    timestep. Nothing in here touches the display, so the same object can be
+    rendered at any frame rate or run with no window at all.
+    """
+    def __init__(self, world_width, world_height, view_width, view_height,
+                 weapon, spawn_table, particle_manager,
+                 tick_rate=60, max_frame_time=0.25, max_ticks_per_frame=5,
+                 base_spawn_interval=2.5, min_spawn_interval=0.5, time_to_max_difficulty=300.0,
+                 enemy_pool_size=32, on_level_up=None, on_game_over=None, profiler=NULL_PROFILER,
+                 rngs=None):
+
+        self.world_width = world_width
+        self.world_height = world_height
+        self.view_width = view_width
+        self.view_height = view_height
+
+        # --- Timestep ---
+        self.tick_dt = 1.0 / tick_rate
+        self.max_frame_time = max_frame_time          # Clamp for one very slow frame
+        self.max_ticks_per_frame = max_ticks_per_frame  # Spiral-of-death guard
+        self.accumulator = 0.0
+        self.tick_count = 0
+
+        # --- Spawning ---
+        self.spawn_table = spawn_table
+        self.spawn_timer = 0.0
+        self.base_spawn_interval = base_spawn_interval
+        self.min_spawn_interval = min_spawn_interval
+        self.time_to_max_difficulty = time_to_max_difficulty
+
+        # --- Scoring ---
+        self.points_per_kill = 50
+        self.points_per_second = 1
+        self.total_time = 0.0
+        self.kill_count = 0
+
+        self.on_level_up = on_level_up
+        self.on_game_over = on_game_over
+        self.profiler = profiler
+
+        # --- Randomness (see rng_service.py) ---
+        self.rngs = rngs if rngs is not None else RngService()
+        self.spawn_rng = self.rngs.random("spawn")
+
+        # --- Record / Replay (see replay.py) ---
+        self.recorder = None          # InputRecorder: logs every tick's keys and each level-up pick
+        self.replay = None            # InputReplay: supplies them instead
+        self.on_replay_choice = None  # Called with the replayed level-up option index
+        self.state = 'running'
+
+        # --- World ---
+        # Positions, steering, animation and touch cooldowns for every enemy, as NumPy arrays
+        self.swarm = EnemySwarm()
+        # Every enemy collision query (orbitals, melee) goes through the swarm's arrays
+        self.enemy_group = SwarmGroup(self.swarm)
+        # ...and so does finding the enemies on screen
+        self.all_sprites = CameraGroup(index=self.enemy_group)
+
+        self.particle_manager = particle_manager
+
+        # Dead enemies go back here; built up front so spawning doesn't allocate
+        self.enemy_pool = EnemyPool(particle_manager)
+        self.enemy_pool.prewarm(spawn_table, enemy_pool_size)
+
+        self.player = Character(world_width // 2, world_height // 2)
+        self.player.set_particle_manager(particle_manager)
+        self.player.set_groups(self.all_sprites, self.enemy_group)
+        self.player.equip_weapon(weapon)
+        self.all_sprites.add(self.player)
+
+        # --- Camera ---
+        self.camera_x = 0
+        self.camera_y = 0
+        self.prev_camera_x = 0
+        self.prev_camera_y = 0
+        self.camera_smoothness = 0.05
+
+    @property
+    def alpha(self):
+        """How far the renderer is between the previous tick and the current one."""
+        return self.accumulator / self.tick_dt
+
+    @property
+    def time_ms(self):
+        """Simulated time in ms, for what used to read pygame.time.get_ticks() (e.g. enemy animation)."""
+        return self.tick_count * self.tick_dt * 1000
+
+    def get_camera(self, alpha=1.0):
+        camera_x = self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha
+        camera_y = self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha
+        return camera_x, camera_y
+
+    def advance(self, frame_dt, keys):
+        """
+        Feeds one rendered frame's worth of real time into the accumulator and
+        runs as many fixed ticks as it covers. Returns the number of ticks run.
+        """
+        self.accumulator += min(frame_dt, self.max_frame_time)
+
+        ticks = 0
+        while self.accumulator >= self.tick_dt:
+            if ticks >= self.max_ticks_per_frame:
+                # Can't keep up: drop the backlog instead of spiralling
+                self.accumulator = 0.0
+                break
+            self.accumulator -= self.tick_dt
+            self.tick(keys)
+            ticks += 1
+
+        return ticks
+
+    def tick(self, keys):
+        """Advances the world by exactly one fixed step."""
+        dt = self.tick_dt
+
+        if self.replay is not None:
+            choice = self.replay.take_choice(self.tick_count)
+            if choice is not None and self.on_replay_choice:
+                self.on_replay_choice(choice)
+            keys = self.replay.next_keys()
+        if self.recorder is not None:
+            self.recorder.record_keys(keys)
+
+        self.all_sprites.snapshot()
+        self.prev_camera_x, self.prev_camera_y = self.camera_x, self.camera_y
+        self.tick_count += 1
+
+        # Particles keep moving behind the level-up / game-over screens
+        with self.profiler.section("particles"):
+            self.particle_manager.update(dt)
+
+        if self.state != 'running':
+            return
+
+        self.total_time += dt
+        self.spawn_timer += dt
+
+        if keys[pygame.K_l]: # Debug key
+            self.particle_manager.create_level_up_burst(self.player.pos.x, self.player.pos.y)
+
+        self.update_spawning()
+
+        with self.profiler.section("player"):
+            self.player.update(dt, keys)
+
+        player_hitbox = self.player.get_player_collision_box()
+
+        with self.profiler.section("enemies"):
+            self.update_enemies(dt)
+
+        with self.profiler.section("contacts"):
+            for i in self.swarm.contacts(player_hitbox).tolist():
+                self.swarm.enemies[i].deal_damage(self.player)
+
+        self.camera_x, self.camera_y = update_camera(
+            self.player.rect, self.camera_x, self.camera_y,
+            self.view_width, self.view_height,
+            self.world_width, self.world_height,
+            self.camera_smoothness
+        )
+
+        if self.player.stats.current_health <= 0:
+            self.state = 'game_over'
+            final_score = self.get_score()
+            LOG.info("--- GAME OVER ---")
+            LOG.info("%s", self.enemy_pool.report())
+            self.player.kill()
+            if self.on_game_over:
+                self.on_game_over(final_score, self.total_time, self.kill_count)
+
+    def update_enemies(self, dt):
+        swarm = self.swarm
+
+        # Enemies killed by this tick's orbital/melee hits drop their XP first,
+        # in row order. Only struck ones can have died
+        struck = swarm.struck
+        for enemy in sorted([enemy for enemy in struck if enemy.is_dead()], key=attrgetter("swarm_index")):
+            swarm.sync_enemy(enemy) # die() reads its position
+            xp_reward = enemy.die()
+            self.kill_count += 1
+            if self.player.stats.add_xp(xp_reward) and self.state == 'running':
+                self.state = 'level_up'
+                LOG.info("--- LEVEL UP! --- Pausing game.")
+                if self.on_level_up:
+                    self.on_level_up()
+
+        # Animation, aggro, steering and movement for everyone at once. The
+        # sprites catch up when a query (camera, orbitals, melee) hands them out
+        swarm.animate(self.time_ms)
+        swarm.step(dt, self.player.rect.center)
+
+        # Hit flashes are the only per-enemy work left
+        for enemy in list(struck):
+            if enemy.isHit:
+                enemy.update_flash(dt)
+            if not enemy.isHit:
+                del struck[enemy]
+
+    def update_spawning(self):
+        difficulty_progress = min(1.0, self.total_time / self.time_to_max_difficulty)
+        current_spawn_interval = self.base_spawn_interval - (self.base_spawn_interval - self.min_spawn_interval) * difficulty_progress
+
+        if self.spawn_timer < current_spawn_interval:
+            return
+
+        self.spawn_timer = 0.0
+        try:
+            margin = 100
+            spawn_radius = max(self.view_width, self.view_height) / 2 + margin
+            angle = self.spawn_rng.uniform(0, 2 * math.pi)
+            spawn_x = self.player.pos.x + math.cos(angle) * spawn_radius
+            spawn_y = self.player.pos.y + math.sin(angle) * spawn_radius
+
+            spawn_entry = self.spawn_rng.choice(self.spawn_table)
+            self.spawn_enemy(spawn_entry, spawn_x, spawn_y)
+
+        except Exception as e:
+            LOG.error("Error spawning enemy: %s", e)
+
+    def spawn_enemy(self, spawn_entry, x, y):
+        """Brings one enemy of `spawn_entry` into the world at (x, y), scaled to the player's level."""
+        new_enemy = self.enemy_pool.acquire(spawn_entry, x, y, self.player.stats.level)
+        new_enemy.last_anim_update = self.time_ms  # Its animation clock is the simulation's, not the wall clock
+
+        self.all_sprites.add(new_enemy)
+        self.enemy_group.add(new_enemy)
+        self.swarm.add(new_enemy)
+        return new_enemy
+
+    def resume(self, choice=None):
+        """Called once the player has picked a level-up upgrade (option index `choice`)."""
+        if self.recorder is not None and choice is not None:
+            self.recorder.record_choice(self.tick_count, choice)
+        self.particle_manager.create_level_up_burst(self.player.pos.x, self.player.pos.y)
+        self.state = 'running'
+
+    def get_score(self):
+        score_from_time = int(self.total_time * self.points_per_second)
+        score_from_kills = self.kill_count * self.points_per_kill
+        return score_from_time + score_from_kills
+
+
+def render_world(sim, game_canvas, environment):
+    """
+    Render pass: draws the world as it looked `sim.alpha` of the way between
+    the last two ticks. Returns the interpolated camera so HUD code can use it.
+    """
+    alpha = sim.alpha
+    camera_x, camera_y = sim.get_camera(alpha)
+    profiler = sim.profiler
+
+    with profiler.section("environment"):
+        game_canvas.fill((0,0,0))
+        environment.draw(game_canvas, camera_x, camera_y)
+    with profiler.section("sprites"):
+        sim.all_sprites.draw(game_canvas, camera_x, camera_y, alpha)
+    with profiler.section("particles"):
+        sim.particle_manager.draw(game_canvas, camera_x, camera_y)
+
+    return camera_x, camera_y
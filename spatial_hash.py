@@ -0,0 +1,147 @@
+import pygame
+
+
+class SpatialHash:
+    """
+    Uniform grid over world space. Each object is stored in every cell its
+    rect touches, so a query only has to look at the few cells around it
+    instead of every object in the world.
+
+    Cells are dicts rather than sets so query results come back in a stable
+    insertion order, which keeps seeded runs reproducible.
+    """
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}         # (cx, cy) -> {obj: None}
+        self.obj_spans = {}     # obj -> (x0, y0, x1, y1) cell range it is stored in
+
+    def __len__(self):
+        return len(self.obj_spans)
+
+    def __contains__(self, obj):
+        return obj in self.obj_spans
+
+    def _span(self, rect):
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size
+        )
+
+    def insert(self, obj, rect):
+        span = self._span(rect)
+        self.obj_spans[obj] = span
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cell = cells[(cx, cy)] = {}
+                cell[obj] = None
+
+    def remove(self, obj):
+        span = self.obj_spans.pop(obj, None)
+        if span is None:
+            return
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(obj, None)
+                    if not cell:
+                        del cells[(cx, cy)]
+
+    def move(self, obj, rect):
+        """Re-buckets obj only if its rect now covers a different set of cells."""
+        old_span = self.obj_spans.get(obj)
+        if old_span is None:
+            return
+        if old_span != self._span(rect):
+            self.remove(obj)
+            self.insert(obj, rect)
+
+    def _gather(self, x0, y0, x1, y1):
+        found = {}
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def query_rect(self, rect):
+        """Candidates whose cells overlap rect. Callers still do the exact test."""
+        return list(self._gather(*self._span(rect)))
+
+    def query_point(self, x, y):
+        cell = self.cells.get((int(x) // self.cell_size, int(y) // self.cell_size))
+        return list(cell) if cell else []
+
+    def query_circle(self, x, y, radius):
+        size = self.cell_size
+        return list(self._gather(
+            int(x - radius) // size,
+            int(y - radius) // size,
+            int(x + radius) // size,
+            int(y + radius) // size
+        ))
+
+    def clear(self):
+        self.cells.clear()
+        self.obj_spans.clear()
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    A sprite group that keeps a SpatialHash of its members' rects. Sprites are
+    indexed when added and dropped when killed; call refresh() after moving one.
+    """
+    def __init__(self, *sprites, cell_size=128):
+        self.grid = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.grid.insert(sprite, sprite.rect)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+
+    def refresh(self, sprite):
+        self.grid.move(sprite, sprite.rect)
+
+    def query_rect(self, rect):
+        return [sprite for sprite in self.grid.query_rect(rect) if rect.colliderect(sprite.rect)]
+
+    def query_point(self, x, y):
+        return [sprite for sprite in self.grid.query_point(x, y) if sprite.rect.collidepoint(x, y)]
+
+    def query_circle(self, x, y, radius):
+        radius_sq = radius * radius
+        hits = []
+        for sprite in self.grid.query_circle(x, y, radius):
+            rect = sprite.rect
+            # Closest point on the rect to the circle centre
+            nearest_x = max(rect.left, min(x, rect.right))
+            nearest_y = max(rect.top, min(y, rect.bottom))
+            if (nearest_x - x) ** 2 + (nearest_y - y) ** 2 <= radius_sq:
+                hits.append(sprite)
+        return hits
+
+    def spritecollide(self, sprite, collided=None):
+        """
+        Same result as pygame.sprite.spritecollide(sprite, self, False, collided)
+        for any collided test that stays inside the two rects (collide_rect,
+        collide_rect_ratio below 1, collide_mask).
+        """
+        candidates = self.grid.query_rect(sprite.rect)
+        if collided is None:
+            return [other for other in candidates if sprite.rect.colliderect(other.rect)]
+        return [other for other in candidates if collided(sprite, other)]
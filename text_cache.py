@@ -0,0 +1,137 @@
+from collections import OrderedDict
+import pygame
+
+# Rendered text for the whole process: HUD, menus, debug overlay. 4 MiB holds
+# a few hundred lines of UI text.
+TEXT_BUDGET_BYTES = 4 * 1024 * 1024
+
+
+def finish_surface(surface, background):
+    """Into the display's pixel format, when there is a display, so the per-frame blit is a plain copy."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if background is None else surface.convert()
+
+
+class TextCache:
+    """
+    LRU of rendered text surfaces, keyed by (font, text, antialias, color,
+    background). A string drawn every frame is rasterized once; when the
+    surfaces held go over `budget_bytes`, the least recently drawn ones are
+    dropped.
+
+    Fonts are keyed by identity (the cache holds a reference, so an id is
+    never reused while its entries live): create fonts once, not per frame.
+    Returned surfaces are shared, like ASSETS'; don't draw on them.
+    """
+    def __init__(self, budget_bytes=TEXT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()   # key -> (surface, bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def render(self, font, text, antialias, color, background=None):
+        """Same arguments and result as font.render(text, antialias, color, background)."""
+        key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = finish_surface(font.render(text, antialias, color, background), background)
+        size = surface.get_pitch() * surface.get_height()
+        self.entries[key] = (surface, size)
+        self.bytes += size
+        while self.bytes > self.budget_bytes and len(self.entries) > 1:
+            _, (_, dropped) = self.entries.popitem(last=False)
+            self.bytes -= dropped
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def report(self):
+        return (f"[TEXT] {len(self.entries)} cached ({self.bytes / 1024:.0f} KiB), "
+                f"{self.hits} hits, {self.misses} renders, {self.evictions} evicted")
+
+
+TEXT = TextCache()
+
+
+class TextLine:
+    """
+    One line of text that changes now and then (coordinates, scores): kept
+    rendered until the text changes, so an unchanged frame is a single blit,
+    without filling TEXT with one-off strings.
+    """
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.text = None   # What self.line holds
+        self.line = None
+
+    def compose(self, text):
+        # Not converted: a line that changes every frame is only blitted once,
+        # and converting costs more than that blit saves
+        return self.font.render(text, self.antialias, self.color)
+
+    def render(self, text):
+        if text != self.text:
+            self.line = self.compose(text)
+            self.text = text
+        return self.line
+
+    def draw(self, surface, text, **anchor):
+        """
+        Blits text with its box placed by get_rect-style keywords, e.g.
+        draw(screen, "01:23", topright=(x, y)). Returns that box.
+        """
+        line = self.render(text)
+        rect = line.get_rect(**anchor)
+        surface.blit(line, rect)
+        return rect
+
+
+class GlyphAtlas(TextLine):
+    """
+    A TextLine built from the font's glyphs, each rendered once (on first
+    use), for short text from a small alphabet: timers, damage numbers. A new
+    string is composed from the glyphs, placed by font.size() so the layout
+    is the font's own (same pixels as font.render for regular faces), not
+    rasterized.
+
+    Composing costs two font.size() calls per character, so it only pays
+    for a few characters that change every so often; a long line that
+    changes every frame is cheaper as a plain TextLine.
+    """
+    def __init__(self, font, color, antialias=True):
+        super().__init__(font, color, antialias)
+        self.glyphs = {}   # char -> Surface
+
+    def glyph(self, char):
+        surface = self.glyphs.get(char)
+        if surface is None:
+            surface = self.glyphs[char] = finish_surface(self.font.render(char, self.antialias, self.color), None)
+        return surface
+
+    def compose(self, text):
+        size = self.font.size
+        line = pygame.Surface(size(text), pygame.SRCALPHA)
+        # Each glyph goes where the string up to and including it ends (kerning
+        # and all; pen positions are sub-pixel, so this can't be summed from
+        # per-glyph advances). Glyphs are the text colour throughout with
+        # coverage in alpha, so on a clear surface MAX copies them exactly and
+        # merges overlapping edges.
+        line.blits([(self.glyph(char), (size(text[:i + 1])[0] - size(char)[0], 0), None, pygame.BLEND_RGBA_MAX)
+                    for i, char in enumerate(text)], doreturn=False)
+        return finish_surface(line, None)
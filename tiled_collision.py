@@ -0,0 +1,215 @@
+import hashlib
+import json
+import math
+import os
+import pygame
+from game_log import LOG
+from geometry import Polygon
+from spatial_hash import SpatialHash
+
+try:
+    import pytmx
+except ImportError:
+    pytmx = None
+
+# Bump when the sidecar layout (or what goes into it) changes
+SIDECAR_VERSION = 1
+SIDECAR_SUFFIX = ".collision.json"
+
+# (absolute tmx path, layer names) -> (mtime, size, collision objects, trigger objects)
+_loaded = {}
+
+
+def load_tiled_collision(tmx_file, collision_layer_name='collision', trigger_layer_name='triggers'):
+    """
+    The collision and trigger object groups of a Tiled map, as
+        {"type": "rect", "rect": Rect, "name": str, "bounds": Rect}
+        {"type": "polygon", "points": [(x, y), ...], "name": str, "bounds": Rect, "shape": Polygon}
+    dicts ("bounds" is the box CollisionIndex files the object under,
+    "shape" the geometry.Polygon object_collides tests against). Only the
+    object groups are parsed; no tileset or layer image is ever decoded.
+
+    Parsed maps are kept for the life of the process, and written to a JSON
+    sidecar next to the .tmx (keyed by its mtime, size and SHA-1), so going
+    back through a door costs a stat() and a cold start skips the XML.
+    The result is shared: don't mutate it.
+    """
+    path = os.path.abspath(tmx_file)
+    layers = (collision_layer_name.lower(), trigger_layer_name.lower())
+
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        LOG.error("[TILED] Couldn't load %s: %s", tmx_file, e)
+        return [], []
+
+    cached = _loaded.get((path, layers))
+    if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+        return cached[2], cached[3]
+
+    objects = None
+    data = read_sidecar(path, layers, stat)
+    if data is not None:
+        try:
+            objects = build_objects(data)
+        except (KeyError, TypeError, ValueError):
+            objects = None  # Damaged or hand-edited sidecar: same as no sidecar
+    if objects is None:
+        data = parse_tmx(path, layers)
+        if data is None:
+            return [], []
+        write_sidecar(path, layers, stat, data)
+        objects = build_objects(data)
+
+    collision_objects, trigger_objects = objects
+    _loaded[(path, layers)] = (stat.st_mtime, stat.st_size, collision_objects, trigger_objects)
+    return collision_objects, trigger_objects
+
+
+def parse_tmx(path, layers):
+    """Plain-data object groups of the map: {"collision": [...], "triggers": [...]}, or None on failure."""
+    if pytmx is None:
+        return None
+    try:
+        # No image_loader: pytmx records the image paths and stops there
+        tmx_data = pytmx.TiledMap(path)
+    except Exception as e:
+        LOG.error("[TILED] Couldn't load %s: %s", path, e)
+        return None
+
+    collision_layer_name, trigger_layer_name = layers
+    data = {"collision": [], "triggers": []}
+    for layer in tmx_data.visible_layers:
+        if not isinstance(layer, pytmx.TiledObjectGroup):
+            continue
+        layer_name = layer.name.lower()
+        if layer_name == collision_layer_name:
+            target = data["collision"]
+        elif layer_name == trigger_layer_name:
+            target = data["triggers"]
+        else:
+            continue
+
+        for obj in layer:
+            name = getattr(obj, "name", "") or "Unnamed"
+            if hasattr(obj, "points") and obj.points:
+                target.append({"type": "polygon", "points": [[px, py] for px, py in obj.points], "name": name})
+            else:
+                target.append({"type": "rect", "rect": [obj.x, obj.y, obj.width, obj.height], "name": name})
+    return data
+
+
+def build_objects(data):
+    """Plain-data object groups -> (collision objects, trigger objects)."""
+    return [build_object(obj) for obj in data["collision"]], [build_object(obj) for obj in data["triggers"]]
+
+
+def build_object(obj):
+    if obj["type"] == "polygon":
+        points = [(px, py) for px, py in obj["points"]]
+        return {"type": "polygon", "points": points, "name": obj["name"], "bounds": bounds_of(points),
+                "shape": Polygon(points)}
+    rect = pygame.Rect(obj["rect"])
+    return {"type": "rect", "rect": rect, "name": obj["name"], "bounds": bounds_of([rect.topleft, rect.bottomright])}
+
+
+def bounds_of(points):
+    """
+    Integer Rect covering the closed box around points. One pixel wider than
+    a plain bounding rect, so a vertex on the right/bottom edge is still
+    inside it (the polygon tests count touching edges).
+    """
+    left = math.floor(min(x for x, _ in points))
+    top = math.floor(min(y for _, y in points))
+    right = math.floor(max(x for x, _ in points))
+    bottom = math.floor(max(y for _, y in points))
+    return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+
+def object_collides(rect, obj):
+    """Exact test of a box against one loaded object (touching edges don't count)."""
+    if obj["type"] == "rect":
+        return rect.colliderect(obj["rect"])
+    return obj["shape"].collide_rect(rect)
+
+
+# --- Broadphase ---
+
+class CollisionIndex:
+    """
+    Static broadphase over a map's collision objects: a SpatialHash of their
+    precomputed bounds, built once at map load. query_rect() hands back only
+    the objects whose bounds touch the box, so the exact rect/polygon test
+    runs on the one or two things near the player instead of the whole map.
+    """
+    def __init__(self, objects, cell_size=128):
+        self.objects = objects
+        self.grid = SpatialHash(cell_size)
+        for i, obj in enumerate(objects):
+            self.grid.insert(i, obj["bounds"]) # Dicts don't hash; file the index
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def query_indices(self, rect):
+        """Positions in self.objects of the candidates for rect, edges included."""
+        probe = pygame.Rect(rect.left, rect.top, rect.width + 1, rect.height + 1)
+        objects = self.objects
+        return [i for i in self.grid.query_rect(probe) if probe.colliderect(objects[i]["bounds"])]
+
+    def query_rect(self, rect):
+        """Candidates for rect, edges included. Callers still do the exact test."""
+        objects = self.objects
+        return [objects[i] for i in self.query_indices(rect)]
+
+
+# --- Sidecar ---
+
+def sidecar_path(path):
+    return path + SIDECAR_SUFFIX
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def read_sidecar(path, layers, stat):
+    try:
+        with open(sidecar_path(path)) as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if sidecar.get("version") != SIDECAR_VERSION or sidecar.get("layers") != list(layers):
+            return None
+        if (sidecar["mtime"], sidecar["size"]) != (stat.st_mtime, stat.st_size):
+            # Touched (checkout, copy) but maybe not edited: the hash decides
+            if sidecar["sha1"] != file_digest(path):
+                return None
+            write_sidecar(path, layers, stat, sidecar["objects"], sidecar["sha1"])
+        return sidecar["objects"]
+    except (KeyError, TypeError, ValueError, AttributeError):
+        # Truncated or hand-edited: a cache miss, the .tmx gets parsed again
+        return None
+
+
+def write_sidecar(path, layers, stat, data, digest=None):
+    sidecar = {
+        "version": SIDECAR_VERSION,
+        "layers": list(layers),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "sha1": digest or file_digest(path),
+        "objects": data,
+    }
+    try:
+        with open(sidecar_path(path), "w") as f:
+            json.dump(sidecar, f, separators=(",", ":"))
+    except OSError as e:
+        # Read-only install: parsing once per process still works
+        LOG.warning("[TILED] Couldn't write collision cache for %s: %s", path, e)
@@ -0,0 +1,74 @@
+import pygame
+from tiled_collision import CollisionIndex, build_object, object_collides
+
+# Slots of a registered (on_enter, on_stay, on_exit) handler
+ON_ENTER, ON_STAY, ON_EXIT = 0, 1, 2
+
+
+def rect_zone(name, rect):
+    """A trigger zone from a plain Rect, shaped like a loaded Tiled object (for maps without a .tmx)."""
+    return build_object({"type": "rect", "rect": list(pygame.Rect(rect)), "name": name})
+
+
+class TriggerSystem:
+    """
+    Trigger zones (Tiled trigger objects, or rect_zone()s), indexed once:
+    by lower-cased name, and spatially through a CollisionIndex. update(box)
+    runs the exact test only on zones near the box, and fires
+
+        on_enter(zone)   the update the box starts overlapping the zone
+        on_stay(zone)    every update it still does (entering included)
+        on_exit(zone)    the update it stops
+
+    so scenes react to changes instead of re-scanning every zone each frame.
+    Handlers are registered by zone name; several zones may share a name.
+    Events fire exits first, then enters, then stays, each in zone order.
+
+    Nothing here is Tiled-specific: a survival map can build zones with
+    rect_zone() and call update(player.rect) from its tick.
+    """
+    def __init__(self, zones, cell_size=128):
+        self.index = CollisionIndex(zones, cell_size)
+        self.zones = zones
+        self.by_name = {}      # lower-cased name -> [zone positions]
+        for i, zone in enumerate(zones):
+            self.by_name.setdefault(zone.get("name", "").lower(), []).append(i)
+        self.handlers = {}     # lower-cased name -> [(on_enter, on_stay, on_exit)]
+        self.inside = set()    # Positions of the zones the box overlapped at the last update
+
+    def __len__(self):
+        return len(self.zones)
+
+    def on(self, name, on_enter=None, on_exit=None, on_stay=None):
+        self.handlers.setdefault(name.lower(), []).append((on_enter, on_stay, on_exit))
+
+    def named(self, name):
+        return [self.zones[i] for i in self.by_name.get(name.lower(), ())]
+
+    def is_active(self, name):
+        """Is the box inside any zone called name (as of the last update)?"""
+        return any(i in self.inside for i in self.by_name.get(name.lower(), ()))
+
+    def update(self, box):
+        zones = self.zones
+        now = {i for i in self.index.query_indices(box) if object_collides(box, zones[i])}
+        exited = sorted(self.inside - now)
+        entered = sorted(now - self.inside)
+        self.inside = now
+
+        for i in exited:
+            self.fire(i, ON_EXIT)
+        for i in entered:
+            self.fire(i, ON_ENTER)
+        for i in sorted(now):
+            self.fire(i, ON_STAY)
+
+    def fire(self, i, event):
+        zone = self.zones[i]
+        for handler in self.handlers.get(zone.get("name", "").lower(), ()):
+            if handler[event] is not None:
+                handler[event](zone)
+
+    def reset(self):
+        """Forget which zones the box was in, without firing anything (e.g. after a teleport)."""
+        self.inside = set()